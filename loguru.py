@@ -11,17 +11,26 @@ _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s")
 _logging.addHandler(_handler)
 
 class _ShimLogger:
+    def _log(self, level, message, *args, **kwargs):
+        # loguru-style lazy formatting: "{}" placeholders are only rendered
+        # when the record is actually emitted.
+        if not _logging.isEnabledFor(level):
+            return
+        if args:
+            message = str(message).format(*args)
+        _logging.log(level, message, **kwargs)
+
     def info(self, *args, **kwargs):
-        _logging.info(*args, **kwargs)
+        self._log(logging.INFO, *args, **kwargs)
 
     def warning(self, *args, **kwargs):
-        _logging.warning(*args, **kwargs)
+        self._log(logging.WARNING, *args, **kwargs)
 
     def error(self, *args, **kwargs):
-        _logging.error(*args, **kwargs)
+        self._log(logging.ERROR, *args, **kwargs)
 
     def debug(self, *args, **kwargs):
-        _logging.debug(*args, **kwargs)
+        self._log(logging.DEBUG, *args, **kwargs)
     
     # Minimal compatibility with loguru API used in tests
     def remove(self, *args, **kwargs):
@@ -2,7 +2,8 @@
 Risk Assessment Agent - Identifies and mitigates research risks.
 """
 
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Optional
 
 from loguru import logger
 
@@ -27,6 +28,27 @@ class RiskAssessmentAgent(BaseAgent):
     - Generate risk matrix
     """
     
+    # Risk categories
+    RISK_CATEGORIES: ClassVar[Mapping[str, str]] = MappingProxyType({
+        "technical": "Methodology, tools, data collection, analysis",
+        "temporal": "Timeline, deadlines, scheduling",
+        "personal": "Skills, health, motivation, distractions",
+        "external": "Funding, access, approvals, ethics",
+        "data": "Quality, availability, privacy, security",
+    })
+    
+    # Risk severity levels
+    SEVERITY_LEVELS: ClassVar[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+        "low": MappingProxyType({"score": 1, "impact": "Minimal impact on research"}),
+        "medium": MappingProxyType({"score": 2, "impact": "Moderate impact, manageable"}),
+        "high": MappingProxyType({"score": 3, "impact": "Significant impact, requires immediate attention"}),
+    })
+    
+    # Flat severity -> score lookup used when assessing each risk
+    _SEVERITY_SCORE: ClassVar[Mapping[str, int]] = MappingProxyType(
+        {level: info["score"] for level, info in SEVERITY_LEVELS.items()}
+    )
+    
     def __init__(
         self,
         llm_provider: Optional[LLMProvider] = None,
@@ -45,22 +67,6 @@ class RiskAssessmentAgent(BaseAgent):
             state_manager=state_manager,
         )
         
-        # Risk categories
-        self.risk_categories = {
-            "technical": "Methodology, tools, data collection, analysis",
-            "temporal": "Timeline, deadlines, scheduling",
-            "personal": "Skills, health, motivation, distractions",
-            "external": "Funding, access, approvals, ethics",
-            "data": "Quality, availability, privacy, security",
-        }
-        
-        # Risk severity levels
-        self.severity_levels = {
-            "low": {"score": 1, "impact": "Minimal impact on research"},
-            "medium": {"score": 2, "impact": "Moderate impact, manageable"},
-            "high": {"score": 3, "impact": "Significant impact, requires immediate attention"},
-        }
-        
         logger.info("RiskAssessmentAgent initialized")
     
     async def execute(self, request: AgentRequest) -> AgentResponse:
@@ -84,19 +90,19 @@ class RiskAssessmentAgent(BaseAgent):
             
             # Identify risks by category
             technical_risks = await self._identify_technical_risks(methodology, topic)
-            logger.info(f"Identified {len(technical_risks)} technical risks")
+            logger.debug("Identified {} technical risks", len(technical_risks))
             
             temporal_risks = await self._identify_temporal_risks(methodology, topic)
-            logger.info(f"Identified {len(temporal_risks)} temporal risks")
+            logger.debug("Identified {} temporal risks", len(temporal_risks))
             
             personal_risks = await self._identify_personal_risks(methodology, topic)
-            logger.info(f"Identified {len(personal_risks)} personal risks")
+            logger.debug("Identified {} personal risks", len(personal_risks))
             
             external_risks = await self._identify_external_risks(methodology, topic)
-            logger.info(f"Identified {len(external_risks)} external risks")
+            logger.debug("Identified {} external risks", len(external_risks))
             
             data_risks = await self._identify_data_risks(methodology, topic)
-            logger.info(f"Identified {len(data_risks)} data risks")
+            logger.debug("Identified {} data risks", len(data_risks))
             
             # Combine all risks
             all_risks = {
@@ -109,23 +115,22 @@ class RiskAssessmentAgent(BaseAgent):
             
             # Assess severity for each risk
             assessed_risks = await self._assess_severity(all_risks)
-            logger.info("Risk severity assessed")
+            logger.debug("Risk severity assessed")
             
             # Develop mitigation strategies
             mitigation_strategies = await self._develop_mitigation(assessed_risks)
-            logger.info("Mitigation strategies developed")
+            logger.debug("Mitigation strategies developed")
             
             # Create contingency plans
             contingency_plans = await self._create_contingency_plans(assessed_risks)
-            logger.info("Contingency plans created")
+            logger.debug("Contingency plans created")
             
             # Generate risk matrix
             risk_matrix = self._generate_risk_matrix(assessed_risks)
-            logger.info("Risk matrix generated")
+            logger.debug("Risk matrix generated")
             
             # Calculate overall risk score
             risk_score = self._calculate_risk_score(assessed_risks)
-            logger.info(f"Overall risk score: {risk_score['score']}/10 ({risk_score['level']})")
             
             # Compile risk assessment report
             risk_assessment = {
@@ -145,7 +150,13 @@ class RiskAssessmentAgent(BaseAgent):
                 },
             }
             
-            logger.info("Risk assessment completed")
+            logger.info(
+                "Risk assessment done: {} risks ({} high), score={}/10 ({})",
+                risk_assessment["metadata"]["total_risks"],
+                risk_assessment["metadata"]["high_priority_risks"],
+                risk_score["score"],
+                risk_score["level"],
+            )
             
             return AgentResponse(
                 task_id=request.task_id,
@@ -440,7 +451,7 @@ risks that researchers commonly face."""
                     severity = "medium"
                 
                 risk["severity"] = severity
-                risk["severity_score"] = self.severity_levels[severity]["score"]
+                risk["severity_score"] = self._SEVERITY_SCORE[severity]
                 assessed[category].append(risk)
         
         return assessed
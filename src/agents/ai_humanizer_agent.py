@@ -22,15 +22,35 @@ Author: ResearchAI Platform
 Version: 1.0.0
 """
 
+import asyncio
+import bisect
+import itertools
 import random
 import re
 import hashlib
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from enum import Enum
 
 from loguru import logger
 
+try:
+    import ahocorasick  # pyahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 from src.agents.base_agent import BaseAgent
 from src.core.llm_provider import LLMProvider
 from src.core.state_manager import StateManager
@@ -45,6 +65,574 @@ class HumanizationIntensity(Enum):
     AGGRESSIVE = 0.98 # Maximum humanization
 
 
+# Citation formats protected from transformation, combined into one pattern
+_CITATION_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in (
+    r'\([A-Z][a-z]+(?:\s+(?:et\s+al\.?|&|and)\s+[A-Z][a-z]+)?,?\s*\d{4}[a-z]?\)',  # (Author, 2020)
+    r'\([A-Z][a-z]+\s+&\s+[A-Z][a-z]+,?\s*\d{4}\)',  # (Smith & Jones, 2020)
+    r'\[[0-9,\s-]+\]',  # [1], [1,2,3], [1-5]
+    r'\[\d+\]',  # [1]
+)))
+
+# Private-use character that stands in for each protected citation. No
+# transform pattern matches it and it is not a word character, so masked
+# text reads like a citation in parentheses to every pass.
+_CITATION_MASK = "\ue000"
+
+# Section titles (matched anywhere in the lowercased title) left untouched
+_SKIP_SECTION_RE = re.compile('|'.join(re.escape(title) for title in (
+    "references", "bibliography", "citations", "table of contents",
+    "list of tables", "list of figures", "list of abbreviations",
+    "appendix", "appendices", "acknowledgements", "dedication",
+    "abstract",  # Keep abstract more formal
+)))
+
+# Sentence boundary shared by every sentence-level transform
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Cue words (matched as substrings of the lowercased sentence) that pick
+# the kind of discourse marker to add, checked in this order
+_CONTRASTIVE_CUES_RE = re.compile('however|but|although|despite')
+_CAUSAL_CUES_RE = re.compile('because|therefore|result|leads')
+_EXAMPLE_CUES_RE = re.compile('example|instance|such as|like')
+
+# Where an over-long sentence may be split, in order of preference
+_SPLIT_POINTS = (', and ', ', but ', ', which ', '; ', ' - ')
+
+# Humanized sections kept per agent, keyed by content digest
+_HUMANIZE_CACHE_SIZE = 512
+
+# Below this many samples a Python loop beats the NumPy call overhead
+_BULK_DRAW_THRESHOLD = 32
+
+# Above this many characters (~5000 words) the AI score is estimated from a
+# sample: the text is cut into _SCORE_CHUNKS pieces and _SCORE_SAMPLED_CHUNKS
+# of them are scanned
+_SCORE_SAMPLE_CHARS = 30000
+_SCORE_CHUNKS = 8
+_SCORE_SAMPLED_CHUNKS = 3
+
+
+# Replacement tables, shared by every AIHumanizerAgent instance
+
+# AI-typical words → Human alternatives
+_VOCAB_REPLACEMENTS = {
+    # Overused transitions (AI loves these)
+    "furthermore": ["besides", "what's more", "adding to this", "on top of that", "also"],
+    "moreover": ["besides this", "equally important", "not only that", "plus"],
+    "additionally": ["also", "as well", "on top of this", "plus", "too"],
+    "consequently": ["as a result", "so", "thus", "hence", "therefore"],
+    "subsequently": ["afterwards", "later", "then", "following this", "next"],
+    "nevertheless": ["even so", "still", "yet", "regardless", "all the same"],
+    "nonetheless": ["even so", "however", "still", "yet", "despite this"],
+    "therefore": ["so", "thus", "hence", "as a result", "for this reason"],
+    "thus": ["so", "hence", "therefore", "in this way", "accordingly"],
+    "hence": ["so", "therefore", "thus", "for this reason", "as a result"],
+    "however": ["but", "yet", "still", "on the other hand", "that said", "although"],
+
+    # Overused verbs
+    "utilize": ["use", "employ", "apply", "draw on", "work with"],
+    "implement": ["put in place", "carry out", "execute", "apply", "introduce", "adopt"],
+    "demonstrate": ["show", "reveal", "illustrate", "display", "indicate", "highlight"],
+    "investigate": ["examine", "explore", "look into", "study", "probe", "research"],
+    "analyze": ["examine", "study", "look at", "assess", "evaluate", "review"],
+    "enhance": ["improve", "boost", "strengthen", "increase", "better", "upgrade"],
+    "facilitate": ["help", "enable", "assist", "support", "make easier", "aid"],
+    "establish": ["set up", "create", "form", "found", "determine", "build"],
+    "indicate": ["show", "suggest", "point to", "reveal", "signal", "imply"],
+    "exhibit": ["show", "display", "demonstrate", "present", "reveal"],
+    "elucidate": ["explain", "clarify", "illuminate", "shed light on", "make clear"],
+    "ascertain": ["find out", "determine", "establish", "discover", "learn"],
+    "constitute": ["make up", "form", "represent", "compose", "be"],
+    "necessitate": ["require", "need", "call for", "demand", "make necessary"],
+    "encompass": ["include", "cover", "contain", "involve", "take in"],
+
+    # Overused adverbs
+    "significantly": ["notably", "considerably", "substantially", "markedly", "greatly", "much"],
+    "particularly": ["especially", "specifically", "notably", "chiefly", "mainly"],
+    "essentially": ["basically", "fundamentally", "primarily", "mainly", "at its core"],
+    "predominantly": ["mainly", "mostly", "largely", "primarily", "chiefly"],
+    "comprehensively": ["thoroughly", "fully", "completely", "extensively", "in depth"],
+    "inherently": ["naturally", "by nature", "fundamentally", "essentially", "intrinsically"],
+    "ultimately": ["in the end", "finally", "eventually", "at last", "lastly"],
+    "fundamentally": ["basically", "at heart", "essentially", "at its core", "primarily"],
+    "intrinsically": ["inherently", "naturally", "essentially", "by nature"],
+    "systematically": ["methodically", "in order", "step by step", "regularly"],
+
+    # Overused adjectives
+    "crucial": ["key", "vital", "essential", "critical", "important", "major"],
+    "significant": ["important", "notable", "meaningful", "considerable", "major"],
+    "substantial": ["considerable", "significant", "large", "major", "sizeable", "big"],
+    "comprehensive": ["thorough", "complete", "full", "extensive", "wide-ranging"],
+    "robust": ["strong", "solid", "sturdy", "reliable", "sound", "firm"],
+    "innovative": ["new", "novel", "creative", "original", "fresh", "pioneering"],
+    "optimal": ["best", "ideal", "most suitable", "perfect", "top"],
+    "pivotal": ["key", "crucial", "central", "critical", "vital", "main"],
+    "paramount": ["supreme", "chief", "primary", "main", "foremost", "top"],
+    "multifaceted": ["complex", "varied", "diverse", "many-sided", "wide-ranging"],
+    "pertinent": ["relevant", "related", "applicable", "fitting", "appropriate"],
+    "profound": ["deep", "significant", "far-reaching", "major", "intense"],
+    "salient": ["key", "main", "notable", "important", "striking"],
+    "unprecedented": ["unmatched", "new", "unique", "first-time", "novel"],
+    "exemplary": ["outstanding", "excellent", "model", "ideal", "superb"],
+
+    # Overused nouns
+    "methodology": ["method", "approach", "technique", "procedure", "way", "process"],
+    "framework": ["structure", "system", "model", "outline", "foundation", "basis"],
+    "paradigm": ["model", "pattern", "example", "standard", "framework", "approach"],
+    "implications": ["effects", "consequences", "outcomes", "results", "impact", "meaning"],
+    "perspective": ["view", "viewpoint", "standpoint", "angle", "outlook", "position"],
+    "phenomenon": ["occurrence", "event", "happening", "situation", "instance", "case"],
+    "dynamics": ["interactions", "forces", "processes", "workings", "mechanics", "patterns"],
+    "parameters": ["limits", "boundaries", "factors", "variables", "settings", "conditions"],
+    "discourse": ["discussion", "debate", "dialogue", "conversation", "talk"],
+    "trajectory": ["path", "course", "direction", "trend", "route"],
+    "paradigm shift": ["major change", "fundamental shift", "transformation", "revolution"],
+    "synergy": ["cooperation", "teamwork", "collaboration", "combined effect"],
+    # Sentence starters that sound AI-generated
+    "this study": ["this research", "this work", "the present study", "our research"],
+    "this research": ["this work", "the current study", "our investigation"],
+    "the study": ["the research", "the work", "the investigation"],
+}
+
+# AI-typical phrases → Human alternatives
+_PHRASE_REPLACEMENTS = {
+    "it is important to note": ["notably", "worth mentioning", "keep in mind that", "it's worth noting"],
+    "it is worth mentioning": ["notably", "interestingly", "it bears noting", "worth pointing out"],
+    "it is evident that": ["clearly", "obviously", "it's clear that", "as we can see"],
+    "it can be observed that": ["we can see that", "looking at this", "this shows", "notably"],
+    "it should be noted that": ["note that", "keep in mind", "importantly", "notably"],
+    "it is crucial to": ["it's key to", "we must", "it's vital to", "importantly"],
+    "it is essential to": ["we need to", "it's important to", "we must", "it's vital to"],
+    "it is imperative that": ["we must", "it's crucial that", "it's necessary that"],
+    "it is important to note that": ["notably", "worth noting", "importantly", "keep in mind"],
+    "plays a crucial role": ["is vital", "is essential", "matters greatly", "is key", "is important"],
+    "plays a significant role": ["is important", "matters", "is key", "is central"],
+    "in the context of": ["regarding", "when it comes to", "concerning", "about", "in terms of"],
+    "in terms of": ["regarding", "concerning", "about", "when it comes to", "for"],
+    "a wide range of": ["many", "various", "numerous", "diverse", "a variety of", "lots of"],
+    "the fact that": ["that", "how", "the way"],
+    "due to the fact that": ["because", "since", "as", "given that", "seeing that"],
+    "in order to": ["to", "so as to", "for"],
+    "as a result of": ["because of", "due to", "owing to", "following", "from"],
+    "with regard to": ["about", "concerning", "regarding", "on", "as for"],
+    "in light of": ["considering", "given", "because of", "in view of", "seeing"],
+    "on the other hand": ["but", "however", "yet", "alternatively", "conversely"],
+    "in this regard": ["here", "on this point", "in this respect", "about this"],
+    "to a large extent": ["largely", "mostly", "mainly", "in large part", "for the most part"],
+    "in the realm of": ["in", "within", "in the field of", "in the area of"],
+    "serves as a": ["is a", "acts as a", "works as a", "functions as a"],
+    "is characterized by": ["features", "has", "shows", "displays", "exhibits"],
+    "with respect to": ["about", "regarding", "concerning", "for", "on"],
+    "a plethora of": ["many", "lots of", "numerous", "plenty of", "a wealth of"],
+    "a myriad of": ["many", "countless", "numerous", "lots of", "a host of"],
+    "in conjunction with": ["with", "along with", "together with", "combined with"],
+    "prior to": ["before", "ahead of", "preceding", "earlier than"],
+    "subsequent to": ["after", "following", "later than", "post"],
+    "this study demonstrates": ["this work shows", "our research reveals", "we found that", "the findings show"],
+    "this research demonstrates": ["this work shows", "our findings reveal", "we found", "evidence shows"],
+    "the implementation of": ["using", "applying", "the use of", "adopting"],
+    "utilized in": ["used in", "applied in", "employed in"],
+    "provides substantial": ["offers significant", "gives considerable", "yields major"],
+    "future endeavors": ["future work", "future research", "further studies"],
+    "future research endeavors": ["future studies", "further research", "upcoming work"],
+}
+
+# Sentence starters that sound AI-generated
+_AI_STARTERS = (
+    "It is evident that",
+    "It can be observed that",
+    "It is noteworthy that",
+    "It is essential to",
+    "It is imperative that",
+    "It should be noted that",
+    "It is important to highlight",
+    "It is crucial to understand",
+    "It is widely recognized that",
+    "It has been demonstrated that",
+    "This paper aims to",
+    "This study seeks to",
+    "The primary objective is to",
+    "The purpose of this study is to",
+    "The current research endeavors to",
+)
+
+# Human-like sentence starters
+_HUMAN_STARTERS = (
+    "Clearly,",
+    "As we can see,",
+    "Interestingly,",
+    "What stands out is that",
+    "Looking at this more closely,",
+    "The evidence suggests that",
+    "Based on the findings,",
+    "One key insight is that",
+    "A closer look reveals that",
+    "The data points to",
+    "Research shows that",
+    "Studies indicate that",
+    "Evidence supports the idea that",
+    "Findings suggest that",
+    "The results confirm that",
+    "What emerges from this is",
+    "We can see that",
+    "This points to",
+    "Looking at the evidence,",
+    "From this, we learn that",
+)
+
+# Additive markers (adding information)
+_ADDITIVE_MARKERS = (
+    "Also,", "Besides,", "What's more,", "In addition,", "Plus,",
+    "On top of this,", "Adding to this,", "Further,", "As well as this,",
+)
+
+# Contrastive markers (showing contrast)
+_CONTRASTIVE_MARKERS = (
+    "But", "Yet", "However,", "Still,", "Although", "Even so,",
+    "That said,", "On the flip side,", "At the same time,",
+)
+
+# Causal markers (cause and effect)
+_CAUSAL_MARKERS = (
+    "So", "Thus", "Hence", "As a result,", "Because of this,",
+    "This leads to", "This means that", "For this reason,",
+)
+
+# Temporal markers (time sequence)
+_TEMPORAL_MARKERS = (
+    "First,", "Then,", "Next,", "After this,", "Finally,",
+    "Meanwhile,", "At this point,", "Following this,", "Later,",
+)
+
+# Exemplification markers
+_EXAMPLE_MARKERS = (
+    "For example,", "For instance,", "Such as", "Like",
+    "To illustrate,", "Consider", "Take", "As seen in",
+)
+
+# Every marker as a sentence prefix, for a single startswith() check
+_MARKER_PREFIXES = tuple(dict.fromkeys(
+    marker.strip()
+    for marker in _ADDITIVE_MARKERS + _CONTRASTIVE_MARKERS + _CAUSAL_MARKERS
+    + _TEMPORAL_MARKERS + _EXAMPLE_MARKERS
+))
+
+# Hedging verbs (reduce certainty)
+_HEDGING_VERBS = (
+    "seems to", "appears to", "tends to", "might", "may",
+    "could", "suggests", "indicates", "points to", "implies",
+)
+
+# Hedging adverbs
+_HEDGING_ADVERBS = (
+    "perhaps", "possibly", "probably", "likely", "seemingly",
+    "apparently", "arguably", "potentially", "conceivably",
+)
+
+# Hedging phrases
+_HEDGING_PHRASES = (
+    "it seems that", "it appears that", "this suggests that",
+    "evidence points to", "this may indicate", "one could argue",
+    "it is possible that", "there is reason to believe",
+    "the data suggests", "findings indicate",
+)
+
+# Personal voice insertions (sparingly used)
+_PERSONAL_TOUCHES = (
+    "we observe", "we can see", "we note", "we find",
+    "our analysis shows", "our findings suggest",
+    "looking at the data, we", "examining this further, we",
+)
+
+# Absolute statements → hedged versions (all rewrite rows match whole words)
+_ABSOLUTE_STATEMENTS = (
+    ('proves that', ['suggests that', 'indicates that', 'points to the fact that']),
+    ('clearly shows', ['seems to show', 'appears to indicate', 'suggests']),
+    ('definitely', ['likely', 'probably', 'seemingly']),
+    ('certainly', ['probably', 'likely', 'apparently']),
+    ('obviously', ['it seems', 'apparently', 'evidently']),
+    ('undoubtedly', ['likely', 'probably', 'in all likelihood']),
+    ('will be', ['may be', 'could be', 'is likely to be']),
+    ('must be', ['appears to be', 'seems to be', 'is likely']),
+    ('is essential', ['is important', 'matters', 'is key']),
+    ('is crucial', ['is important', 'is key', 'matters']),
+    ('is critical', ['is important', 'is key', 'matters greatly']),
+    ('is vital', ['is important', 'is key', 'matters']),
+    ('is necessary', ['is needed', 'is required', 'is important']),
+)
+
+# Impersonal constructions → personal voice (used sparingly)
+_IMPERSONAL_CONSTRUCTIONS = (
+    ('It is observed that', ['We observe that', 'We can see that', 'We note that']),
+    ('It was found that', ['We found that', 'Our analysis shows that', 'We discovered that']),
+    ('It can be seen that', ['We can see that', 'Looking at this, we see', 'We observe']),
+    ('One can observe', ['We can observe', 'We see', 'We note']),
+)
+
+
+def _cycler(options: Sequence[Any], rng: random.Random) -> Iterator[Any]:
+    """Endless cycle over ``options`` in a random order fixed when it is built."""
+    return itertools.cycle(rng.sample(options, len(options)))
+
+
+def _rewrite_first(
+    matcher: "_LiteralMatcher",
+    replacements: List[Iterator[str]],
+    active: List[bool],
+    sentences: List[str],
+) -> int:
+    """
+    Rewrite the first match of each active literal of ``matcher`` in one scan.
+    
+    Literal ``i`` is replaced with ``next(replacements[i])`` when
+    ``active[i]`` is set. The sentences are scanned as one newline-joined
+    text (no literal spans a line break), stopping once every active
+    literal has been used; sentences are updated in place. Returns the
+    number of rewrites.
+    """
+    pending = {index for index, on in enumerate(active) if on}
+    # Offset of each sentence in the joined text, to map matches back
+    offsets = list(itertools.accumulate((len(sentence) + 1 for sentence in sentences), initial=0))
+    edits = {}  # sentence index -> [(start, end, replacement)] within it
+    for start, end, key_id in matcher.finditer('\n'.join(sentences)):
+        if key_id not in pending:
+            continue
+        pending.discard(key_id)
+        index = bisect.bisect_right(offsets, start) - 1
+        base = offsets[index]
+        edits.setdefault(index, []).append((start - base, end - base, next(replacements[key_id])))
+        if not pending:
+            break
+    
+    for index, spans in edits.items():
+        sentence = sentences[index]
+        parts = []
+        position = 0
+        for start, end, replacement in spans:
+            parts.append(sentence[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(sentence[position:])
+        sentences[index] = ''.join(parts)
+    return sum(len(spans) for spans in edits.values())
+
+
+def _with_capitalized(options: List[str]) -> List[Tuple[str, str]]:
+    """Pair each option with its capitalized form, for sentence-initial matches."""
+    return [(option, option.capitalize()) for option in options]
+
+
+def _at_sentence_start(text: str, index: int) -> bool:
+    """Whether ``index`` opens a sentence: start of text, or after ``.``/``!``/``?`` and whitespace."""
+    before = index
+    while before > 0 and text[before - 1].isspace():
+        before -= 1
+    return before == 0 or (before < index and text[before - 1] in '.!?')
+
+
+class _LiteralMatcher:
+    """
+    Leftmost-longest, case-insensitive matcher over a fixed set of literals.
+    
+    Scans with a pyahocorasick automaton when the package is installed (one
+    linear pass no matter how many literals there are) and falls back to the
+    equivalent compiled regex alternation otherwise. Matches are reported by
+    the literal's position in ``literals``, so callers can keep per-literal
+    data in a parallel list. Literals listed in ``bounded`` only match as
+    whole words.
+    """
+    
+    def __init__(self, literals: Sequence[str], bounded: Iterable[str] = ()):
+        keys = sorted(
+            ((literal.lower(), key_id) for key_id, literal in enumerate(literals)),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        bounded_keys = {literal.lower() for literal in bounded}
+        
+        # One group per literal; match.lastindex maps back to its id. When
+        # every literal is bounded the boundaries are shared outside the
+        # groups, which lets `re` skip ahead much faster.
+        if all(key in bounded_keys for key, _ in keys):
+            body = r'\b(?:' + '|'.join('(' + re.escape(key) + ')' for key, _ in keys) + r')\b'
+        else:
+            body = '|'.join(
+                r'\b(' + re.escape(key) + r')\b' if key in bounded_keys else '(' + re.escape(key) + ')'
+                for key, _ in keys
+            )
+        self._body = body
+        self._group_ids = [None] + [key_id for _, key_id in keys]
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and keys:
+            automaton = ahocorasick.Automaton()
+            for key, key_id in keys:
+                automaton.add_word(key, (len(key), key in bounded_keys, key_id))
+            automaton.make_automaton()
+            self._automaton = automaton
+    
+    # The regexes are only needed without pyahocorasick (or for odd input),
+    # so they are compiled on first use rather than up front.
+    @cached_property
+    def pattern(self) -> "re.Pattern[str]":
+        """Case-insensitive alternation, for text whose length changes when lowercased."""
+        return re.compile(self._body, re.IGNORECASE)
+    
+    @cached_property
+    def _lowered_pattern(self) -> "re.Pattern[str]":
+        """Case-sensitive alternation; keys are lowercase, so scan a lowercased copy."""
+        return re.compile(self._body)
+    
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(start, end, literal_id)`` for non-overlapping matches, left to right."""
+        lowered = text.lower()
+        # Lowercasing can change the length of some non-ASCII text; offsets
+        # would no longer line up, so match those inputs case-insensitively.
+        if len(lowered) != len(text):
+            for match in self.pattern.finditer(text):
+                yield match.start(), match.end(), self._group_ids[match.lastindex]
+            return
+        
+        if self._automaton is None:
+            for match in self._lowered_pattern.finditer(lowered):
+                yield match.start(), match.end(), self._group_ids[match.lastindex]
+            return
+        
+        # Pad with spaces so every match has a neighbour on both sides and the
+        # whole-word test needs no bounds checks; offsets shift back by one.
+        padded = f" {lowered} "
+        candidates = []
+        matches = self._automaton.iter(padded, 1, len(padded) - 1)
+        for last_index, (length, whole_word, key_id) in matches:
+            end = last_index + 1
+            start = end - length
+            if whole_word:
+                before = padded[start - 1]
+                after = padded[end]
+                if before.isalnum() or before == "_" or after.isalnum() or after == "_":
+                    continue
+            candidates.append((start - 1, -length, key_id))
+        
+        # Same selection the regex alternation makes: leftmost first, then longest
+        candidates.sort()
+        position = 0
+        for start, neg_length, key_id in candidates:
+            if start >= position:
+                position = start - neg_length
+                yield start, position, key_id
+
+
+class _WeightedLiteralCounter:
+    """
+    Weighted count of fixed literals, each counted the way ``re.findall`` would.
+    
+    Case-insensitive. One Aho-Corasick pass over the text when pyahocorasick
+    is installed, one compiled pattern per literal otherwise. Entries are
+    ``(literal, weight, whole_word)``; a literal listed twice counts twice.
+    """
+    
+    def __init__(self, entries: Iterable[Tuple[str, int, bool]]):
+        self._entries = list(entries)
+        
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._entries:
+            merged: Dict[Tuple[str, bool], int] = {}
+            for literal, weight, whole_word in self._entries:
+                key = (literal.lower(), whole_word)
+                merged[key] = merged.get(key, 0) + weight
+            automaton = ahocorasick.Automaton()
+            for key_id, ((key, whole_word), weight) in enumerate(merged.items()):
+                automaton.add_word(key, (len(key), whole_word, key_id, weight))
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._key_count = len(merged)
+    
+    @cached_property
+    def _patterns(self) -> List[Tuple["re.Pattern[str]", int]]:
+        """Per-literal fallback patterns, compiled on first use."""
+        patterns = []
+        for literal, weight, whole_word in self._entries:
+            body = re.escape(literal)
+            if whole_word:
+                body = r'\b' + body + r'\b'
+            patterns.append((re.compile(body, re.IGNORECASE), weight))
+        return patterns
+    
+    def count(self, text: str) -> int:
+        """Sum of weight x non-overlapping occurrences over all literals."""
+        lowered = text.lower()
+        if self._automaton is None or len(lowered) != len(text):
+            return sum(len(pattern.findall(text)) * weight for pattern, weight in self._patterns)
+        
+        # Same padding trick as _LiteralMatcher.finditer
+        padded = f" {lowered} "
+        # Occurrences of one literal must not overlap, as with findall;
+        # different literals may.
+        last_end = [0] * self._key_count
+        total = 0
+        matches = self._automaton.iter(padded, 1, len(padded) - 1)
+        for last_index, (length, whole_word, key_id, weight) in matches:
+            end = last_index + 1
+            start = end - length
+            if whole_word:
+                before = padded[start - 1]
+                after = padded[end]
+                if before.isalnum() or before == "_" or after.isalnum() or after == "_":
+                    continue
+            if start < last_end[key_id]:
+                continue
+            last_end[key_id] = end
+            total += weight
+        return total
+
+
+class _Patterns(NamedTuple):
+    """Compiled matchers built once per process from the tables above."""
+    lexical: _LiteralMatcher
+    lexical_entries: List[Tuple[str, List[str]]]
+    absolute: _LiteralMatcher
+    personal: _LiteralMatcher
+    score: _WeightedLiteralCounter
+
+
+def _rewrite_matcher(rows: Sequence[Tuple[str, List[str]]]) -> _LiteralMatcher:
+    """Whole-word matcher over the phrases of a rewrite table, in row order."""
+    phrases = [phrase for phrase, _ in rows]
+    return _LiteralMatcher(phrases, bounded=phrases)
+
+
+@lru_cache(maxsize=1)
+def _build_patterns() -> _Patterns:
+    """Compile the shared matchers on first use; every agent reuses the result."""
+    # Vocabulary, phrases and starters share one matcher (an Aho-Corasick
+    # trie when available) so a section is scanned once. Longest keys win
+    # over their prefixes, vocabulary only hits whole words, and a phrase
+    # that doubles as a starter keeps its phrase alternatives, as it did
+    # when phrases ran before starters. Entries sit at the key's matcher id.
+    entries = {}
+    for starter in _AI_STARTERS:
+        entries[starter.lower()] = ("starter", _HUMAN_STARTERS)
+    for phrase, alternatives in _PHRASE_REPLACEMENTS.items():
+        entries[phrase.lower()] = ("phrase", alternatives)
+    for word, alternatives in _VOCAB_REPLACEMENTS.items():
+        entries[word.lower()] = ("vocab", alternatives)
+    
+    return _Patterns(
+        lexical=_LiteralMatcher(list(entries), bounded=_VOCAB_REPLACEMENTS),
+        lexical_entries=list(entries.values()),
+        # One whole-word matcher per rewrite table; literal i is table row i
+        absolute=_rewrite_matcher(_ABSOLUTE_STATEMENTS),
+        personal=_rewrite_matcher(_IMPERSONAL_CONSTRUCTIONS),
+        # AI-score signals with their weights: vocabulary 1 (whole words),
+        # phrases 2, sentence starters 3
+        score=_WeightedLiteralCounter(
+            [(word, 1, True) for word in _VOCAB_REPLACEMENTS]
+            + [(phrase, 2, False) for phrase in _PHRASE_REPLACEMENTS]
+            + [(starter, 3, False) for starter in _AI_STARTERS]
+        ),
+    )
+
+
 @dataclass
 class HumanizationMetrics:
     """Metrics from humanization process."""
@@ -81,6 +669,7 @@ class AIHumanizerAgent(BaseAgent):
         intensity: HumanizationIntensity = HumanizationIntensity.MODERATE,
         target_ai_score: float = 10.0,  # Target <10% AI detection
         preserve_citations: bool = True,
+        seed: Optional[int] = None,
     ):
         """
         Initialize AI Humanizer Agent.
@@ -91,6 +680,9 @@ class AIHumanizerAgent(BaseAgent):
             intensity: How aggressively to humanize
             target_ai_score: Target AI detection score (%)
             preserve_citations: Whether to protect citation text
+            seed: Seed for the agent's random generators. A seeded agent
+                reproduces its output for the same requests made one at a
+                time; requests overlapping on one agent share its generators.
         """
         super().__init__(
             agent_name="ai_humanizer_agent",
@@ -99,12 +691,23 @@ class AIHumanizerAgent(BaseAgent):
         )
         
         self.intensity = intensity
+        # Fixed for the agent's lifetime; the transforms read this plain float
+        # instead of going through the enum on every section.
+        self._intensity_val = float(intensity.value)
+        
+        # Per-agent generators: seedable, and not shared with other users of
+        # the global `random` state
+        self._rng = random.Random(seed)
+        self._np_rng = np.random.default_rng(seed) if NUMPY_AVAILABLE else None
+        
+        # Bounded LRU of humanized sections; execute() fills it from worker threads
+        self._cache: "OrderedDict[str, Tuple[str, HumanizationMetrics]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.target_ai_score = target_ai_score
         self.preserve_citations = preserve_citations
         
         # Initialize transformation components
         self._init_vocabulary_maps()
-        self._init_sentence_patterns()
         self._init_discourse_markers()
         self._init_hedging_phrases()
         
@@ -134,249 +737,31 @@ class AIHumanizerAgent(BaseAgent):
         return has_sections or has_content
     
     def _init_vocabulary_maps(self):
-        """Initialize vocabulary replacement maps."""
-        
-        # AI-typical words → Human alternatives
-        self.vocab_replacements = {
-            # Overused transitions (AI loves these)
-            "furthermore": ["besides", "what's more", "adding to this", "on top of that", "also"],
-            "moreover": ["besides this", "equally important", "not only that", "plus"],
-            "additionally": ["also", "as well", "on top of this", "plus", "too"],
-            "consequently": ["as a result", "so", "thus", "hence", "therefore"],
-            "subsequently": ["afterwards", "later", "then", "following this", "next"],
-            "nevertheless": ["even so", "still", "yet", "regardless", "all the same"],
-            "nonetheless": ["even so", "however", "still", "yet", "despite this"],
-            "therefore": ["so", "thus", "hence", "as a result", "for this reason"],
-            "thus": ["so", "hence", "therefore", "in this way", "accordingly"],
-            "hence": ["so", "therefore", "thus", "for this reason", "as a result"],
-            "however": ["but", "yet", "still", "on the other hand", "that said", "although"],
-            
-            # Overused verbs
-            "utilize": ["use", "employ", "apply", "draw on", "work with"],
-            "implement": ["put in place", "carry out", "execute", "apply", "introduce", "adopt"],
-            "demonstrate": ["show", "reveal", "illustrate", "display", "indicate", "highlight"],
-            "investigate": ["examine", "explore", "look into", "study", "probe", "research"],
-            "analyze": ["examine", "study", "look at", "assess", "evaluate", "review"],
-            "enhance": ["improve", "boost", "strengthen", "increase", "better", "upgrade"],
-            "facilitate": ["help", "enable", "assist", "support", "make easier", "aid"],
-            "establish": ["set up", "create", "form", "found", "determine", "build"],
-            "indicate": ["show", "suggest", "point to", "reveal", "signal", "imply"],
-            "exhibit": ["show", "display", "demonstrate", "present", "reveal"],
-            "elucidate": ["explain", "clarify", "illuminate", "shed light on", "make clear"],
-            "ascertain": ["find out", "determine", "establish", "discover", "learn"],
-            "constitute": ["make up", "form", "represent", "compose", "be"],
-            "necessitate": ["require", "need", "call for", "demand", "make necessary"],
-            "encompass": ["include", "cover", "contain", "involve", "take in"],
-            
-            # Overused adverbs
-            "significantly": ["notably", "considerably", "substantially", "markedly", "greatly", "much"],
-            "particularly": ["especially", "specifically", "notably", "chiefly", "mainly"],
-            "essentially": ["basically", "fundamentally", "primarily", "mainly", "at its core"],
-            "predominantly": ["mainly", "mostly", "largely", "primarily", "chiefly"],
-            "comprehensively": ["thoroughly", "fully", "completely", "extensively", "in depth"],
-            "inherently": ["naturally", "by nature", "fundamentally", "essentially", "intrinsically"],
-            "ultimately": ["in the end", "finally", "eventually", "at last", "lastly"],
-            "fundamentally": ["basically", "at heart", "essentially", "at its core", "primarily"],
-            "intrinsically": ["inherently", "naturally", "essentially", "by nature"],
-            "systematically": ["methodically", "in order", "step by step", "regularly"],
-            
-            # Overused adjectives
-            "crucial": ["key", "vital", "essential", "critical", "important", "major"],
-            "significant": ["important", "notable", "meaningful", "considerable", "major"],
-            "substantial": ["considerable", "significant", "large", "major", "sizeable", "big"],
-            "comprehensive": ["thorough", "complete", "full", "extensive", "wide-ranging"],
-            "robust": ["strong", "solid", "sturdy", "reliable", "sound", "firm"],
-            "innovative": ["new", "novel", "creative", "original", "fresh", "pioneering"],
-            "optimal": ["best", "ideal", "most suitable", "perfect", "top"],
-            "pivotal": ["key", "crucial", "central", "critical", "vital", "main"],
-            "paramount": ["supreme", "chief", "primary", "main", "foremost", "top"],
-            "multifaceted": ["complex", "varied", "diverse", "many-sided", "wide-ranging"],
-            "pertinent": ["relevant", "related", "applicable", "fitting", "appropriate"],
-            "profound": ["deep", "significant", "far-reaching", "major", "intense"],
-            "salient": ["key", "main", "notable", "important", "striking"],
-            "unprecedented": ["unmatched", "new", "unique", "first-time", "novel"],
-            "exemplary": ["outstanding", "excellent", "model", "ideal", "superb"],
-            
-            # Overused nouns
-            "methodology": ["method", "approach", "technique", "procedure", "way", "process"],
-            "framework": ["structure", "system", "model", "outline", "foundation", "basis"],
-            "paradigm": ["model", "pattern", "example", "standard", "framework", "approach"],
-            "implications": ["effects", "consequences", "outcomes", "results", "impact", "meaning"],
-            "perspective": ["view", "viewpoint", "standpoint", "angle", "outlook", "position"],
-            "phenomenon": ["occurrence", "event", "happening", "situation", "instance", "case"],
-            "dynamics": ["interactions", "forces", "processes", "workings", "mechanics", "patterns"],
-            "parameters": ["limits", "boundaries", "factors", "variables", "settings", "conditions"],
-            "discourse": ["discussion", "debate", "dialogue", "conversation", "talk"],
-            "trajectory": ["path", "course", "direction", "trend", "route"],
-            "paradigm shift": ["major change", "fundamental shift", "transformation", "revolution"],
-            "synergy": ["cooperation", "teamwork", "collaboration", "combined effect"],
-            # Sentence starters that sound AI-generated
-            "this study": ["this research", "this work", "the present study", "our research"],
-            "this research": ["this work", "the current study", "our investigation"],
-            "the study": ["the research", "the work", "the investigation"],
-        }
-        
-        # AI-typical phrases → Human alternatives
-        self.phrase_replacements = {
-            "it is important to note": ["notably", "worth mentioning", "keep in mind that", "it's worth noting"],
-            "it is worth mentioning": ["notably", "interestingly", "it bears noting", "worth pointing out"],
-            "it is evident that": ["clearly", "obviously", "it's clear that", "as we can see"],
-            "it can be observed that": ["we can see that", "looking at this", "this shows", "notably"],
-            "it should be noted that": ["note that", "keep in mind", "importantly", "notably"],
-            "it is crucial to": ["it's key to", "we must", "it's vital to", "importantly"],
-            "it is essential to": ["we need to", "it's important to", "we must", "it's vital to"],
-            "it is imperative that": ["we must", "it's crucial that", "it's necessary that"],
-            "it is important to note that": ["notably", "worth noting", "importantly", "keep in mind"],
-            "plays a crucial role": ["is vital", "is essential", "matters greatly", "is key", "is important"],
-            "plays a significant role": ["is important", "matters", "is key", "is central"],
-            "in the context of": ["regarding", "when it comes to", "concerning", "about", "in terms of"],
-            "in terms of": ["regarding", "concerning", "about", "when it comes to", "for"],
-            "a wide range of": ["many", "various", "numerous", "diverse", "a variety of", "lots of"],
-            "the fact that": ["that", "how", "the way"],
-            "due to the fact that": ["because", "since", "as", "given that", "seeing that"],
-            "in order to": ["to", "so as to", "for"],
-            "as a result of": ["because of", "due to", "owing to", "following", "from"],
-            "with regard to": ["about", "concerning", "regarding", "on", "as for"],
-            "in light of": ["considering", "given", "because of", "in view of", "seeing"],
-            "on the other hand": ["but", "however", "yet", "alternatively", "conversely"],
-            "in this regard": ["here", "on this point", "in this respect", "about this"],
-            "to a large extent": ["largely", "mostly", "mainly", "in large part", "for the most part"],
-            "in the realm of": ["in", "within", "in the field of", "in the area of"],
-            "serves as a": ["is a", "acts as a", "works as a", "functions as a"],
-            "is characterized by": ["features", "has", "shows", "displays", "exhibits"],
-            "with respect to": ["about", "regarding", "concerning", "for", "on"],
-            "a plethora of": ["many", "lots of", "numerous", "plenty of", "a wealth of"],
-            "a myriad of": ["many", "countless", "numerous", "lots of", "a host of"],
-            "in conjunction with": ["with", "along with", "together with", "combined with"],
-            "prior to": ["before", "ahead of", "preceding", "earlier than"],
-            "subsequent to": ["after", "following", "later than", "post"],
-            "this study demonstrates": ["this work shows", "our research reveals", "we found that", "the findings show"],
-            "this research demonstrates": ["this work shows", "our findings reveal", "we found", "evidence shows"],
-            "the implementation of": ["using", "applying", "the use of", "adopting"],
-            "utilized in": ["used in", "applied in", "employed in"],
-            "provides substantial": ["offers significant", "gives considerable", "yields major"],
-            "future endeavors": ["future work", "future research", "further studies"],
-            "future research endeavors": ["future studies", "further research", "upcoming work"],
-        }
-        
-        # Sentence starters that sound AI-generated
-        self.ai_starters = [
-            "It is evident that",
-            "It can be observed that",
-            "It is noteworthy that",
-            "It is essential to",
-            "It is imperative that",
-            "It should be noted that",
-            "It is important to highlight",
-            "It is crucial to understand",
-            "It is widely recognized that",
-            "It has been demonstrated that",
-            "This paper aims to",
-            "This study seeks to",
-            "The primary objective is to",
-            "The purpose of this study is to",
-            "The current research endeavors to",
-        ]
-        
-        # Human-like sentence starters
-        self.human_starters = [
-            "Clearly,",
-            "As we can see,",
-            "Interestingly,",
-            "What stands out is that",
-            "Looking at this more closely,",
-            "The evidence suggests that",
-            "Based on the findings,",
-            "One key insight is that",
-            "A closer look reveals that",
-            "The data points to",
-            "Research shows that",
-            "Studies indicate that",
-            "Evidence supports the idea that",
-            "Findings suggest that",
-            "The results confirm that",
-            "What emerges from this is",
-            "We can see that",
-            "This points to",
-            "Looking at the evidence,",
-            "From this, we learn that",
-        ]
-    
-    def _init_sentence_patterns(self):
-        """Initialize sentence restructuring patterns."""
-        
-        # Patterns to detect and restructure
-        self.restructure_patterns = [
-            # "X is Y" → "Y characterizes X" or "We see Y in X"
-            (r'^(\w+)\s+is\s+(\w+)', self._restructure_is_statement),
-            # "This demonstrates" → "We can see from this" 
-            (r'^This\s+demonstrates', self._restructure_this_demonstrates),
-            # Long sentences to split
-            (r'^(.{150,})[,;]\s*(and|but|or)\s+(.+)$', self._split_long_sentence),
-        ]
+        """Initialize vocabulary replacement maps (shared module-level tables)."""
+        self.vocab_replacements = _VOCAB_REPLACEMENTS
+        self.phrase_replacements = _PHRASE_REPLACEMENTS
+        self.ai_starters = _AI_STARTERS
+        self.human_starters = _HUMAN_STARTERS
     
     def _init_discourse_markers(self):
         """Initialize discourse markers for natural flow."""
-        
-        # Additive markers (adding information)
-        self.additive_markers = [
-            "Also,", "Besides,", "What's more,", "In addition,", "Plus,",
-            "On top of this,", "Adding to this,", "Further,", "As well as this,",
-        ]
-        
-        # Contrastive markers (showing contrast)
-        self.contrastive_markers = [
-            "But", "Yet", "However,", "Still,", "Although", "Even so,",
-            "That said,", "On the flip side,", "At the same time,",
-        ]
-        
-        # Causal markers (cause and effect)
-        self.causal_markers = [
-            "So", "Thus", "Hence", "As a result,", "Because of this,",
-            "This leads to", "This means that", "For this reason,",
-        ]
-        
-        # Temporal markers (time sequence)
-        self.temporal_markers = [
-            "First,", "Then,", "Next,", "After this,", "Finally,",
-            "Meanwhile,", "At this point,", "Following this,", "Later,",
-        ]
-        
-        # Exemplification markers
-        self.example_markers = [
-            "For example,", "For instance,", "Such as", "Like",
-            "To illustrate,", "Consider", "Take", "As seen in",
-        ]
+        self.additive_markers = _ADDITIVE_MARKERS
+        self.contrastive_markers = _CONTRASTIVE_MARKERS
+        self.causal_markers = _CAUSAL_MARKERS
+        self.temporal_markers = _TEMPORAL_MARKERS
+        self.example_markers = _EXAMPLE_MARKERS
+        
+        self._contrastive_cycle = _cycler(self.contrastive_markers, self._rng)
+        self._causal_cycle = _cycler(self.causal_markers, self._rng)
+        self._example_cycle = _cycler(self.example_markers, self._rng)
+        self._additive_cycle = _cycler(self.additive_markers, self._rng)
     
     def _init_hedging_phrases(self):
         """Initialize hedging and uncertainty phrases."""
-        
-        # Hedging verbs (reduce certainty)
-        self.hedging_verbs = [
-            "seems to", "appears to", "tends to", "might", "may",
-            "could", "suggests", "indicates", "points to", "implies",
-        ]
-        
-        # Hedging adverbs
-        self.hedging_adverbs = [
-            "perhaps", "possibly", "probably", "likely", "seemingly",
-            "apparently", "arguably", "potentially", "conceivably",
-        ]
-        
-        # Hedging phrases
-        self.hedging_phrases = [
-            "it seems that", "it appears that", "this suggests that",
-            "evidence points to", "this may indicate", "one could argue",
-            "it is possible that", "there is reason to believe",
-            "the data suggests", "findings indicate",
-        ]
-        
-        # Personal voice insertions (sparingly used)
-        self.personal_touches = [
-            "we observe", "we can see", "we note", "we find",
-            "our analysis shows", "our findings suggest",
-            "looking at the data, we", "examining this further, we",
-        ]
+        self.hedging_verbs = _HEDGING_VERBS
+        self.hedging_adverbs = _HEDGING_ADVERBS
+        self.hedging_phrases = _HEDGING_PHRASES
+        self.personal_touches = _PERSONAL_TOUCHES
     
     async def execute(self, request: AgentRequest) -> AgentResponse:
         """
@@ -409,21 +794,29 @@ class AIHumanizerAgent(BaseAgent):
                 transformation_ratio=0,
             )
             
-            humanized_sections = []
+            humanized_sections = list(sections)
+            pending = []  # (position, section) for sections that get humanized
             
-            for section in sections:
+            for index, section in enumerate(sections):
                 title = section.get("title", "")
-                content = section.get("content", "")
                 
                 # Skip certain sections
                 if self._should_skip_section(title):
-                    humanized_sections.append(section)
                     logger.debug(f"Skipped section: {title}")
                     continue
                 
-                # Humanize content
-                humanized_content, metrics = await self._humanize_content(content, title)
-                
+                pending.append((index, section))
+            
+            # The transforms are CPU-bound and hold the GIL, so parallel threads
+            # would not speed them up. One worker thread keeps the event loop
+            # free and humanizes the sections in order, so a seeded agent
+            # draws its random numbers in the same order on every run.
+            results = await asyncio.to_thread(
+                self._humanize_sections_sync,
+                [(section.get("content", ""), section.get("title", "")) for _, section in pending],
+            )
+            
+            for (index, section), (humanized_content, metrics) in zip(pending, results):
                 # Update metrics
                 total_metrics.original_word_count += metrics.original_word_count
                 total_metrics.transformed_word_count += metrics.transformed_word_count
@@ -431,13 +824,16 @@ class AIHumanizerAgent(BaseAgent):
                 total_metrics.sentence_restructures += metrics.sentence_restructures
                 total_metrics.discourse_markers_added += metrics.discourse_markers_added
                 
-                humanized_sections.append({
+                humanized_sections[index] = {
                     **section,
                     "content": humanized_content,
                     "humanization_applied": True,
-                })
+                }
                 
-                logger.info(f"Humanized section: {title} ({metrics.vocabulary_changes} vocab changes)")
+                logger.info(
+                    f"Humanized section: {section.get('title', '')} "
+                    f"({metrics.vocabulary_changes} vocab changes)"
+                )
             
             # Calculate overall metrics
             if total_metrics.original_word_count > 0:
@@ -456,6 +852,7 @@ class AIHumanizerAgent(BaseAgent):
             )
             
             return AgentResponse(
+                task_id=request.task_id,
                 agent_name=self.agent_name,
                 status=TaskStatus.COMPLETED,
                 output_data={
@@ -480,6 +877,7 @@ class AIHumanizerAgent(BaseAgent):
         except Exception as e:
             logger.error(f"Humanization failed: {e}", exc_info=True)
             return AgentResponse(
+                task_id=request.task_id,
                 agent_name=self.agent_name,
                 status=TaskStatus.FAILED,
                 error=str(e),
@@ -487,13 +885,7 @@ class AIHumanizerAgent(BaseAgent):
     
     def _should_skip_section(self, title: str) -> bool:
         """Check if section should be skipped from humanization."""
-        skip_sections = [
-            "references", "bibliography", "citations", "table of contents",
-            "list of tables", "list of figures", "list of abbreviations",
-            "appendix", "appendices", "acknowledgements", "dedication",
-            "abstract",  # Keep abstract more formal
-        ]
-        return any(skip in title.lower() for skip in skip_sections)
+        return bool(_SKIP_SECTION_RE.search(title.lower()))
     
     async def _humanize_content(self, content: str, section_title: str) -> Tuple[str, HumanizationMetrics]:
         """
@@ -506,44 +898,73 @@ class AIHumanizerAgent(BaseAgent):
         Returns:
             Tuple of (humanized_content, metrics)
         """
+        return await asyncio.to_thread(self._humanize_content_sync, content, section_title)
+    
+    def _get_cache_key(self, content: str) -> str:
+        """Generate cache key for content."""
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    
+    def _humanize_sections_sync(
+        self, sections: List[Tuple[str, str]]
+    ) -> List[Tuple[str, HumanizationMetrics]]:
+        """Humanize ``(content, section_title)`` pairs one after another, in order."""
+        return [self._humanize_content_sync(content, title) for content, title in sections]
+    
+    def _humanize_content_sync(self, content: str, section_title: str) -> Tuple[str, HumanizationMetrics]:
+        """Synchronous body of `_humanize_content`, safe to run on a worker thread."""
+        key = self._get_cache_key(content)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        
+        result = self._transform_content(content)
+        
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > _HUMANIZE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return result
+    
+    def _transform_content(self, content: str) -> Tuple[str, HumanizationMetrics]:
+        """Run the humanization pipeline on one section."""
         original_word_count = len(content.split())
         vocab_changes = 0
         sentence_restructures = 0
         discourse_markers_added = 0
         
         # Protect citations before transformation
-        content, citation_placeholders = self._protect_citations(content)
+        content, citations = self._protect_citations(content)
         
-        # Step 1: Vocabulary diversification
-        content, v_changes = self._transform_vocabulary(content)
+        # Steps 1-3: Vocabulary, AI-typical phrases and sentence starters
+        content, v_changes, s_changes = self._transform_lexical(content)
         vocab_changes += v_changes
-        
-        # Step 2: Replace AI-typical phrases
-        content, p_changes = self._transform_phrases(content)
-        vocab_changes += p_changes
-        
-        # Step 3: Transform sentence starters
-        content, s_changes = self._transform_starters(content)
         sentence_restructures += s_changes
         
+        # Steps 4-7 work sentence by sentence, so split once and share the list
+        sentences = [sentence for sentence in _SENTENCE_BOUNDARY_RE.split(content) if sentence]
+        
         # Step 4: Add discourse markers (sparingly)
-        content, d_added = self._add_discourse_markers(content)
+        sentences, d_added = self._add_discourse_markers(sentences)
         discourse_markers_added += d_added
         
         # Step 5: Add hedging language (sparingly)
-        content, h_added = self._add_hedging(content)
+        sentences, h_added = self._add_hedging(sentences)
         vocab_changes += h_added
         
         # Step 6: Vary sentence lengths
-        content, sent_changes = self._vary_sentence_lengths(content)
+        sentences, sent_changes = self._vary_sentence_lengths(sentences)
         sentence_restructures += sent_changes
         
         # Step 7: Add personal touches (very sparingly)
-        content, p_touches = self._add_personal_touches(content)
+        sentences, p_touches = self._add_personal_touches(sentences)
         vocab_changes += p_touches
         
+        content = ' '.join(sentences)
+        
         # Restore citations
-        content = self._restore_citations(content, citation_placeholders)
+        content = self._restore_citations(content, citations)
         
         transformed_word_count = len(content.split())
         
@@ -560,205 +981,207 @@ class AIHumanizerAgent(BaseAgent):
         
         return content, metrics
     
-    def _protect_citations(self, content: str) -> Tuple[str, Dict[str, str]]:
-        """Protect citations from transformation."""
-        placeholders = {}
+    def _protect_citations(self, content: str) -> Tuple[str, List[str]]:
+        """Mask citations (in order) so no transform can touch them."""
+        citations = []
+        if not self.preserve_citations or _CITATION_MASK in content:
+            return content, citations
         
-        # Protect various citation formats
-        citation_patterns = [
-            r'\([A-Z][a-z]+(?:\s+(?:et\s+al\.?|&|and)\s+[A-Z][a-z]+)?,?\s*\d{4}[a-z]?\)',  # (Author, 2020)
-            r'\([A-Z][a-z]+\s+&\s+[A-Z][a-z]+,?\s*\d{4}\)',  # (Smith & Jones, 2020)
-            r'\[[0-9,\s-]+\]',  # [1], [1,2,3], [1-5]
-            r'\[\d+\]',  # [1]
-        ]
+        def mask(match):
+            citations.append(match.group(0))
+            return _CITATION_MASK
         
-        for i, pattern in enumerate(citation_patterns):
-            matches = re.findall(pattern, content)
-            for j, match in enumerate(matches):
-                placeholder = f"__CITATION_{i}_{j}__"
-                placeholders[placeholder] = match
-                content = content.replace(match, placeholder, 1)
+        return _CITATION_RE.sub(mask, content), citations
+    
+    def _restore_citations(self, content: str, citations: List[str]) -> str:
+        """Splice the masked citations back in, in their original order."""
+        if not citations:
+            return content
+        pieces = content.split(_CITATION_MASK)
+        restored = [pieces[0]]
+        for citation, piece in zip(citations, pieces[1:]):
+            restored.append(citation)
+            restored.append(piece)
+        return ''.join(restored)
+    
+    def _draw_mask(self, count: int, probability: float) -> List[bool]:
+        """Draw ``count`` independent keep/replace decisions with P(True) = probability."""
+        if NUMPY_AVAILABLE and count >= _BULK_DRAW_THRESHOLD:
+            return (self._np_rng.random(count) < probability).tolist()
+        rng = self._rng
+        return [rng.random() < probability for _ in range(count)]
+    
+    @cached_property
+    def _lexical_table(self) -> Tuple[_LiteralMatcher, List[Tuple[str, Iterator]]]:
+        """
+        Shared lexical matcher plus this agent's ``(kind, alternatives)`` per literal id.
         
-        return content, placeholders
+        Built on first use rather than in ``__init__``, so constructing an
+        agent that never humanizes anything stays cheap.
+        """
+        # Each key cycles through (alternative, Capitalized alternative) pairs
+        # instead of drawing one; all starters share one cycle.
+        patterns = _build_patterns()
+        rng = self._rng
+        human_starters = _cycler([(starter, starter) for starter in self.human_starters], rng)
+        entries = [
+            (kind, human_starters if kind == "starter" else _cycler(_with_capitalized(alternatives), rng))
+            for kind, alternatives in patterns.lexical_entries
+        ]
+        return patterns.lexical, entries
     
-    def _restore_citations(self, content: str, placeholders: Dict[str, str]) -> str:
-        """Restore protected citations."""
-        for placeholder, original in placeholders.items():
-            content = content.replace(placeholder, original)
-        return content
+    # Compiled patterns are shared by all agents; the cyclers are per agent
+    @cached_property
+    def _absolute_replacements(self) -> List[Iterator[str]]:
+        """Hedged alternatives per absolute-statement pattern."""
+        return [_cycler(replacements, self._rng) for _, replacements in _ABSOLUTE_STATEMENTS]
     
-    def _transform_vocabulary(self, content: str) -> Tuple[str, int]:
-        """Transform AI-typical vocabulary."""
-        changes = 0
-        intensity = self.intensity.value
+    @cached_property
+    def _personal_replacements(self) -> List[Iterator[str]]:
+        """Personal-voice alternatives per impersonal-construction pattern."""
+        return [_cycler(replacements, self._rng) for _, replacements in _IMPERSONAL_CONSTRUCTIONS]
+    
+    def _transform_lexical(self, content: str) -> Tuple[str, int, int]:
+        """
+        Replace AI-typical vocabulary, phrases and sentence starters in one scan.
         
-        for ai_word, alternatives in self.vocab_replacements.items():
-            pattern = re.compile(r'\b' + re.escape(ai_word) + r'\b', re.IGNORECASE)
+        Returns:
+            Tuple of (content, vocabulary/phrase changes, starter changes)
+        """
+        vocab_changes = 0
+        starter_changes = 0
+        intensity = self._intensity_val
+        matcher, entries = self._lexical_table
+        
+        # One replace/keep decision per match, sampled up front
+        spans = list(matcher.finditer(content))
+        mask = self._draw_mask(len(spans), intensity)
+        
+        seen_starters = set()
+        chunks = []
+        position = 0
+        for (start, end, key_id), replace in zip(spans, mask):
+            kind, alternatives = entries[key_id]
             
-            # Find all matches first
-            def replace_match(match):
-                nonlocal changes
-                if random.random() < intensity:
-                    replacement = random.choice(alternatives)
-                    # Preserve capitalization
-                    if match.group(0)[0].isupper():
-                        replacement = replacement.capitalize()
-                    changes += 1
-                    return replacement
-                return match.group(0)
+            if kind == "starter":
+                # Starters only count at the head of a sentence, and only the
+                # first such occurrence of each is a candidate
+                if key_id in seen_starters or not _at_sentence_start(content, start):
+                    continue
+                seen_starters.add(key_id)
             
-            content = pattern.sub(replace_match, content)
-        
-        return content, changes
-    
-    def _transform_phrases(self, content: str) -> Tuple[str, int]:
-        """Transform AI-typical phrases."""
-        changes = 0
-        intensity = self.intensity.value
-        
-        # Sort by length (longest first) to avoid partial matches
-        sorted_phrases = sorted(self.phrase_replacements.keys(), key=len, reverse=True)
-        
-        for phrase in sorted_phrases:
-            alternatives = self.phrase_replacements[phrase]
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
+            if not replace:
+                continue
             
-            def replace_phrase(match):
-                nonlocal changes
-                if random.random() < intensity:
-                    replacement = random.choice(alternatives)
-                    if match.group(0)[0].isupper():
-                        replacement = replacement.capitalize()
-                    changes += 1
-                    return replacement
-                return match.group(0)
+            replacement, capitalized = next(alternatives)
+            if kind == "starter":
+                starter_changes += 1
+            else:
+                # Preserve capitalization
+                if content[start].isupper():
+                    replacement = capitalized
+                vocab_changes += 1
             
-            content = pattern.sub(replace_phrase, content)
-        
-        return content, changes
-    
-    def _transform_starters(self, content: str) -> Tuple[str, int]:
-        """Transform AI-typical sentence starters."""
-        changes = 0
-        intensity = self.intensity.value
-        
-        for ai_starter in self.ai_starters:
-            if ai_starter.lower() in content.lower():
-                if random.random() < intensity:
-                    pattern = re.compile(re.escape(ai_starter), re.IGNORECASE)
-                    human_starter = random.choice(self.human_starters)
-                    content = pattern.sub(human_starter, content, count=1)
-                    changes += 1
-        
-        return content, changes
+            chunks.append(content[position:start])
+            chunks.append(replacement)
+            position = end
+        
+        if not chunks:
+            return content, vocab_changes, starter_changes
+        chunks.append(content[position:])
+        return ''.join(chunks), vocab_changes, starter_changes
     
-    def _add_discourse_markers(self, content: str) -> Tuple[str, int]:
+    def _add_discourse_markers(self, sentences: List[str]) -> Tuple[List[str], int]:
         """Add natural discourse markers."""
         added = 0
-        sentences = content.split('. ')
         
         if len(sentences) < 3:
-            return content, 0
+            return sentences, 0
         
         # Only add markers to ~15% of sentences
-        marker_probability = 0.15 * self.intensity.value
+        marker_probability = 0.15 * self._intensity_val
+        rand = self._rng.random
         
         new_sentences = [sentences[0]]  # Keep first sentence as-is
         
-        for i, sentence in enumerate(sentences[1:], 1):
-            if random.random() < marker_probability and not self._starts_with_marker(sentence):
+        for sentence in sentences[1:]:
+            if rand() < marker_probability and not self._starts_with_marker(sentence):
                 # Choose marker type based on context
-                if any(word in sentence.lower() for word in ['however', 'but', 'although', 'despite']):
-                    marker = random.choice(self.contrastive_markers)
-                elif any(word in sentence.lower() for word in ['because', 'therefore', 'result', 'leads']):
-                    marker = random.choice(self.causal_markers)
-                elif any(word in sentence.lower() for word in ['example', 'instance', 'such as', 'like']):
-                    marker = random.choice(self.example_markers)
+                lowered = sentence.lower()
+                if _CONTRASTIVE_CUES_RE.search(lowered):
+                    marker = next(self._contrastive_cycle)
+                elif _CAUSAL_CUES_RE.search(lowered):
+                    marker = next(self._causal_cycle)
+                elif _EXAMPLE_CUES_RE.search(lowered):
+                    marker = next(self._example_cycle)
                 else:
-                    marker = random.choice(self.additive_markers)
+                    marker = next(self._additive_cycle)
                 
                 sentence = f"{marker} {sentence[0].lower()}{sentence[1:]}" if sentence else sentence
                 added += 1
             
             new_sentences.append(sentence)
         
-        return '. '.join(new_sentences), added
+        return new_sentences, added
     
     def _starts_with_marker(self, sentence: str) -> bool:
         """Check if sentence already starts with a discourse marker."""
-        all_markers = (
-            self.additive_markers + self.contrastive_markers + 
-            self.causal_markers + self.temporal_markers + self.example_markers
-        )
-        return any(sentence.strip().startswith(marker.strip()) for marker in all_markers)
+        return sentence.lstrip().startswith(_MARKER_PREFIXES)
     
-    def _add_hedging(self, content: str) -> Tuple[str, int]:
+    def _add_hedging(self, sentences: List[str]) -> Tuple[List[str], int]:
         """Add hedging and uncertainty language."""
         added = 0
-        intensity = self.intensity.value * 0.5  # Increased from 0.3
-        
-        # Replace absolute statements with hedged versions
-        absolute_patterns = [
-            (r'\bproves that\b', ['suggests that', 'indicates that', 'points to the fact that']),
-            (r'\bclearly shows\b', ['seems to show', 'appears to indicate', 'suggests']),
-            (r'\bdefinitely\b', ['likely', 'probably', 'seemingly']),
-            (r'\bcertainly\b', ['probably', 'likely', 'apparently']),
-            (r'\bobviously\b', ['it seems', 'apparently', 'evidently']),
-            (r'\bundoubtedly\b', ['likely', 'probably', 'in all likelihood']),
-            (r'\bwill be\b', ['may be', 'could be', 'is likely to be']),
-            (r'\bmust be\b', ['appears to be', 'seems to be', 'is likely']),
-            (r'\bis essential\b', ['is important', 'matters', 'is key']),
-            (r'\bis crucial\b', ['is important', 'is key', 'matters']),
-            (r'\bis critical\b', ['is important', 'is key', 'matters greatly']),
-            (r'\bis vital\b', ['is important', 'is key', 'matters']),
-            (r'\bis necessary\b', ['is needed', 'is required', 'is important']),
-        ]
+        intensity = self._intensity_val * 0.5  # Increased from 0.3
         
-        for pattern, replacements in absolute_patterns:
-            if random.random() < intensity:
-                if re.search(pattern, content, re.IGNORECASE):
-                    replacement = random.choice(replacements)
-                    content = re.sub(pattern, replacement, content, count=1, flags=re.IGNORECASE)
-                    added += 1
+        # Each pattern fires at most once, with its own draw
+        replacements = self._absolute_replacements
+        active = self._draw_mask(len(replacements), intensity)
+        if any(active):
+            added = _rewrite_first(_build_patterns().absolute, replacements, active, sentences)
         
-        return content, added
+        return sentences, added
     
-    def _vary_sentence_lengths(self, content: str) -> Tuple[str, int]:
+    def _vary_sentence_lengths(self, sentences: List[str]) -> Tuple[List[str], int]:
         """Vary sentence lengths for natural flow."""
         changes = 0
-        sentences = re.split(r'(?<=[.!?])\s+', content)
         
         if len(sentences) < 2:
-            return content, 0
+            return sentences, 0
         
+        split_probability = self._intensity_val * 0.5
+        combine_probability = self._intensity_val * 0.3
+        rand = self._rng.random
+        # Each sentence is tokenized once; the combine check reuses the count
+        word_counts = [len(sentence.split()) for sentence in sentences]
         new_sentences = []
         i = 0
         
         while i < len(sentences):
             sentence = sentences[i]
-            words = sentence.split()
+            word_count = word_counts[i]
             
             # Very long sentence (>40 words) - consider splitting
-            if len(words) > 40 and random.random() < self.intensity.value * 0.5:
-                # Find a good split point
-                split_words = [', and ', ', but ', ', which ', '; ', ' - ']
-                for split_word in split_words:
-                    if split_word in sentence:
-                        parts = sentence.split(split_word, 1)
-                        if len(parts) == 2 and len(parts[0].split()) > 10 and len(parts[1].split()) > 10:
-                            new_sentences.append(parts[0] + '.')
-                            new_sentences.append(parts[1].strip().capitalize())
-                            changes += 1
-                            break
+            if word_count > 40 and rand() < split_probability:
+                # Find a good split point: first occurrence of each, in order
+                for split_word in _SPLIT_POINTS:
+                    cut = sentence.find(split_word)
+                    if cut == -1:
+                        continue
+                    head = sentence[:cut]
+                    tail = sentence[cut + len(split_word):]
+                    if len(head.split()) > 10 and len(tail.split()) > 10:
+                        new_sentences.append(head + '.')
+                        new_sentences.append(tail.strip().capitalize())
+                        changes += 1
+                        break
                 else:
                     new_sentences.append(sentence)
             
             # Very short consecutive sentences - consider combining
-            elif len(words) < 10 and i + 1 < len(sentences):
+            elif word_count < 10 and i + 1 < len(sentences):
                 next_sentence = sentences[i + 1]
-                next_words = next_sentence.split()
                 
-                if len(next_words) < 10 and random.random() < self.intensity.value * 0.3:
+                if word_counts[i + 1] < 10 and rand() < combine_probability:
                     combined = f"{sentence.rstrip('.')} and {next_sentence[0].lower()}{next_sentence[1:]}"
                     new_sentences.append(combined)
                     i += 1  # Skip next sentence
@@ -770,29 +1193,19 @@ class AIHumanizerAgent(BaseAgent):
             
             i += 1
         
-        return ' '.join(new_sentences), changes
+        return new_sentences, changes
     
-    def _add_personal_touches(self, content: str) -> Tuple[str, int]:
+    def _add_personal_touches(self, sentences: List[str]) -> Tuple[List[str], int]:
         """Add personal voice touches (very sparingly for academic writing)."""
         added = 0
-        intensity = self.intensity.value * 0.2  # Very conservative
-        
-        # Replace impersonal constructions with personal voice (sparingly)
-        personal_replacements = [
-            (r'\bIt is observed that\b', ['We observe that', 'We can see that', 'We note that']),
-            (r'\bIt was found that\b', ['We found that', 'Our analysis shows that', 'We discovered that']),
-            (r'\bIt can be seen that\b', ['We can see that', 'Looking at this, we see', 'We observe']),
-            (r'\bOne can observe\b', ['We can observe', 'We see', 'We note']),
-        ]
+        intensity = self._intensity_val * 0.2  # Very conservative
         
-        for pattern, replacements in personal_replacements:
-            if random.random() < intensity:
-                if re.search(pattern, content, re.IGNORECASE):
-                    replacement = random.choice(replacements)
-                    content = re.sub(pattern, replacement, content, count=1, flags=re.IGNORECASE)
-                    added += 1
+        replacements = self._personal_replacements
+        active = self._draw_mask(len(replacements), intensity)
+        if any(active):
+            added = _rewrite_first(_build_patterns().personal, replacements, active, sentences)
         
-        return content, added
+        return sentences, added
     
     def _estimate_ai_score(self, sections: List[Dict]) -> float:
         """
@@ -809,6 +1222,10 @@ class AIHumanizerAgent(BaseAgent):
         if not full_text:
             return 0.0
         
+        # The score is a density, so a sample of a long text estimates it well
+        if len(full_text) > _SCORE_SAMPLE_CHARS:
+            full_text = self._sample_for_score(full_text)
+        
         word_count = len(full_text.split())
         if word_count == 0:
             return 0.0
@@ -816,20 +1233,9 @@ class AIHumanizerAgent(BaseAgent):
         # Count AI-typical patterns
         ai_pattern_count = 0
         
-        # Check vocabulary (weight: 1 per match)
-        for ai_word in self.vocab_replacements.keys():
-            matches = re.findall(r'\b' + re.escape(ai_word) + r'\b', full_text, re.IGNORECASE)
-            ai_pattern_count += len(matches)
-        
-        # Check phrases (weight: 2 per match - more indicative of AI)
-        for phrase in self.phrase_replacements.keys():
-            matches = re.findall(re.escape(phrase), full_text, re.IGNORECASE)
-            ai_pattern_count += len(matches) * 2
-        
-        # Check sentence starters (weight: 3 per match - very indicative of AI)
-        for starter in self.ai_starters:
-            matches = re.findall(re.escape(starter), full_text, re.IGNORECASE)
-            ai_pattern_count += len(matches) * 3
+        # Vocabulary weighs 1 per match, phrases 2 (more indicative of AI),
+        # sentence starters 3 (very indicative of AI)
+        ai_pattern_count += _build_patterns().score.count(full_text)
         
         # Calculate pattern density (patterns per 100 words)
         pattern_density = (ai_pattern_count / word_count) * 100
@@ -848,39 +1254,26 @@ class AIHumanizerAgent(BaseAgent):
         
         return round(estimated_score, 1)
     
-    def _restructure_is_statement(self, match) -> str:
-        """Restructure 'X is Y' statements."""
-        templates = [
-            "We find that {0} is {1}",
-            "Looking at {0}, we see that it is {1}",
-            "{1} characterizes {0}",
-            "What makes {0} notable is that it is {1}",
-        ]
-        return random.choice(templates).format(match.group(1), match.group(2))
-    
-    def _restructure_this_demonstrates(self, match) -> str:
-        """Restructure 'This demonstrates' statements."""
-        alternatives = [
-            "We can see from this that",
-            "This shows us that",
-            "What this tells us is that",
-            "From this, we learn that",
-        ]
-        return random.choice(alternatives)
+    def _sample_for_score(self, text: str) -> str:
+        """Pick a fixed subset of equal chunks of ``text``, the same for the same text."""
+        size = len(text) // _SCORE_CHUNKS
+        bounds = [0]
+        for index in range(1, _SCORE_CHUNKS):
+            # Move each cut to the next space so no word is split
+            cut = text.find(' ', max(index * size, bounds[-1]))
+            bounds.append(len(text) if cut == -1 else cut)
+        bounds.append(len(text))
+        
+        digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+        picked = random.Random(digest).sample(range(_SCORE_CHUNKS), _SCORE_SAMPLED_CHUNKS)
+        return ' '.join(text[bounds[i]:bounds[i + 1]] for i in sorted(picked))
     
-    def _split_long_sentence(self, match) -> str:
-        """Split long sentences at natural break points."""
-        first_part = match.group(1)
-        conjunction = match.group(2)
-        second_part = match.group(3)
-        
-        return f"{first_part}. {conjunction.capitalize()}, {second_part}"
-
 
 # Convenience function for quick humanization
 async def humanize_text(
     text: str,
-    intensity: HumanizationIntensity = HumanizationIntensity.MODERATE
+    intensity: HumanizationIntensity = HumanizationIntensity.MODERATE,
+    seed: Optional[int] = None,
 ) -> str:
     """
     Quick humanization of text without full agent setup.
@@ -888,17 +1281,45 @@ async def humanize_text(
     Args:
         text: Text to humanize
         intensity: Humanization intensity
+        seed: Optional seed; the same texts and seed give the same output
         
     Returns:
         Humanized text
     """
-    agent = AIHumanizerAgent(intensity=intensity)
+    humanized = await humanize_texts([text], intensity=intensity, seed=seed)
+    return humanized[0]
+
+
+async def humanize_texts(
+    texts: List[str],
+    intensity: HumanizationIntensity = HumanizationIntensity.MODERATE,
+    seed: Optional[int] = None,
+) -> List[str]:
+    """
+    Humanize several texts with one agent and one request.
+    
+    The texts go through as sections of a single request, so the agent is
+    set up once and the texts are transformed in order on one worker thread.
+    
+    Args:
+        texts: Texts to humanize
+        intensity: Humanization intensity
+        seed: Optional seed; the same texts and seed give the same output
+        
+    Returns:
+        Humanized texts, in input order
+    """
+    if not texts:
+        return []
+    
+    agent = AIHumanizerAgent(intensity=intensity, seed=seed)
     
     request = AgentRequest(
         task_id="quick_humanize",
         agent_name="ai_humanizer_agent",
+        action="process",
         input_data={
-            "sections": [{"title": "Content", "content": text}],
+            "sections": [{"title": "Content", "content": text} for text in texts],
             "topic": "Quick Humanization",
         }
     )
@@ -907,7 +1328,10 @@ async def humanize_text(
     
     if response.status == TaskStatus.COMPLETED:
         sections = response.output_data.get("sections", [])
-        if sections:
-            return sections[0].get("content", text)
+        if len(sections) == len(texts):
+            return [
+                section.get("content", text)
+                for section, text in zip(sections, texts)
+            ]
     
-    return text
+    return list(texts)
@@ -2,21 +2,57 @@
 Base agent class for all specialized agents.
 """
 
+import asyncio
+import hashlib
+import itertools
+import json
+import os
 import time
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
 from src.core.config import get_agent_config, get_settings
-from src.core.llm_provider import LLMProvider, get_llm_provider
+from src.core.llm_provider import JSONTextStream, LLMProvider, get_llm_provider
 from src.core.state_manager import StateManager, get_state_manager
 from src.models.agent_messages import AgentRequest, AgentResponse, TaskStatus
 
 
+# Process-local sequence for agent IDs; IDs only appear in logs and metrics
+_AGENT_SEQ = itertools.count(1)
+
+
+# String fields of a generated section passed on to an on_token callback
+SECTION_TEXT_KEYS = ("main_content", "title", "content")
+
+
+def section_text(main_content: str, subsections: List[Any]) -> str:
+    """
+    A generated section's text as streamed to ``on_token``: the main content,
+    then each subsection's title and content, separated by blank lines.
+    """
+    parts = [main_content]
+    for subsection in subsections:
+        if isinstance(subsection, dict):
+            parts += [subsection.get("title"), subsection.get("content")]
+    return JSONTextStream.SEPARATOR.join(part for part in parts if isinstance(part, str) and part)
+
+
+class _InflightCall:
+    """A cached LLM call in progress and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[str]"):
+        self.task = task
+        self.waiters = 0
+
+
 class AgentConfig(BaseModel):
     """Configuration for an agent."""
 
@@ -29,9 +65,46 @@ class AgentConfig(BaseModel):
     timeout: int = 300
 
 
+@lru_cache(maxsize=None)
+def _cached_config(agent_name: str, config_loader: Any) -> AgentConfig:
+    """
+    Build the AgentConfig for an agent once per loaded configuration.
+
+    The loader is part of the key, so ``reload_config()`` (which replaces it)
+    also invalidates these entries. The returned config is shared between
+    agents of the same name and must not be mutated.
+    """
+    settings = get_settings()
+    raw_config = config_loader.get_agent_config(agent_name)
+
+    if not raw_config:
+        logger.warning(f"No configuration found for agent: {agent_name}")
+        return AgentConfig(
+            name=agent_name,
+            model=settings.default_model,
+            temperature=settings.temperature,
+            max_tokens=settings.max_tokens,
+        )
+
+    return AgentConfig(
+        name=raw_config.get("name", agent_name),
+        model=raw_config.get("model", settings.default_model),
+        temperature=raw_config.get("temperature", 0.7),
+        max_tokens=raw_config.get("max_tokens", 4096),
+        role=raw_config.get("role", ""),
+        capabilities=raw_config.get("capabilities", []),
+        timeout=raw_config.get("timeout", 300),
+    )
+
+
 class BaseAgent(ABC):
     """Base class for all agents in the system."""
 
+    # generate_with_cache calls in progress, by cache key, per event loop
+    _inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _InflightCall]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         agent_name: str,
@@ -61,7 +134,7 @@ class BaseAgent(ABC):
         self.state = state_manager or get_state_manager()
 
         # Agent metadata
-        self.agent_id = str(uuid4())
+        self.agent_id = f"{os.getpid()}-{next(_AGENT_SEQ)}"
         self.created_at = datetime.now()
         self.task_count = 0
         self.total_processing_time = 0.0
@@ -70,27 +143,7 @@ class BaseAgent(ABC):
 
     def _load_config(self) -> AgentConfig:
         """Load agent configuration from config file."""
-        config_loader = get_agent_config()
-        raw_config = config_loader.get_agent_config(self.agent_name)
-
-        if not raw_config:
-            logger.warning(f"No configuration found for agent: {self.agent_name}")
-            return AgentConfig(
-                name=self.agent_name,
-                model=self.settings.default_model,
-                temperature=self.settings.temperature,
-                max_tokens=self.settings.max_tokens,
-            )
-
-        return AgentConfig(
-            name=raw_config.get("name", self.agent_name),
-            model=raw_config.get("model", self.settings.default_model),
-            temperature=raw_config.get("temperature", 0.7),
-            max_tokens=raw_config.get("max_tokens", 4096),
-            role=raw_config.get("role", ""),
-            capabilities=raw_config.get("capabilities", []),
-            timeout=raw_config.get("timeout", 300),
-        )
+        return _cached_config(self.agent_name, get_agent_config())
 
     @abstractmethod
     async def execute(self, request: AgentRequest) -> AgentResponse:
@@ -131,7 +184,7 @@ class BaseAgent(ABC):
         Returns:
             AgentResponse: Response with results or error
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.task_count += 1
 
         try:
@@ -142,7 +195,7 @@ class BaseAgent(ABC):
                     agent_name=self.agent_name,
                     status=TaskStatus.FAILED,
                     error="Input validation failed",
-                    execution_time=time.time() - start_time,
+                    execution_time=time.perf_counter() - start_time,
                 )
 
             # Execute task
@@ -150,7 +203,7 @@ class BaseAgent(ABC):
             response = await self.execute(request)
 
             # Update metrics
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.total_processing_time += execution_time
             response.execution_time = execution_time
 
@@ -169,7 +222,7 @@ class BaseAgent(ABC):
                 status=TaskStatus.FAILED,
                 error=str(e),
                 error_details={"exception_type": type(e).__name__},
-                execution_time=time.time() - start_time,
+                execution_time=time.perf_counter() - start_time,
             )
 
     async def generate_text(
@@ -226,6 +279,142 @@ class BaseAgent(ABC):
             prompt, system_prompt, max_retries, **kwargs
         )
 
+    async def generate_with_cache(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_retries: int = 3,
+        ttl: int = 86400,
+        validate: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Generate text with automatic retry, reusing the stored response for
+        an identical earlier request.
+
+        The cache key covers the model, system prompt, LLM parameters and
+        prompt, so any change to the inputs misses. Identical requests made
+        while one is in progress, from any agent, share that one LLM call;
+        it is only cancelled once every caller waiting on it is.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_retries: Maximum retry attempts
+            ttl: Seconds to keep the response
+            validate: Optional check of the response, such as its parser; a
+                response it raises ValueError for is still returned but not
+                stored, so the next identical request asks again
+            **kwargs: Additional LLM parameters
+
+        Returns:
+            str: Generated text
+        """
+        if system_prompt is None and self.agent_config.role:
+            system_prompt = self.agent_config.role
+
+        request_key = json.dumps(
+            [self.agent_config.model, system_prompt, kwargs, prompt], sort_keys=True, default=str
+        )
+        cache_key = f"llm:{hashlib.blake2b(request_key.encode(), digest_size=16).hexdigest()}"
+
+        # Responses are wrapped in a dict so JSON text isn't decoded on the way back
+        cached = await self.state.cache_get(cache_key)
+        if isinstance(cached, dict) and "text" in cached:
+            logger.debug(f"{self.agent_name}: LLM cache hit")
+            return cached["text"]
+
+        calls = self._inflight.setdefault(asyncio.get_running_loop(), {})
+        call = calls.get(cache_key)
+        if call is None:
+            call = calls[cache_key] = _InflightCall(asyncio.ensure_future(
+                self._generate_and_cache(cache_key, prompt, system_prompt, max_retries, ttl, validate, kwargs)
+            ))
+            # A cancelled call may already have been replaced under its key
+            call.task.add_done_callback(lambda _: calls.pop(cache_key) if calls.get(cache_key) is call else None)
+        else:
+            logger.debug(f"{self.agent_name}: joining in-flight LLM call")
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if not call.waiters and not call.task.done():
+                # Unlisted first, so an identical request made from here on
+                # starts a new call rather than joining the cancelled one
+                if calls.get(cache_key) is call:
+                    del calls[cache_key]
+                call.task.cancel()
+
+    async def _generate_and_cache(
+        self,
+        cache_key: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_retries: int,
+        ttl: int,
+        validate: Optional[Callable[[str], Any]],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        """Make the LLM call behind generate_with_cache and store its response if valid."""
+        response = await self.generate_with_retry(prompt, system_prompt, max_retries, **kwargs)
+        if validate is not None:
+            try:
+                validate(response)
+            except ValueError as e:
+                logger.debug(f"{self.agent_name}: not caching unusable LLM response: {e}")
+                return response
+        await self.state.cache_set(cache_key, {"text": response}, ttl=ttl)
+        return response
+
+    async def generate_stream_with_retry(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_retries: int = 3,
+        on_chunk: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Generate text by streaming, with automatic retry.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            max_retries: Maximum retry attempts
+            on_chunk: Optional callback receiving each text chunk as it arrives
+            **kwargs: Additional LLM parameters
+
+        Returns:
+            str: Full generated text
+        """
+        if system_prompt is None and self.agent_config.role:
+            system_prompt = self.agent_config.role
+
+        return await self.llm.generate_stream_with_retry(
+            prompt, system_prompt, max_retries, on_chunk=on_chunk, **kwargs
+        )
+
+    def section_stream(self, context: Dict[str, Any]) -> Optional[JSONTextStream]:
+        """
+        Stream of a generated section's text for the caller, if it asked for one.
+
+        ``on_token`` in the request context receives the section's text (see
+        ``section_text``) as the model writes it. When text already passed on
+        is replaced, by a retry or a repaired or cached result, the optional
+        ``on_restart`` callable is called first; the text received since the
+        last restart is always the final section text.
+
+        Returns:
+            JSONTextStream to feed the streamed response into, or None when
+            the context has no ``on_token``
+        """
+        on_token = context.get("on_token")
+        if on_token is None:
+            return None
+        return JSONTextStream(on_token, SECTION_TEXT_KEYS, context.get("on_restart"))
+
     async def save_output(
         self, request_id: str, key: str, value: Any, ttl: int = 86400
     ) -> bool:
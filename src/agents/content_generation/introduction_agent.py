@@ -2,12 +2,15 @@
 Introduction Agent - Generates problem statement, objectives, and research questions.
 """
 
-from typing import Any, Dict, List, Optional
+import asyncio
+import copy
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
 
 from loguru import logger
 
-from src.agents.base_agent import BaseAgent
-from src.core.llm_provider import LLMProvider
+from src.agents.base_agent import BaseAgent, section_text
+from src.core.llm_provider import JSONTextStream, LLMProvider, parse_json_response
 from src.core.state_manager import StateManager
 from src.models.agent_messages import AgentRequest, AgentResponse, TaskStatus
 
@@ -26,6 +29,256 @@ def _get_gap_significance(gap: Any) -> str:
     return getattr(gap, 'significance', 'high')
 
 
+def _normalize_gaps(research_gaps: List[Any]) -> List[Dict[str, str]]:
+    """Convert research gap objects or dicts to plain description/significance dicts."""
+    return [
+        {"description": _get_gap_description(gap), "significance": _get_gap_significance(gap)}
+        for gap in research_gaps
+    ]
+
+
+def _parse_introduction(response: str) -> Optional[Dict[str, Any]]:
+    """Parse a synthesized introduction, or return None if it has no main_content."""
+    try:
+        introduction = parse_json_response(response)
+    except ValueError as e:
+        logger.warning("Could not parse introduction response: {}", e)
+        return None
+    if not isinstance(introduction, dict) or "main_content" not in introduction:
+        return None
+    introduction.setdefault("subsections", [])
+    return introduction
+
+
+def _numbered(items: List[str]) -> str:
+    """Render items as a numbered list, one per line."""
+    return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+
+
+def _fallback_objectives(key_points: List[str], research_gaps: List[Dict[str, str]]) -> List[str]:
+    """Objectives used when none could be generated."""
+    return [
+        f"To investigate {key_points[0] if key_points else 'the primary research area'}",
+        f"To develop methods addressing {research_gaps[0]['description'] if research_gaps else 'identified gaps'}",
+        "To evaluate the effectiveness of proposed approaches",
+        "To validate findings through empirical analysis",
+    ]
+
+
+def _fallback_research_questions(topic: str, key_points: List[str]) -> List[str]:
+    """Research questions used when none could be generated."""
+    return [
+        f"What are the key factors influencing {topic}?",
+        f"How does {key_points[0] if key_points else 'the primary research area'} shape outcomes in {topic}?",
+        "What are the implications of the proposed approach?",
+    ]
+
+
+def _fallback_introduction(
+    topic: str,
+    problem_statement: str,
+    objectives: List[str],
+    research_questions: List[str],
+) -> Dict[str, Any]:
+    """Introduction structure used when no synthesized introduction is available."""
+    return {
+        "main_content": f"This research proposal addresses {topic}, focusing on several key areas of investigation.",
+        "subsections": [
+            {
+                "title": "Background and Context",
+                "content": problem_statement,
+            },
+            {
+                "title": "Research Objectives",
+                "content": _numbered(objectives),
+            },
+            {
+                "title": "Research Questions",
+                "content": _numbered(research_questions),
+            },
+        ],
+    }
+
+
+# How long a generated introduction is reused for identical inputs (seconds)
+_RESULT_CACHE_TTL = 86400
+
+# JSON schemas handed to providers with structured-output support
+_STRINGS_SCHEMA = {"type": "array", "items": {"type": "string"}}
+_OBJECTIVES_SCHEMA = {**_STRINGS_SCHEMA, "minItems": 4, "maxItems": 6}
+_INTRODUCTION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "main_content": {"type": "string"},
+        "subsections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"title": {"type": "string"}, "content": {"type": "string"}},
+                "required": ["title", "content"],
+            },
+        },
+    },
+    "required": ["main_content", "subsections"],
+}
+_COMBINED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "problem_statement": {"type": "string"},
+        "objectives": _OBJECTIVES_SCHEMA,
+        "research_questions": _STRINGS_SCHEMA,
+        **_INTRODUCTION_SCHEMA["properties"],
+    },
+    "required": ["problem_statement", "objectives", "research_questions", "main_content", "subsections"],
+}
+
+
+# Task sections appended to the shared preamble. _SYNTHESIS_TASK and
+# _REPAIR_TASK are str.format templates, so literal braces are doubled.
+_COMBINED_TASK = """Task: Write the introduction section of this research proposal.
+
+Produce, in one response:
+1. problem_statement: a single cohesive paragraph of 150-200 words that moves
+   from broad context to the specific problem, highlights significance and
+   urgency, and connects to the research gaps
+2. objectives: 4-6 SMART research objectives, each 1-2 sentences starting with
+   an action verb (e.g., "To investigate...", "To develop...", "To evaluate..."),
+   ordered from broad to specific
+3. research_questions: 3-5 focused, answerable research questions that map to
+   the objectives, use question words (How, What, Why, To what extent) and
+   avoid yes/no questions
+4. main_content and subsections: the full introduction (1500-2000 words) with
+   background and context (200 words), the problem statement, significance and
+   impact (150 words), objectives, research questions, scope and limitations
+   (100 words) and a brief methodology preview (50 words)
+
+Use academic style, 3rd person.
+
+Format as JSON:
+{
+  "problem_statement": "...",
+  "objectives": ["To investigate...", "..."],
+  "research_questions": ["How...", "..."],
+  "main_content": "Opening paragraph...",
+  "subsections": [
+    {"title": "Background and Context", "content": "..."},
+    {"title": "Problem Statement", "content": "..."},
+    {"title": "Research Objectives", "content": "..."},
+    {"title": "Research Questions", "content": "..."},
+    {"title": "Scope and Significance", "content": "..."}
+  ]
+}
+"""
+
+_PROBLEM_TASK = """Task: Write a compelling problem statement for this research proposal,
+drawing on the first three research gaps.
+
+Requirements:
+1. Start with broad context (2-3 sentences)
+2. Narrow to specific problem (2-3 sentences)
+3. Highlight significance and urgency
+4. Connect to research gaps
+5. Use academic tone (3rd person)
+6. Target 150-200 words
+
+Format as a single cohesive paragraph.
+"""
+
+_OBJECTIVES_TASK = """Task: Generate 4-6 specific, measurable research objectives that address
+the key points and fill the research gaps.
+
+Requirements:
+1. Start each objective with action verbs (e.g., "To investigate...", "To develop...", "To evaluate...")
+2. Make them SMART (Specific, Measurable, Achievable, Relevant, Time-bound)
+3. Ensure they address identified gaps
+4. Order from broad to specific
+5. Each objective should be 1-2 sentences
+
+Format as JSON array of strings.
+"""
+
+_QUESTIONS_TASK = """Task: Generate 3-5 focused research questions that address the key points
+and fill the research gaps, drawing on the first three research gaps.
+
+Requirements:
+1. Each question should address one or more key points or gaps
+2. Use question words (How, What, Why, To what extent)
+3. Be specific and answerable through research
+4. Build on each other logically
+5. Avoid yes/no questions
+
+Format as JSON array of strings.
+"""
+
+_SYNTHESIS_TASK = """Task: Write a comprehensive introduction section for this research proposal,
+addressing the first three research gaps.
+
+Problem Statement:
+{problem_statement}
+
+Research Objectives:
+{objectives}
+
+Research Questions:
+{research_questions}
+
+Requirements:
+1. Start with broad context and background (200 words)
+2. Include problem statement naturally
+3. Discuss significance and impact (150 words)
+4. Present research objectives clearly
+5. State research questions
+6. Outline scope and limitations (100 words)
+7. Preview methodology briefly (50 words)
+8. Use academic style, 3rd person
+9. Total target: 1500-2000 words
+
+Format as JSON:
+{{
+  "main_content": "Opening paragraph...",
+  "subsections": [
+    {{"title": "Background and Context", "content": "..."}},
+    {{"title": "Problem Statement", "content": "..."}},
+    {{"title": "Research Objectives", "content": "..."}},
+    {{"title": "Research Questions", "content": "..."}},
+    {{"title": "Scope and Significance", "content": "..."}}
+  ]
+}}
+"""
+
+_REPAIR_TASK = """Task: The text below was meant to be the introduction section of this research
+proposal, formatted as JSON, but it could not be parsed. Re-emit it as strict
+JSON with a "main_content" string and a "subsections" array of
+{{"title": ..., "content": ...}} objects. Keep the wording; do not add commentary.
+
+{response}
+"""
+
+
+def _build_preamble(topic: str, key_points: List[str], research_gaps: List[Dict[str, str]]) -> str:
+    """
+    Shared opening of every introduction prompt.
+    
+    Each prompt starts with this exact text and appends its own task, so
+    providers that cache identical prompt prefixes can reuse it across the
+    calls of one request. Gaps keep their input order, most important first.
+    """
+    key_points_block = "\n".join(f"- {point}" for point in key_points)
+    gaps_block = "\n".join(
+        f"- {gap['description']}: Significance - {gap['significance']}"
+        for gap in research_gaps
+    )
+    return f"""Research proposal topic: {topic}
+
+Key Points:
+{key_points_block}
+
+Identified Research Gaps (most important first):
+{gaps_block}
+
+"""
+
+
 class IntroductionAgent(BaseAgent):
     """
     Introduction Agent - Creates compelling introduction section.
@@ -42,6 +295,7 @@ class IntroductionAgent(BaseAgent):
         self,
         llm_provider: Optional[LLMProvider] = None,
         state_manager: Optional[StateManager] = None,
+        multi_call_mode: bool = False,
     ):
         """
         Initialize introduction agent.
@@ -49,6 +303,8 @@ class IntroductionAgent(BaseAgent):
         Args:
             llm_provider: LLM provider for text generation
             state_manager: State manager for persistence
+            multi_call_mode: Generate each part with its own LLM call instead
+                of one combined call
         """
         super().__init__(
             agent_name="introduction_agent",
@@ -56,6 +312,8 @@ class IntroductionAgent(BaseAgent):
             state_manager=state_manager,
         )
         
+        self._multi_call_mode = multi_call_mode
+        
         logger.info("IntroductionAgent initialized")
     
     async def execute(self, request: AgentRequest) -> AgentResponse:
@@ -63,11 +321,24 @@ class IntroductionAgent(BaseAgent):
         Execute introduction generation.
         
         Args:
-            request: AgentRequest containing topic, key_points, literature analysis
+            request: AgentRequest containing topic, key_points, literature analysis.
+                An ``on_token`` callable in ``request.context`` receives the
+                introduction's text as it is written, or all at once on a
+                cache hit; ``on_restart`` is called before text already
+                received is replaced (see ``BaseAgent.section_stream``).
             
         Returns:
             AgentResponse containing introduction content and metadata
         """
+        # Reject bad input before any prompt is built or LLM call is made
+        if not await self.validate_input(request.input_data):
+            return AgentResponse(
+                task_id=request.task_id,
+                agent_name=self.agent_name,
+                status=TaskStatus.FAILED,
+                error="Input validation failed",
+            )
+        
         try:
             input_data = request.input_data
             topic = input_data.get("topic", "")
@@ -75,37 +346,49 @@ class IntroductionAgent(BaseAgent):
             
             # Get literature review outputs
             lit_analysis = input_data.get("dependency_analyze_literature", {})
-            research_gaps = lit_analysis.get("research_gaps", [])
+            research_gaps = _normalize_gaps(lit_analysis.get("research_gaps", []))
             
-            logger.info(f"Generating introduction for: {topic}")
+            stream = self.section_stream(request.context)
+            preamble = _build_preamble(topic, key_points, research_gaps)
             
-            # Generate problem statement
-            problem_statement = await self._generate_problem_statement(
-                topic, key_points, research_gaps
-            )
-            logger.info("Problem statement generated")
+            # Identical inputs (retries, workflow re-entries) reuse the last result
+            cache_key = self._get_cache_key(preamble)
+            cached = await self.state.cache_get(cache_key)
+            if isinstance(cached, dict):
+                logger.info("Introduction cache hit for: {}", topic)
+                if stream is not None:
+                    stream.finish(section_text(cached["content"], cached["subsections"]))
+                return AgentResponse(
+                    task_id=request.task_id,
+                    agent_name=self.agent_name,
+                    status=TaskStatus.COMPLETED,
+                    output_data=copy.deepcopy(cached),
+                    metadata={"cache_hit": True},
+                )
             
-            # Generate objectives
-            objectives = await self._generate_objectives(
-                topic, key_points, research_gaps
-            )
-            logger.info(f"Generated {len(objectives)} objectives")
+            logger.info("Generating introduction for: {}", topic)
             
-            # Generate research questions
-            research_questions = await self._generate_research_questions(
-                topic, objectives, research_gaps
-            )
-            logger.info(f"Generated {len(research_questions)} research questions")
-            
-            # Generate full introduction
-            introduction_content = await self._synthesize_introduction(
-                topic,
-                problem_statement,
-                objectives,
-                research_questions,
-                research_gaps,
-            )
-            logger.info("Introduction synthesis complete")
+            # Prefer one combined call; generate the parts separately when
+            # that is disabled or its response can't be used
+            generated = None
+            complete = True
+            if not self._multi_call_mode:
+                generated = await self._generate_all(preamble, stream)
+                if generated is None:
+                    logger.warning("Combined introduction response unusable; generating parts separately")
+                    if stream is not None:
+                        stream.restart()
+            if generated is not None:
+                problem_statement, objectives, research_questions, introduction_content = generated
+            else:
+                problem_statement, objectives, research_questions, introduction_content, complete = (
+                    await self._generate_parts(preamble, topic, key_points, research_gaps, stream)
+                )
+            if stream is not None:
+                # A repaired or fallback introduction differs from what streamed
+                stream.finish(section_text(
+                    introduction_content["main_content"], introduction_content["subsections"]
+                ))
             
             # Prepare output
             result = {
@@ -122,10 +405,14 @@ class IntroductionAgent(BaseAgent):
             }
             
             logger.info(
-                f"Introduction complete: {result['metadata']['word_count']} words, "
-                f"{len(objectives)} objectives, {len(research_questions)} questions"
+                "Introduction complete: {} words, {} objectives, {} questions",
+                result["metadata"]["word_count"], len(objectives), len(research_questions),
             )
             
+            # A retry should get another attempt at any part that fell back
+            if complete:
+                await self.state.cache_set(cache_key, copy.deepcopy(result), ttl=_RESULT_CACHE_TTL)
+            
             return AgentResponse(
                 task_id=request.task_id,
                 agent_name=self.agent_name,
@@ -134,7 +421,7 @@ class IntroductionAgent(BaseAgent):
             )
         
         except Exception as e:
-            logger.error(f"Introduction generation failed: {e}")
+            logger.error("Introduction generation failed: {}", e)
             return AgentResponse(
                 task_id=request.task_id,
                 agent_name=self.agent_name,
@@ -142,42 +429,117 @@ class IntroductionAgent(BaseAgent):
                 error=str(e),
             )
     
-    async def _generate_problem_statement(
+    def _get_cache_key(self, preamble: str) -> str:
+        """Cache key for a generated introduction: the model plus every input, via the preamble."""
+        digest = hashlib.blake2b(f"{self.agent_config.model}\n{preamble}".encode(), digest_size=16)
+        return f"introduction:{digest.hexdigest()}"
+    
+    async def _generate_all(
         self,
+        preamble: str,
+        stream: Optional[JSONTextStream] = None,
+    ) -> Optional[Tuple[str, List[str], List[str], Dict[str, Any]]]:
+        """
+        Generate every part of the introduction with a single LLM call.
+        
+        Returns:
+            Tuple of (problem_statement, objectives, research_questions,
+            introduction_content), or None if the response is not usable
+        """
+        
+        prompt = preamble + _COMBINED_TASK
+        
+        response = await self.generate_stream_with_retry(
+            prompt=prompt,
+            on_chunk=stream.feed if stream is not None else None,
+            max_tokens=5000,
+            temperature=0.7,
+            response_schema=_COMBINED_SCHEMA,
+        )
+        
+        try:
+            generated = parse_json_response(response)
+        except ValueError:
+            return None
+        
+        if not isinstance(generated, dict):
+            return None
+        problem_statement = generated.get("problem_statement")
+        objectives = generated.get("objectives")
+        research_questions = generated.get("research_questions")
+        main_content = generated.get("main_content")
+        subsections = generated.get("subsections")
+        if not (
+            isinstance(problem_statement, str)
+            and isinstance(objectives, list)
+            and isinstance(research_questions, list)
+            and isinstance(main_content, str)
+            and isinstance(subsections, list)
+        ):
+            return None
+        
+        logger.info(
+            "Generated introduction in one call: {} objectives, {} research questions",
+            len(objectives), len(research_questions),
+        )
+        introduction_content = {"main_content": main_content, "subsections": subsections}
+        return problem_statement.strip(), objectives, research_questions, introduction_content
+    
+    async def _generate_parts(
+        self,
+        preamble: str,
         topic: str,
         key_points: List[str],
-        research_gaps: List[Any],
-    ) -> str:
-        """Generate compelling problem statement."""
+        research_gaps: List[Dict[str, str]],
+        stream: Optional[JSONTextStream] = None,
+    ) -> Tuple[str, List[str], List[str], Dict[str, Any], bool]:
+        """
+        Generate the introduction with one LLM call per part.
         
-        gaps_summary = "\n".join([
-            f"- {_get_gap_description(gap)}"
-            for gap in research_gaps[:3]
-        ])
+        Returns:
+            Tuple of (problem_statement, objectives, research_questions,
+            introduction_content, complete), where complete is False if
+            any part fell back to its default
+        """
+        # Problem statement, objectives and questions only need the inputs,
+        # so request them concurrently; synthesis ties them together
+        problem_statement, objectives, research_questions = await asyncio.gather(
+            self._generate_problem_statement(preamble),
+            self._generate_objectives(preamble),
+            self._generate_research_questions(preamble),
+        )
+        complete = objectives is not None and research_questions is not None
+        if objectives is None:
+            objectives = _fallback_objectives(key_points, research_gaps)
+        if research_questions is None:
+            research_questions = _fallback_research_questions(topic, key_points)
+        logger.info("Problem statement generated")
+        logger.info("Generated {} objectives", len(objectives))
+        logger.info("Generated {} research questions", len(research_questions))
         
-        prompt = f"""
-Write a compelling problem statement for a research proposal on: {topic}
-
-Key Points:
-{chr(10).join(f"- {point}" for point in key_points)}
-
-Identified Research Gaps:
-{gaps_summary}
-
-Requirements:
-1. Start with broad context (2-3 sentences)
-2. Narrow to specific problem (2-3 sentences)
-3. Highlight significance and urgency
-4. Connect to research gaps
-5. Use academic tone (3rd person)
-6. Target 150-200 words
-
-Format as a single cohesive paragraph.
-"""
+        # Generate full introduction
+        introduction_content = await self._synthesize_introduction(
+            preamble,
+            problem_statement,
+            objectives,
+            research_questions,
+            stream,
+        )
+        if introduction_content is None:
+            complete = False
+            introduction_content = _fallback_introduction(topic, problem_statement, objectives, research_questions)
+        logger.info("Introduction synthesis complete")
+        
+        return problem_statement, objectives, research_questions, introduction_content, complete
+    
+    async def _generate_problem_statement(self, preamble: str) -> str:
+        """Generate compelling problem statement."""
+        
+        prompt = preamble + _PROBLEM_TASK
         
         problem_statement = await self.generate_with_retry(
             prompt=prompt,
-            max_tokens=500,
+            max_tokens=300,
             temperature=0.7,
         )
         
@@ -185,194 +547,89 @@ Format as a single cohesive paragraph.
     
     async def _generate_objectives(
         self,
-        topic: str,
-        key_points: List[str],
-        research_gaps: List[Any],
-    ) -> List[str]:
-        """Generate research objectives."""
+        preamble: str,
+    ) -> Optional[List[str]]:
+        """Generate research objectives, or None if the response is unusable."""
         
-        gaps_summary = "\n".join([
-            f"- {_get_gap_description(gap)}"
-            for gap in research_gaps
-        ])
-        
-        prompt = f"""
-Generate 4-6 specific, measurable research objectives for: {topic}
-
-Key Points to Address:
-{chr(10).join(f"- {point}" for point in key_points)}
-
-Research Gaps to Fill:
-{gaps_summary}
-
-Requirements:
-1. Start each objective with action verbs (e.g., "To investigate...", "To develop...", "To evaluate...")
-2. Make them SMART (Specific, Measurable, Achievable, Relevant, Time-bound)
-3. Ensure they address identified gaps
-4. Order from broad to specific
-5. Each objective should be 1-2 sentences
-
-Format as JSON array of strings.
-"""
+        prompt = preamble + _OBJECTIVES_TASK
         
         response = await self.generate_with_retry(
             prompt=prompt,
-            max_tokens=800,
+            max_tokens=500,
             temperature=0.7,
+            response_schema=_OBJECTIVES_SCHEMA,
         )
         
         try:
-            import json
-            objectives = json.loads(response)
+            objectives = parse_json_response(response)
             if isinstance(objectives, list):
                 return objectives
-        except:
-            pass
+        except ValueError as e:
+            logger.warning("Could not parse objectives response: {}", e)
         
-        # Fallback objectives
-        return [
-            f"To investigate {key_points[0] if key_points else 'the primary research area'}",
-            f"To develop methods addressing {_get_gap_description(research_gaps[0]) if research_gaps else 'identified gaps'}",
-            "To evaluate the effectiveness of proposed approaches",
-            "To validate findings through empirical analysis",
-        ]
+        return None
     
     async def _generate_research_questions(
         self,
-        topic: str,
-        objectives: List[str],
-        research_gaps: List[Any],
-    ) -> List[str]:
-        """Generate research questions."""
-        
-        gaps_list = "\n".join([
-            f"- {_get_gap_description(gap)}"
-            for gap in research_gaps[:3]
-        ])
+        preamble: str,
+    ) -> Optional[List[str]]:
+        """Generate research questions, or None if the response is unusable."""
         
-        prompt = f"""
-Generate 3-5 focused research questions for: {topic}
-
-Research Objectives:
-{chr(10).join(f"{i+1}. {obj}" for i, obj in enumerate(objectives))}
-
-Research Gaps:
-{gaps_list}
-
-Requirements:
-1. Each question should map to one or more objectives
-2. Use question words (How, What, Why, To what extent)
-3. Be specific and answerable through research
-4. Build on each other logically
-5. Avoid yes/no questions
-
-Format as JSON array of strings.
-"""
+        prompt = preamble + _QUESTIONS_TASK
         
         response = await self.generate_with_retry(
             prompt=prompt,
-            max_tokens=600,
+            max_tokens=350,
             temperature=0.7,
+            response_schema=_STRINGS_SCHEMA,
         )
         
         try:
-            import json
-            questions = json.loads(response)
+            questions = parse_json_response(response)
             if isinstance(questions, list):
                 return questions
-        except:
-            pass
+        except ValueError as e:
+            logger.warning("Could not parse research questions response: {}", e)
         
-        # Fallback questions
-        return [
-            f"What are the key factors influencing {topic}?",
-            f"How can {objectives[0].lower() if objectives else 'the research objectives'} be achieved?",
-            "What are the implications of the proposed approach?",
-        ]
+        return None
     
     async def _synthesize_introduction(
         self,
-        topic: str,
+        preamble: str,
         problem_statement: str,
         objectives: List[str],
         research_questions: List[str],
-        research_gaps: List[Any],
-    ) -> Dict[str, Any]:
-        """Synthesize complete introduction section."""
-        
-        gaps_addressed = "\n".join([
-            f"- {_get_gap_description(gap)}: Significance - {_get_gap_significance(gap)}"
-            for gap in research_gaps[:3]
-        ])
+        stream: Optional[JSONTextStream] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Synthesize complete introduction section, or None if no usable response arrives."""
         
-        prompt = f"""
-Write a comprehensive introduction section for a research proposal on: {topic}
-
-Problem Statement:
-{problem_statement}
-
-Research Objectives:
-{chr(10).join(f"{i+1}. {obj}" for i, obj in enumerate(objectives))}
-
-Research Questions:
-{chr(10).join(f"{i+1}. {q}" for i, q in enumerate(research_questions))}
-
-Research Gaps Addressed:
-{gaps_addressed}
-
-Requirements:
-1. Start with broad context and background (200 words)
-2. Include problem statement naturally
-3. Discuss significance and impact (150 words)
-4. Present research objectives clearly
-5. State research questions
-6. Outline scope and limitations (100 words)
-7. Preview methodology briefly (50 words)
-8. Use academic style, 3rd person
-9. Total target: 1500-2000 words
-
-Format as JSON:
-{{
-  "main_content": "Opening paragraph...",
-  "subsections": [
-    {{"title": "Background and Context", "content": "..."}},
-    {{"title": "Problem Statement", "content": "..."}},
-    {{"title": "Research Objectives", "content": "..."}},
-    {{"title": "Research Questions", "content": "..."}},
-    {{"title": "Scope and Significance", "content": "..."}}
-  ]
-}}
-"""
+        prompt = preamble + _SYNTHESIS_TASK.format_map({
+            "problem_statement": problem_statement,
+            "objectives": _numbered(objectives),
+            "research_questions": _numbered(research_questions),
+        })
         
-        response = await self.generate_with_retry(
+        response = await self.generate_stream_with_retry(
             prompt=prompt,
+            on_chunk=stream.feed if stream is not None else None,
             max_tokens=4000,
             temperature=0.7,
+            response_schema=_INTRODUCTION_SCHEMA,
         )
         
-        try:
-            import json
-            introduction = json.loads(response)
-            return introduction
-        except:
-            # Fallback structure
-            return {
-                "main_content": f"This research proposal addresses {topic}, focusing on several key areas of investigation.",
-                "subsections": [
-                    {
-                        "title": "Background and Context",
-                        "content": problem_statement,
-                    },
-                    {
-                        "title": "Research Objectives",
-                        "content": "\n".join(f"{i+1}. {obj}" for i, obj in enumerate(objectives)),
-                    },
-                    {
-                        "title": "Research Questions",
-                        "content": "\n".join(f"{i+1}. {q}" for i, q in enumerate(research_questions)),
-                    },
-                ],
-            }
+        introduction = _parse_introduction(response)
+        if introduction is None and response.strip():
+            # Rescue the long generation with one cheap reformatting call
+            # rather than discarding it
+            logger.warning("Introduction response unusable; asking for strict JSON")
+            repaired = await self.generate_with_retry(
+                prompt=preamble + _REPAIR_TASK.format_map({"response": response}),
+                max_tokens=4000,
+                temperature=0,
+                response_schema=_INTRODUCTION_SCHEMA,
+            )
+            introduction = _parse_introduction(repaired)
+        return introduction
     
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """Validate input data."""
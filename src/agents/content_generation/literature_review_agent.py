@@ -3,13 +3,16 @@ Literature Review Agent - Analyzes academic papers and identifies research gaps.
 """
 
 import asyncio
+import re
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from loguru import logger
+from pydantic import TypeAdapter
 
 from src.agents.base_agent import BaseAgent
-from src.core.llm_provider import LLMProvider
+from src.core.llm_provider import LLMProvider, parse_json_response
 from src.core.state_manager import StateManager
 from src.mcp_servers.arxiv_mcp import ArxivMCP
 from src.mcp_servers.frontiers_mcp import FrontiersMCP
@@ -19,6 +22,21 @@ from src.models.proposal_schema import LiteraturePaper, ResearchGap
 from src.models.agent_messages import AgentRequest, AgentResponse, TaskStatus
 
 
+# Dumps a whole list of papers in one pydantic-core call
+_PAPERS_ADAPTER = TypeAdapter(List[LiteraturePaper])
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+
+# Output budget for the combined review call; the configured Claude model
+# rejects requests for more than 8192 output tokens
+_COMBINED_MAX_TOKENS = 8192
+
+
+def _title_key(title: str) -> str:
+    """Dedup key for a paper title: lowercase words, punctuation and extra spaces dropped."""
+    return " ".join(_PUNCTUATION_RE.sub(" ", title.lower()).split())
+
+
 class LiteratureReviewAgent(BaseAgent):
     """
     Literature Review Agent - Conducts comprehensive literature review.
@@ -39,6 +57,7 @@ class LiteratureReviewAgent(BaseAgent):
         state_manager: Optional[StateManager] = None,
         min_papers: int = 30,
         max_papers: int = 50,
+        multi_call_mode: bool = False,
     ):
         """
         Initialize literature review agent.
@@ -48,6 +67,8 @@ class LiteratureReviewAgent(BaseAgent):
             state_manager: State manager for caching
             min_papers: Minimum number of papers to review
             max_papers: Maximum number of papers to process
+            multi_call_mode: Analyze, identify gaps and synthesize with
+                separate LLM calls instead of one combined call
         """
         super().__init__(
             agent_name="literature_review_agent",
@@ -57,6 +78,7 @@ class LiteratureReviewAgent(BaseAgent):
         
         self.min_papers = min_papers
         self.max_papers = max_papers
+        self._multi_call_mode = multi_call_mode
         
         # Initialize MCP servers
         self.semantic_scholar = SemanticScholarMCP(state_manager=state_manager)
@@ -89,33 +111,65 @@ class LiteratureReviewAgent(BaseAgent):
             logger.info(f"Starting literature review for topic: {topic}")
             
             # Step 1: Search for papers
-            papers = await self._search_papers(topic, key_points, preferences)
+            # One clock read per review keeps search filters and recency
+            # scores on the same year
+            current_year = datetime.now().year
+            papers = await self._search_papers(topic, key_points, preferences, current_year)
             logger.info(f"Retrieved {len(papers)} papers from MCP servers")
             
+            if not papers:
+                logger.error("No papers retrieved; skipping literature analysis")
+                return AgentResponse(
+                    task_id=request.task_id,
+                    agent_name=self.agent_name,
+                    status=TaskStatus.FAILED,
+                    error="No papers retrieved",
+                )
+            
             if len(papers) < self.min_papers:
                 logger.warning(
                     f"Found only {len(papers)} papers, below minimum of {self.min_papers}"
                 )
             
             # Step 2: Rank and filter papers
-            ranked_papers = await self._rank_papers(papers, topic, key_points)
+            ranked_papers = await self._rank_papers(papers, topic, key_points, current_year)
             selected_papers = ranked_papers[:self.max_papers]
             logger.info(f"Selected top {len(selected_papers)} papers for analysis")
             
-            # Step 3: Analyze papers
-            analysis = await self._analyze_papers(selected_papers, topic, key_points)
-            logger.info("Paper analysis complete")
-            
-            # Step 4: Identify research gaps
-            research_gaps = await self._identify_research_gaps(
-                analysis, topic, key_points
-            )
-            logger.info(f"Identified {len(research_gaps)} research gaps")
+            # Steps 3-5: Analyze papers, identify research gaps and synthesize
+            # the review; prefer one combined call, making separate calls
+            # when that is disabled or its response can't be used. Too few
+            # papers to analyze gets the outline without any LLM calls.
+            analysis_skipped = len(selected_papers) < max(3, self.min_papers // 5)
+            generated = None
+            if analysis_skipped:
+                logger.warning(
+                    f"Only {len(selected_papers)} papers selected; skipping LLM analysis"
+                )
+                generated = ({}, [], self._fallback_review(selected_papers, [], topic))
+            elif not self._multi_call_mode:
+                generated = await self._generate_all(selected_papers, topic, key_points)
+                if generated is None:
+                    logger.warning("Combined literature review response unusable; generating parts separately")
             
-            # Step 5: Synthesize literature review content
-            review_content = await self._synthesize_review(
-                selected_papers, analysis, research_gaps, topic
-            )
+            if generated is not None:
+                analysis, research_gaps, review_content = generated
+                logger.info(f"Identified {len(research_gaps)} research gaps")
+            else:
+                # Step 3: Analyze papers
+                analysis = await self._analyze_papers(selected_papers, topic, key_points)
+                logger.info("Paper analysis complete")
+                
+                # Step 4: Identify research gaps
+                research_gaps = await self._identify_research_gaps(
+                    analysis, topic, key_points
+                )
+                logger.info(f"Identified {len(research_gaps)} research gaps")
+                
+                # Step 5: Synthesize literature review content
+                review_content = await self._synthesize_review(
+                    selected_papers, analysis, research_gaps, topic
+                )
             logger.info("Literature review synthesis complete")
             
             # Step 6: Extract citations
@@ -127,13 +181,14 @@ class LiteratureReviewAgent(BaseAgent):
                 "subsections": review_content["subsections"],
                 "papers_reviewed": len(selected_papers),
                 "research_gaps": [gap.model_dump() for gap in research_gaps],
-                "papers": [self._paper_to_dict(paper) for paper in selected_papers],
+                "papers": self._papers_to_dicts(selected_papers),
                 "citations": citations,
                 "metadata": {
                     "total_papers_found": len(papers),
                     "papers_analyzed": len(selected_papers),
                     "word_count": len(review_content["main_content"].split()),
                     "sources": ["semantic_scholar", "arxiv", "frontiers", "papers_with_code"],
+                    "analysis_skipped": analysis_skipped,
                 },
             }
             
@@ -164,19 +219,25 @@ class LiteratureReviewAgent(BaseAgent):
     
     async def _cleanup_mcp_sessions(self) -> None:
         """Clean up MCP server HTTP sessions."""
-        try:
-            await self.semantic_scholar.disconnect()
-            await self.arxiv.disconnect()
-            await self.frontiers.disconnect()
-            await self.papers_with_code.disconnect()
-        except Exception as e:
-            logger.warning(f"Error cleaning up MCP sessions: {e}")
+        # Close all sessions at once; shielded so a cancelled request still
+        # finishes closing them
+        results = await asyncio.shield(asyncio.gather(
+            self.semantic_scholar.disconnect(),
+            self.arxiv.disconnect(),
+            self.frontiers.disconnect(),
+            self.papers_with_code.disconnect(),
+            return_exceptions=True,
+        ))
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error cleaning up MCP sessions: {result}")
     
     async def _search_papers(
         self,
         topic: str,
         key_points: List[str],
         preferences: Dict[str, Any],
+        current_year: Optional[int] = None,
     ) -> List[LiteraturePaper]:
         """
         Search for papers across multiple MCP servers.
@@ -185,6 +246,7 @@ class LiteratureReviewAgent(BaseAgent):
             topic: Research topic
             key_points: Key points to focus on
             preferences: User preferences (year range, etc.)
+            current_year: Year the default range ends at (defaults to now)
             
         Returns:
             List[LiteraturePaper]: Retrieved papers
@@ -193,97 +255,92 @@ class LiteratureReviewAgent(BaseAgent):
         queries = self._construct_search_queries(topic, key_points)
         
         # Prepare filters
-        current_year = datetime.now().year
+        current_year = current_year or datetime.now().year
         filters = {
             "year_from": preferences.get("year_from", current_year - 6),  # Last 6 years
             "year_to": preferences.get("year_to", current_year),
             "min_citations": preferences.get("min_citations", 5),
         }
         
-        # Search in parallel across all MCP servers
-        search_tasks = []
-        
-        # Semantic Scholar
-        for query in queries:
-            search_tasks.append(
-                self.semantic_scholar.search_papers(
-                    query=query,
-                    limit=20,
-                    filters=filters,
-                    use_cache=True,
-                )
-            )
-        
-        # arXiv
-        for query in queries:
-            search_tasks.append(
-                self.arxiv.search_papers(
-                    query=query,
-                    limit=15,
-                    filters=filters,
-                    use_cache=True,
-                )
-            )
-        
-        # Frontiers
-        for query in queries:
-            search_tasks.append(
-                self.frontiers.search_papers(
-                    query=query,
-                    limit=10,
-                    filters=filters,
-                    use_cache=True,
-                )
-            )
-        
-        # Papers With Code (for papers with implementations)
-        for query in queries:
-            search_tasks.append(
-                self.papers_with_code.search_papers(
-                    query=query,
-                    limit=15,
-                    filters=filters,
-                    use_cache=True,
-                )
-            )
+        # Search in parallel across all MCP servers, one batch of queries
+        # per server (per-query limits: 20, 15, 10 and 15 papers)
+        search_tasks = [
+            self.semantic_scholar.search_papers_batch(queries, limit=20, filters=filters, use_cache=True),
+            self.arxiv.search_papers_batch(queries, limit=15, filters=filters, use_cache=True),
+            self.frontiers.search_papers_batch(queries, limit=10, filters=filters, use_cache=True),
+            # Papers With Code (for papers with implementations)
+            self.papers_with_code.search_papers_batch(queries, limit=15, filters=filters, use_cache=True),
+        ]
+        
+        logger.info(f"Searching 4 sources with {len(queries)} queries each")
+        
+        # Deduplicate results as each source completes, and stop waiting once
+        # there are plenty of candidates for ranking
+        all_papers: List[LiteraturePaper] = []
+        seen_titles: Set[str] = set()
+        seen_dois: Set[str] = set()
+        enough = self.max_papers * 3
+        
+        tasks = [asyncio.ensure_future(task) for task in search_tasks]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                try:
+                    result = await next_result
+                except Exception as e:
+                    logger.warning(f"Search error: {e}")
+                    continue
+                self._ingest_result(result, seen_titles, seen_dois, all_papers)
+                if len(all_papers) >= enough:
+                    logger.info(f"Collected {len(all_papers)} candidates; skipping remaining searches")
+                    break
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
         
-        logger.info(f"Executing {len(search_tasks)} parallel search queries across 4 sources")
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        logger.info(f"Found {len(all_papers)} unique papers after deduplication")
+        return all_papers
+    
+    def _ingest_result(
+        self,
+        result: Any,
+        seen_titles: Set[str],
+        seen_dois: Set[str],
+        all_papers: List[LiteraturePaper],
+    ) -> None:
+        """
+        Add the new papers from one search result to ``all_papers``.
         
-        # Collect and deduplicate papers
-        all_papers = []
-        seen_titles = set()
-        seen_dois = set()
+        Args:
+            result: MCPResponse from a search
+            seen_titles: Title keys already collected (updated in place)
+            seen_dois: Lowercase DOIs already collected (updated in place)
+            all_papers: Collected papers (appended to in place)
+        """
+        if not result.success:
+            logger.warning(f"Search failed: {result.error}")
+            return
         
-        for result in results:
-            if isinstance(result, Exception):
-                logger.warning(f"Search error: {result}")
+        for paper_data in result.data:
+            # Convert to LiteraturePaper
+            paper = self._dict_to_paper(paper_data)
+            
+            # Deduplicate by title and DOI, ignoring case, punctuation
+            # and spacing differences between sources
+            title_key = _title_key(paper.title)
+            if title_key in seen_titles:
                 continue
             
-            if not result.success:
-                logger.warning(f"Search failed: {result.error}")
+            doi = paper.doi.lower() if paper.doi else None
+            if doi and doi in seen_dois:
                 continue
             
-            for paper_data in result.data:
-                # Convert to LiteraturePaper
-                paper = self._dict_to_paper(paper_data)
-                
-                # Deduplicate by title and DOI
-                title_lower = paper.title.lower().strip()
-                if title_lower in seen_titles:
-                    continue
-                
-                if paper.doi and paper.doi in seen_dois:
-                    continue
-                
-                seen_titles.add(title_lower)
-                if paper.doi:
-                    seen_dois.add(paper.doi)
-                
-                all_papers.append(paper)
-        
-        logger.info(f"Found {len(all_papers)} unique papers after deduplication")
-        return all_papers
+            seen_titles.add(title_key)
+            if doi:
+                seen_dois.add(doi)
+            
+            all_papers.append(paper)
     
     def _construct_search_queries(
         self,
@@ -313,6 +370,7 @@ class LiteratureReviewAgent(BaseAgent):
         papers: List[LiteraturePaper],
         topic: str,
         key_points: List[str],
+        current_year: Optional[int] = None,
     ) -> List[LiteraturePaper]:
         """
         Rank papers by relevance to topic and key points.
@@ -321,6 +379,7 @@ class LiteratureReviewAgent(BaseAgent):
             papers: List of papers to rank
             topic: Research topic
             key_points: Key points
+            current_year: Year paper ages are measured from (defaults to now)
             
         Returns:
             List[LiteraturePaper]: Sorted papers (most relevant first)
@@ -330,24 +389,24 @@ class LiteratureReviewAgent(BaseAgent):
         # Calculate relevance scores
         scored_papers = []
         
-        topic_keywords = set(topic.lower().split())
-        key_point_keywords = set()
-        for point in key_points:
-            key_point_keywords.update(point.lower().split())
+        topic_keywords = frozenset(topic.lower().split())
+        key_point_keywords = frozenset().union(*(point.lower().split() for point in key_points))
+        current_year = current_year or datetime.now().year
         
         for paper in papers:
             score = 0.0
             
             # Title relevance (30%)
-            title_words = set(paper.title.lower().split())
-            title_overlap = len(title_words & topic_keywords)
+            # Overlaps probe the small keyword sets with each token instead
+            # of building a set of every word in the paper
+            title_overlap = len(topic_keywords.intersection(paper.title.lower().split()))
             score += title_overlap * 0.3
             
             # Abstract relevance (40%)
             if paper.abstract:
-                abstract_words = set(paper.abstract.lower().split())
-                abstract_overlap = len(abstract_words & topic_keywords)
-                abstract_key_overlap = len(abstract_words & key_point_keywords)
+                abstract_words = paper.abstract.lower().split()
+                abstract_overlap = len(topic_keywords.intersection(abstract_words))
+                abstract_key_overlap = len(key_point_keywords.intersection(abstract_words))
                 score += (abstract_overlap * 0.3) + (abstract_key_overlap * 0.1)
             
             # Citation count (20%)
@@ -355,7 +414,6 @@ class LiteratureReviewAgent(BaseAgent):
             score += citation_score * 0.2
             
             # Recency (10%)
-            current_year = datetime.now().year
             if paper.year:
                 age = current_year - paper.year
                 recency_score = max(0, 1 - (age / 10))  # Papers older than 10 years get 0
@@ -375,6 +433,115 @@ class LiteratureReviewAgent(BaseAgent):
         
         return ranked_papers
     
+    def _summarize_papers(self, papers: List[LiteraturePaper]) -> str:
+        """Prompt text summarizing the top 20 papers, the ones analyzed in detail."""
+        return "\n".join(
+            f"""
+Paper {i}:
+Title: {paper.title}
+Authors: {', '.join(paper.authors[:3])}
+Year: {paper.year}
+Citations: {paper.citation_count}
+Abstract: {paper.abstract[:500] if paper.abstract else 'N/A'}
+"""
+            for i, paper in enumerate(papers[:20], 1)
+        )
+    
+    async def _generate_all(
+        self,
+        papers: List[LiteraturePaper],
+        topic: str,
+        key_points: List[str],
+    ) -> Optional[Tuple[Dict[str, Any], List[ResearchGap], Dict[str, Any]]]:
+        """
+        Analyze papers, identify gaps and synthesize the review in one LLM call.
+        
+        The paper summaries are sent once instead of once per step.
+        
+        Args:
+            papers: Papers to review
+            topic: Research topic
+            key_points: Key points of interest
+            
+        Returns:
+            Tuple of (analysis, research_gaps, review_content), or None if the
+            response is not usable
+        """
+        logger.info(f"Reviewing {len(papers)} papers in one call")
+        
+        prompt = f"""
+You are writing the literature review for a research proposal on: {topic}
+
+Key points of interest:
+{chr(10).join(f"- {point}" for point in key_points)}
+
+Papers to review ({len(papers)} selected; the top {min(len(papers), 20)} are listed):
+{self._summarize_papers(papers)}
+
+Produce, in one response:
+1. analysis: the main themes and trends, key methodologies, common findings,
+   limitations in existing research, and areas where research is lacking or
+   contradictory (lists of strings under themes, methodologies, findings,
+   limitations, gaps)
+2. gaps: 3-5 specific, actionable research gaps that are clearly not addressed
+   by existing literature, significant to the field, feasible to research and
+   aligned with the key points; each with title, description, significance
+   and current_state
+3. review: the literature review itself, in academic style (3rd person,
+   formal tone), organized into themes/subsections, with in-text citations
+   (Author, Year), paraphrased (no direct quotes), synthesizing findings
+   rather than listing papers and building a narrative that leads to the
+   research gaps; target 2000-2500 words
+
+Format as JSON:
+{{
+  "analysis": {{"themes": [], "methodologies": [], "findings": [], "limitations": [], "gaps": []}},
+  "gaps": [{{"title": "...", "description": "...", "significance": "...", "current_state": "..."}}],
+  "review": {{
+    "main_content": "Introduction paragraph...",
+    "subsections": [
+      {{"title": "Theme 1", "content": "..."}},
+      {{"title": "Theme 2", "content": "..."}}
+    ]
+  }}
+}}
+"""
+        
+        # A failed combined call falls back to the separate calls rather
+        # than failing the review
+        try:
+            response = await self.generate_with_cache(
+                prompt=prompt,
+                max_tokens=min(_COMBINED_MAX_TOKENS, self.agent_config.max_tokens),
+                temperature=0.7,
+                validate=self._parse_combined,
+            )
+        except Exception as e:
+            logger.warning(f"Combined literature review call failed: {e}")
+            return None
+        
+        try:
+            return self._parse_combined(response)
+        except ValueError:
+            return None
+    
+    def _parse_combined(self, response: str) -> Tuple[Dict[str, Any], List[ResearchGap], Dict[str, Any]]:
+        """
+        Parse a combined response into (analysis, research_gaps, review).
+        
+        Raises:
+            ValueError: If the response is not a JSON object with every part
+        """
+        generated = parse_json_response(response)
+        if not isinstance(generated, dict):
+            raise ValueError("expected a JSON object")
+        analysis = generated.get("analysis")
+        if not isinstance(analysis, dict):
+            raise ValueError("expected an analysis object")
+        research_gaps = self._gaps_from_data(generated.get("gaps"))
+        review = self._parse_review_data(generated.get("review"))
+        return analysis, research_gaps, review
+    
     async def _analyze_papers(
         self,
         papers: List[LiteraturePaper],
@@ -395,17 +562,7 @@ class LiteratureReviewAgent(BaseAgent):
         logger.info(f"Analyzing {len(papers)} papers")
         
         # Prepare paper summaries for LLM
-        paper_summaries = []
-        for i, paper in enumerate(papers[:20], 1):  # Analyze top 20 in detail
-            summary = f"""
-Paper {i}:
-Title: {paper.title}
-Authors: {', '.join(paper.authors[:3])}
-Year: {paper.year}
-Citations: {paper.citation_count}
-Abstract: {paper.abstract[:500] if paper.abstract else 'N/A'}
-"""
-            paper_summaries.append(summary)
+        paper_summaries = self._summarize_papers(papers)
         
         # Use LLM to analyze papers
         analysis_prompt = f"""
@@ -415,7 +572,7 @@ Key points of interest:
 {chr(10).join(f"- {point}" for point in key_points)}
 
 Papers to analyze:
-{chr(10).join(paper_summaries)}
+{paper_summaries}
 
 Provide a comprehensive analysis including:
 1. Main themes and trends across papers
@@ -427,16 +584,17 @@ Provide a comprehensive analysis including:
 Format your response as JSON with these keys: themes, methodologies, findings, limitations, gaps
 """
         
-        analysis_response = await self.generate_with_retry(
+        analysis_response = await self.generate_with_cache(
             prompt=analysis_prompt,
             max_tokens=4000,
+            validate=self._parse_analysis,
         )
         
         # Parse LLM response
         try:
-            import json
-            analysis = json.loads(analysis_response)
-        except:
+            analysis = self._parse_analysis(analysis_response)
+        except ValueError as e:
+            logger.warning(f"Could not parse analysis response: {e}")
             # Fallback to basic structure if parsing fails
             analysis = {
                 "themes": ["Unable to parse detailed themes"],
@@ -448,6 +606,13 @@ Format your response as JSON with these keys: themes, methodologies, findings, l
         
         return analysis
     
+    def _parse_analysis(self, response: str) -> Dict[str, Any]:
+        """Parse an analysis response, raising ValueError unless it is a JSON object."""
+        analysis = parse_json_response(response)
+        if not isinstance(analysis, dict):
+            raise ValueError("expected a JSON object")
+        return analysis
+    
     async def _identify_research_gaps(
         self,
         analysis: Dict[str, Any],
@@ -492,27 +657,18 @@ For each gap, provide:
 Format as JSON array with objects containing: title, description, significance, current_state
 """
         
-        gaps_response = await self.generate_with_retry(
+        gaps_response = await self.generate_with_cache(
             prompt=gap_prompt,
             max_tokens=2000,
+            validate=self._parse_gaps,
         )
         
         # Parse gaps
-        import uuid
         try:
-            import json
-            gaps_data = json.loads(gaps_response)
-            
-            research_gaps = []
-            for gap_dict in gaps_data:
-                gap = ResearchGap(
-                    gap_id=str(uuid.uuid4()),
-                    description=gap_dict.get("description", ""),
-                    significance=gap_dict.get("significance", ""),
-                )
-                research_gaps.append(gap)
+            research_gaps = self._parse_gaps(gaps_response)
         
-        except:
+        except ValueError as e:
+            logger.warning(f"Could not parse research gaps response: {e}")
             # Fallback gaps
             research_gaps = [
                 ResearchGap(
@@ -529,6 +685,30 @@ Format as JSON array with objects containing: title, description, significance,
         
         return research_gaps
     
+    def _parse_gaps(self, response: str) -> List[ResearchGap]:
+        """Parse a research gaps response, raising ValueError unless it is an array of objects."""
+        return self._gaps_from_data(parse_json_response(response))
+    
+    def _gaps_from_data(self, gaps_data: Any) -> List[ResearchGap]:
+        """
+        Convert gap objects from an LLM response to ResearchGap models.
+        
+        Raises:
+            ValueError: If ``gaps_data`` is not a list of objects
+        """
+        if not isinstance(gaps_data, list) or not all(isinstance(gap, dict) for gap in gaps_data):
+            raise ValueError("expected a JSON array of objects")
+        
+        research_gaps = []
+        for gap_dict in gaps_data:
+            gap = ResearchGap(
+                gap_id=str(uuid.uuid4()),
+                description=gap_dict.get("description", ""),
+                significance=gap_dict.get("significance", ""),
+            )
+            research_gaps.append(gap)
+        return research_gaps
+    
     async def _synthesize_review(
         self,
         papers: List[LiteraturePaper],
@@ -586,34 +766,54 @@ Format as JSON:
 }}
 """
         
-        review_response = await self.generate_with_retry(
+        review_response = await self.generate_with_cache(
             prompt=synthesis_prompt,
             max_tokens=6000,
             temperature=0.7,
+            validate=self._parse_review,
         )
         
         # Parse response
         try:
-            import json
-            review_content = json.loads(review_response)
-        except:
-            # Fallback structure
-            review_content = {
-                "main_content": f"This literature review examines recent research on {topic}, analyzing {len(papers)} papers to identify key themes, methodologies, and research gaps.",
-                "subsections": [
-                    {
-                        "title": "Overview of Current Research",
-                        "content": f"Analysis of {len(papers)} papers reveals several key themes in the literature.",
-                    },
-                    {
-                        "title": "Research Gaps",
-                        "content": f"Despite extensive research, {len(gaps)} significant gaps remain in the literature.",
-                    },
-                ],
-            }
+            review_content = self._parse_review(review_response)
+        except ValueError as e:
+            logger.warning(f"Could not parse review response: {e}")
+            review_content = self._fallback_review(papers, gaps, topic)
         
         return review_content
     
+    def _parse_review(self, response: str) -> Dict[str, Any]:
+        """Parse a review response, raising ValueError unless it has main_content."""
+        return self._parse_review_data(parse_json_response(response))
+    
+    def _parse_review_data(self, review: Any) -> Dict[str, Any]:
+        """Check parsed review data, raising ValueError unless it is an object with main_content."""
+        if not isinstance(review, dict) or not isinstance(review.get("main_content"), str):
+            raise ValueError("expected a JSON object with main_content")
+        review.setdefault("subsections", [])
+        return review
+    
+    def _fallback_review(
+        self,
+        papers: List[LiteraturePaper],
+        gaps: List[ResearchGap],
+        topic: str,
+    ) -> Dict[str, Any]:
+        """Outline review used when no synthesized review is available."""
+        return {
+            "main_content": f"This literature review examines recent research on {topic}, analyzing {len(papers)} papers to identify key themes, methodologies, and research gaps.",
+            "subsections": [
+                {
+                    "title": "Overview of Current Research",
+                    "content": f"Analysis of {len(papers)} papers reveals several key themes in the literature.",
+                },
+                {
+                    "title": "Research Gaps",
+                    "content": f"Despite extensive research, {len(gaps)} significant gaps remain in the literature.",
+                },
+            ],
+        }
+    
     def _dict_to_paper(self, paper_data: Dict[str, Any]) -> LiteraturePaper:
         """Convert dictionary to LiteraturePaper model."""
         return LiteraturePaper(
@@ -629,9 +829,9 @@ Format as JSON:
             source=paper_data.get("source", ""),
         )
     
-    def _paper_to_dict(self, paper: LiteraturePaper) -> Dict[str, Any]:
-        """Convert LiteraturePaper to dictionary."""
-        return paper.model_dump()
+    def _papers_to_dicts(self, papers: List[LiteraturePaper]) -> List[Dict[str, Any]]:
+        """Convert LiteraturePapers to dictionaries (``model_dump`` of each)."""
+        return _PAPERS_ADAPTER.dump_python(papers)
     
     def _extract_citations(self, papers: List[LiteraturePaper]) -> List[Dict[str, Any]]:
         """
@@ -643,10 +843,8 @@ Format as JSON:
         Returns:
             List of citation dictionaries
         """
-        citations = []
-        
-        for paper in papers:
-            citation = {
+        return [
+            {
                 "authors": paper.authors,
                 "year": paper.year,
                 "title": paper.title,
@@ -654,9 +852,8 @@ Format as JSON:
                 "doi": paper.doi,
                 "url": paper.url,
             }
-            citations.append(citation)
-        
-        return citations
+            for paper in papers
+        ]
     
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
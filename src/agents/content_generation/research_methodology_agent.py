@@ -2,16 +2,323 @@
 Research Methodology Agent - Designs comprehensive research methodology.
 """
 
+import asyncio
+import copy
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
-from src.agents.base_agent import BaseAgent
-from src.core.llm_provider import LLMProvider
+from src.agents.base_agent import BaseAgent, section_text
+from src.core.llm_provider import JSONTextStream, LLMProvider, parse_json_response
 from src.core.state_manager import StateManager
 from src.models.agent_messages import AgentRequest, AgentResponse, TaskStatus
 
 
+def _bulleted(items: List[str]) -> str:
+    """Format items as a dash-bulleted list, one per line."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+# Used in place of a design part whose LLM call fails or can't be parsed
+_DEFAULT_RESEARCH_DESIGN = {
+    "paradigm": "Quantitative",
+    "strategy": "Experimental design",
+    "time_horizon": "Cross-sectional",
+    "justification": "This approach aligns with the research objectives and questions",
+}
+_DEFAULT_DATA_COLLECTION = {
+    "primary_sources": ["Experimental data", "Survey responses"],
+    "secondary_sources": ["Published literature", "Public datasets"],
+    "sampling": {"method": "Random sampling", "size": "N=100"},
+    "instruments": ["Questionnaire", "Measurement tools"],
+    "procedure": [
+        "Participant recruitment",
+        "Data collection",
+        "Quality assurance",
+    ],
+}
+_DEFAULT_ANALYSIS_METHODS = {
+    "techniques": ["Descriptive statistics", "Regression analysis"],
+    "tools": ["Python (pandas, scikit-learn)", "R (tidyverse)"],
+    "workflow": [
+        "Data preprocessing",
+        "Exploratory analysis",
+        "Model development",
+        "Results interpretation",
+    ],
+    "validation": ["Cross-validation", "Statistical significance testing"],
+}
+_DEFAULT_EXPERIMENTAL_SETUP = {
+    "variables": {
+        "independent": ["Treatment variable"],
+        "dependent": ["Outcome measure"],
+        "control": ["Confounding variables"],
+    },
+    "conditions": ["Control condition", "Treatment condition"],
+    "measurements": ["Primary outcome", "Secondary outcomes"],
+    "resources": ["Laboratory equipment", "Computing resources"],
+}
+_DEFAULT_ETHICAL_CONSIDERATIONS = [
+    "Informed consent will be obtained from all participants",
+    "Data will be anonymized to protect participant privacy",
+    "Ethical approval will be sought from the institutional review board",
+    "Participants can withdraw at any time without penalty",
+]
+
+# JSON schemas handed to providers with structured-output support
+_STRINGS_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+
+def _object_schema(**properties: Any) -> Dict[str, Any]:
+    """Schema for an object whose listed properties are all required."""
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+
+_STRING = {"type": "string"}
+_RESEARCH_DESIGN_SCHEMA = _object_schema(
+    paradigm=_STRING, strategy=_STRING, time_horizon=_STRING, justification=_STRING,
+)
+_DATA_COLLECTION_SCHEMA = _object_schema(
+    primary_sources=_STRINGS_SCHEMA,
+    secondary_sources=_STRINGS_SCHEMA,
+    sampling=_object_schema(method=_STRING, size=_STRING),
+    instruments=_STRINGS_SCHEMA,
+    procedure=_STRINGS_SCHEMA,
+)
+_ANALYSIS_METHODS_SCHEMA = _object_schema(
+    techniques=_STRINGS_SCHEMA, tools=_STRINGS_SCHEMA, workflow=_STRINGS_SCHEMA, validation=_STRINGS_SCHEMA,
+)
+_EXPERIMENTAL_SETUP_SCHEMA = _object_schema(
+    variables=_object_schema(
+        independent=_STRINGS_SCHEMA, dependent=_STRINGS_SCHEMA, control=_STRINGS_SCHEMA,
+    ),
+    conditions=_STRINGS_SCHEMA,
+    measurements=_STRINGS_SCHEMA,
+    resources=_STRINGS_SCHEMA,
+)
+_ETHICAL_CONSIDERATIONS_SCHEMA = {**_STRINGS_SCHEMA, "minItems": 4, "maxItems": 6}
+_METHODOLOGY_SCHEMA = _object_schema(
+    main_content=_STRING,
+    subsections={"type": "array", "items": _object_schema(title=_STRING, content=_STRING)},
+)
+
+
+# Task prompts for the design parts; str.format templates filled from the
+# topic and the bulleted objectives and research questions, so literal
+# braces are doubled
+_RESEARCH_DESIGN_TASK = """
+Design a comprehensive research approach for: {topic}
+
+Research Objectives:
+{objectives}
+
+Research Questions:
+{research_questions}
+
+Specify:
+1. Research paradigm (e.g., positivist, interpretivist, mixed methods)
+2. Research strategy (e.g., experimental, survey, case study)
+3. Time horizon (cross-sectional vs longitudinal)
+4. Justification for approach
+
+Format as JSON:
+{{
+  "paradigm": "...",
+  "strategy": "...",
+  "time_horizon": "...",
+  "justification": "..."
+}}
+"""
+
+_DATA_COLLECTION_TASK = """
+Design data collection methods for research on: {topic}
+
+Objectives:
+{objectives}
+
+Specify:
+1. Primary data sources
+2. Secondary data sources
+3. Sampling method and size
+4. Data collection instruments
+5. Data collection procedure (step-by-step)
+
+Format as JSON:
+{{
+  "primary_sources": ["...", "..."],
+  "secondary_sources": ["...", "..."],
+  "sampling": {{"method": "...", "size": "..."}},
+  "instruments": ["...", "..."],
+  "procedure": ["Step 1...", "Step 2..."]
+}}
+"""
+
+_ANALYSIS_METHODS_TASK = """
+Design data analysis methods for: {topic}
+
+Research Questions:
+{research_questions}
+
+Specify:
+1. Statistical/analytical techniques
+2. Software/tools to be used
+3. Analysis workflow
+4. Validation methods
+
+Format as JSON:
+{{
+  "techniques": ["...", "..."],
+  "tools": ["...", "..."],
+  "workflow": ["Step 1...", "Step 2..."],
+  "validation": ["...", "..."]
+}}
+"""
+
+_EXPERIMENTAL_SETUP_TASK = """
+Design experimental setup for: {topic}
+
+Objectives:
+{objectives}
+
+Specify:
+1. Variables (independent, dependent, control)
+2. Experimental conditions
+3. Measurement procedures
+4. Equipment/resources needed
+
+Format as JSON:
+{{
+  "variables": {{
+    "independent": ["...", "..."],
+    "dependent": ["...", "..."],
+    "control": ["...", "..."]
+  }},
+  "conditions": ["Condition 1...", "Condition 2..."],
+  "measurements": ["...", "..."],
+  "resources": ["...", "..."]
+}}
+"""
+
+_ETHICAL_CONSIDERATIONS_TASK = """
+Identify key ethical considerations for research on: {topic}
+
+Include:
+1. Participant rights and welfare
+2. Informed consent procedures
+3. Data privacy and confidentiality
+4. Risk mitigation strategies
+5. Institutional review requirements
+
+Format as JSON array of strings (4-6 considerations).
+"""
+
+# Task prompt for the full section, filled from the generated design parts;
+# the experimental setup subsection is only requested when one was designed
+_SYNTHESIS_TASK = """
+Write a comprehensive methodology section for research on: {topic}
+
+Research Design:
+- Paradigm: {paradigm}
+- Strategy: {strategy}
+- Time Horizon: {time_horizon}
+
+Data Collection:
+- Sampling: {sampling_method} (n={sampling_size})
+- Sources: {sources}
+
+Analysis Methods:
+- Techniques: {techniques}
+- Tools: {tools}
+
+Requirements:
+1. Write in academic style (3rd person, future tense)
+2. Organize into clear subsections
+3. Provide detailed procedures
+4. Justify methodological choices
+5. Include ethical considerations
+6. Target 2500-3000 words
+
+Format as JSON:
+{{
+  "main_content": "Overview paragraph...",
+  "subsections": [
+    {{"title": "Research Design", "content": "..."}},
+    {{"title": "Data Collection", "content": "..."}},
+    {{"title": "Data Analysis", "content": "..."}},
+{experimental_setup_subsection}    {{"title": "Ethical Considerations", "content": "..."}}
+  ]
+}}
+"""
+
+_EXPERIMENTAL_SETUP_SUBSECTION = """    {"title": "Experimental Setup", "content": "..."},
+"""
+
+# Research strategies that call for an experimental setup, matched as
+# substrings of the designed strategy
+_EXPERIMENTAL_STRATEGIES = ("experiment", "mixed method")
+
+
+def _is_experimental(research_design: Dict[str, Any]) -> bool:
+    """Whether a research design needs an experimental setup; unclear strategies do."""
+    strategy = research_design.get("strategy")
+    if not isinstance(strategy, str) or not strategy.strip():
+        return True
+    strategy = strategy.lower()
+    return any(keyword in strategy for keyword in _EXPERIMENTAL_STRATEGIES)
+
+
+def _parse_methodology(response: str) -> Dict[str, Any]:
+    """
+    Parse a synthesized methodology section.
+    
+    Raises:
+        ValueError: If the response is not a JSON object with string
+            main_content and a subsections list
+    """
+    methodology = parse_json_response(response)
+    if not isinstance(methodology, dict) or not isinstance(methodology.get("main_content"), str):
+        raise ValueError("expected a JSON object with main_content")
+    methodology.setdefault("subsections", [])
+    if not isinstance(methodology["subsections"], list):
+        raise ValueError("expected subsections to be a JSON array")
+    return methodology
+
+
+@dataclass(frozen=True)
+class _DesignPart:
+    """One independently generated part of the methodology design."""
+    
+    key: str
+    template: str
+    max_tokens: int
+    schema: Dict[str, Any]
+    default: Any
+    
+    def parse(self, response: str) -> Any:
+        """Parse a response for this part, raising ValueError unless it has the default's type."""
+        result = parse_json_response(response)
+        if not isinstance(result, type(self.default)):
+            raise ValueError(f"expected a JSON {type(self.default).__name__}")
+        return result
+
+
+_DESIGN_PARTS = (
+    _DesignPart("research_design", _RESEARCH_DESIGN_TASK, 800, _RESEARCH_DESIGN_SCHEMA, _DEFAULT_RESEARCH_DESIGN),
+    _DesignPart("data_collection", _DATA_COLLECTION_TASK, 1000, _DATA_COLLECTION_SCHEMA, _DEFAULT_DATA_COLLECTION),
+    _DesignPart("analysis_methods", _ANALYSIS_METHODS_TASK, 800, _ANALYSIS_METHODS_SCHEMA, _DEFAULT_ANALYSIS_METHODS),
+    _DesignPart(
+        "ethical_considerations", _ETHICAL_CONSIDERATIONS_TASK, 600,
+        _ETHICAL_CONSIDERATIONS_SCHEMA, _DEFAULT_ETHICAL_CONSIDERATIONS,
+    ),
+)
+
+# Generated only once the research design shows it is needed
+_EXPERIMENTAL_SETUP_PART = _DesignPart(
+    "experimental_setup", _EXPERIMENTAL_SETUP_TASK, 800, _EXPERIMENTAL_SETUP_SCHEMA, _DEFAULT_EXPERIMENTAL_SETUP,
+)
+
+
 class ResearchMethodologyAgent(BaseAgent):
     """
     Research Methodology Agent - Creates detailed methodology section.
@@ -50,7 +357,11 @@ class ResearchMethodologyAgent(BaseAgent):
         Execute methodology generation.
         
         Args:
-            request: Agent request containing topic, objectives, research questions
+            request: Agent request containing topic, objectives, research questions.
+                An ``on_token`` callable in ``request.context`` receives the
+                methodology's text as it is written; ``on_restart`` is called
+                before text already received is replaced (see
+                ``BaseAgent.section_stream``).
             
         Returns:
             AgentResponse with methodology content and metadata
@@ -66,37 +377,34 @@ class ResearchMethodologyAgent(BaseAgent):
             
             logger.info(f"Generating methodology for: {topic}")
             
-            # Design research approach
-            research_design = await self._design_research_approach(
-                topic, objectives, research_questions
-            )
-            logger.info("Research design complete")
-            
-            # Data collection methods
-            data_collection = await self._design_data_collection(
-                topic, objectives
-            )
-            logger.info("Data collection methods designed")
-            
-            # Analysis procedures
-            analysis_methods = await self._design_analysis_methods(
-                topic, research_questions
-            )
-            logger.info("Analysis methods designed")
-            
-            # Experimental setup
-            experimental_setup = await self._design_experimental_setup(
-                topic, objectives
-            )
-            logger.info("Experimental setup designed")
+            # The bullet lists are formatted once so every prompt embeds
+            # identical text
+            context = {
+                "topic": topic,
+                "objectives": _bulleted(objectives),
+                "research_questions": _bulleted(research_questions),
+            }
             
-            # Ethical considerations
-            ethical_considerations = await self._generate_ethical_considerations(
-                topic
+            # The design parts only depend on the inputs, so request them
+            # concurrently; the experimental setup waits for the research
+            # design, which decides whether one is needed at all
+            tasks = {
+                part.key: asyncio.ensure_future(self._generate_part(part, context))
+                for part in _DESIGN_PARTS
+            }
+            tasks["experimental_setup"] = asyncio.ensure_future(
+                self._generate_experimental_setup(tasks["research_design"], context)
             )
-            logger.info("Ethical considerations generated")
+            design = dict(zip(tasks, await asyncio.gather(*tasks.values())))
+            research_design = design["research_design"]
+            data_collection = design["data_collection"]
+            analysis_methods = design["analysis_methods"]
+            experimental_setup = design["experimental_setup"]
+            ethical_considerations = design["ethical_considerations"]
+            logger.info("Research design, procedures and ethical considerations complete")
             
             # Synthesize complete methodology
+            stream = self.section_stream(request.context)
             methodology_content = await self._synthesize_methodology(
                 topic,
                 research_design,
@@ -104,7 +412,13 @@ class ResearchMethodologyAgent(BaseAgent):
                 analysis_methods,
                 experimental_setup,
                 ethical_considerations,
+                stream,
             )
+            if stream is not None:
+                # A fallback methodology differs from what streamed
+                stream.finish(section_text(
+                    methodology_content["main_content"], methodology_content["subsections"]
+                ))
             logger.info("Methodology synthesis complete")
             
             # Prepare output
@@ -146,249 +460,40 @@ class ResearchMethodologyAgent(BaseAgent):
                 error_details={"exception_type": type(e).__name__},
             )
     
-    async def _design_research_approach(
-        self,
-        topic: str,
-        objectives: List[str],
-        research_questions: List[str],
-    ) -> Dict[str, Any]:
-        """Design overall research approach."""
-        
-        prompt = f"""
-Design a comprehensive research approach for: {topic}
-
-Research Objectives:
-{chr(10).join(f"- {obj}" for obj in objectives)}
-
-Research Questions:
-{chr(10).join(f"- {q}" for q in research_questions)}
-
-Specify:
-1. Research paradigm (e.g., positivist, interpretivist, mixed methods)
-2. Research strategy (e.g., experimental, survey, case study)
-3. Time horizon (cross-sectional vs longitudinal)
-4. Justification for approach
-
-Format as JSON:
-{{
-  "paradigm": "...",
-  "strategy": "...",
-  "time_horizon": "...",
-  "justification": "..."
-}}
-"""
-        
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=800,
-            temperature=0.7,
-        )
+    async def _generate_part(self, part: _DesignPart, context: Dict[str, str]) -> Any:
+        """Generate one design part, falling back to its default if the call fails or is unusable."""
         
         try:
-            import json
-            return json.loads(response)
-        except:
-            return {
-                "paradigm": "Quantitative",
-                "strategy": "Experimental design",
-                "time_horizon": "Cross-sectional",
-                "justification": "This approach aligns with the research objectives and questions",
-            }
-    
-    async def _design_data_collection(
-        self,
-        topic: str,
-        objectives: List[str],
-    ) -> Dict[str, Any]:
-        """Design data collection methods."""
-        
-        prompt = f"""
-Design data collection methods for research on: {topic}
-
-Objectives:
-{chr(10).join(f"- {obj}" for obj in objectives)}
-
-Specify:
-1. Primary data sources
-2. Secondary data sources
-3. Sampling method and size
-4. Data collection instruments
-5. Data collection procedure (step-by-step)
-
-Format as JSON:
-{{
-  "primary_sources": ["...", "..."],
-  "secondary_sources": ["...", "..."],
-  "sampling": {{"method": "...", "size": "..."}},
-  "instruments": ["...", "..."],
-  "procedure": ["Step 1...", "Step 2..."]
-}}
-"""
-        
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=1000,
-            temperature=0.7,
-        )
+            response = await self.generate_with_cache(
+                prompt=part.template.format_map(context),
+                max_tokens=part.max_tokens,
+                temperature=0.7,
+                response_schema=part.schema,
+                validate=part.parse,
+            )
+        except Exception as e:
+            logger.warning(f"Generating {part.key.replace('_', ' ')} failed, using defaults: {e}")
+            return copy.deepcopy(part.default)
         
         try:
-            import json
-            return json.loads(response)
-        except:
-            return {
-                "primary_sources": ["Experimental data", "Survey responses"],
-                "secondary_sources": ["Published literature", "Public datasets"],
-                "sampling": {"method": "Random sampling", "size": "N=100"},
-                "instruments": ["Questionnaire", "Measurement tools"],
-                "procedure": [
-                    "Participant recruitment",
-                    "Data collection",
-                    "Quality assurance",
-                ],
-            }
-    
-    async def _design_analysis_methods(
-        self,
-        topic: str,
-        research_questions: List[str],
-    ) -> Dict[str, Any]:
-        """Design analysis methods."""
+            return part.parse(response)
+        except ValueError as e:
+            logger.warning(f"Could not parse {part.key.replace('_', ' ')} response: {e}")
         
-        prompt = f"""
-Design data analysis methods for: {topic}
-
-Research Questions:
-{chr(10).join(f"- {q}" for q in research_questions)}
-
-Specify:
-1. Statistical/analytical techniques
-2. Software/tools to be used
-3. Analysis workflow
-4. Validation methods
-
-Format as JSON:
-{{
-  "techniques": ["...", "..."],
-  "tools": ["...", "..."],
-  "workflow": ["Step 1...", "Step 2..."],
-  "validation": ["...", "..."]
-}}
-"""
-        
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=800,
-            temperature=0.7,
-        )
-        
-        try:
-            import json
-            return json.loads(response)
-        except:
-            return {
-                "techniques": ["Descriptive statistics", "Regression analysis"],
-                "tools": ["Python (pandas, scikit-learn)", "R (tidyverse)"],
-                "workflow": [
-                    "Data preprocessing",
-                    "Exploratory analysis",
-                    "Model development",
-                    "Results interpretation",
-                ],
-                "validation": ["Cross-validation", "Statistical significance testing"],
-            }
+        return copy.deepcopy(part.default)
     
-    async def _design_experimental_setup(
+    async def _generate_experimental_setup(
         self,
-        topic: str,
-        objectives: List[str],
+        research_design: "asyncio.Future[Dict[str, Any]]",
+        context: Dict[str, str],
     ) -> Dict[str, Any]:
-        """Design experimental setup."""
-        
-        prompt = f"""
-Design experimental setup for: {topic}
-
-Objectives:
-{chr(10).join(f"- {obj}" for obj in objectives)}
-
-Specify:
-1. Variables (independent, dependent, control)
-2. Experimental conditions
-3. Measurement procedures
-4. Equipment/resources needed
-
-Format as JSON:
-{{
-  "variables": {{
-    "independent": ["...", "..."],
-    "dependent": ["...", "..."],
-    "control": ["...", "..."]
-  }},
-  "conditions": ["Condition 1...", "Condition 2..."],
-  "measurements": ["...", "..."],
-  "resources": ["...", "..."]
-}}
-"""
-        
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=800,
-            temperature=0.7,
-        )
-        
-        try:
-            import json
-            return json.loads(response)
-        except:
-            return {
-                "variables": {
-                    "independent": ["Treatment variable"],
-                    "dependent": ["Outcome measure"],
-                    "control": ["Confounding variables"],
-                },
-                "conditions": ["Control condition", "Treatment condition"],
-                "measurements": ["Primary outcome", "Secondary outcomes"],
-                "resources": ["Laboratory equipment", "Computing resources"],
-            }
-    
-    async def _generate_ethical_considerations(
-        self,
-        topic: str,
-    ) -> List[str]:
-        """Generate ethical considerations."""
-        
-        prompt = f"""
-Identify key ethical considerations for research on: {topic}
-
-Include:
-1. Participant rights and welfare
-2. Informed consent procedures
-3. Data privacy and confidentiality
-4. Risk mitigation strategies
-5. Institutional review requirements
-
-Format as JSON array of strings (4-6 considerations).
-"""
+        """Generate the experimental setup, or return {} if the research design needs none."""
         
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=600,
-            temperature=0.7,
-        )
-        
-        try:
-            import json
-            considerations = json.loads(response)
-            if isinstance(considerations, list):
-                return considerations
-        except:
-            pass
-        
-        return [
-            "Informed consent will be obtained from all participants",
-            "Data will be anonymized to protect participant privacy",
-            "Ethical approval will be sought from the institutional review board",
-            "Participants can withdraw at any time without penalty",
-        ]
+        design = await research_design
+        if not _is_experimental(design):
+            logger.info(f"Skipping experimental setup for {design['strategy']} design")
+            return {}
+        return await self._generate_part(_EXPERIMENTAL_SETUP_PART, context)
     
     async def _synthesize_methodology(
         self,
@@ -398,56 +503,47 @@ Format as JSON array of strings (4-6 considerations).
         analysis_methods: Dict[str, Any],
         experimental_setup: Dict[str, Any],
         ethical_considerations: List[str],
+        stream: Optional[JSONTextStream] = None,
     ) -> Dict[str, Any]:
         """Synthesize complete methodology section."""
         
-        prompt = f"""
-Write a comprehensive methodology section for research on: {topic}
-
-Research Design:
-- Paradigm: {research_design.get('paradigm', 'N/A')}
-- Strategy: {research_design.get('strategy', 'N/A')}
-- Time Horizon: {research_design.get('time_horizon', 'N/A')}
-
-Data Collection:
-- Sampling: {data_collection.get('sampling', {}).get('method', 'N/A')} (n={data_collection.get('sampling', {}).get('size', 'N/A')})
-- Sources: {', '.join(data_collection.get('primary_sources', []))}
-
-Analysis Methods:
-- Techniques: {', '.join(analysis_methods.get('techniques', []))}
-- Tools: {', '.join(analysis_methods.get('tools', []))}
-
-Requirements:
-1. Write in academic style (3rd person, future tense)
-2. Organize into clear subsections
-3. Provide detailed procedures
-4. Justify methodological choices
-5. Include ethical considerations
-6. Target 2500-3000 words
-
-Format as JSON:
-{{
-  "main_content": "Overview paragraph...",
-  "subsections": [
-    {{"title": "Research Design", "content": "..."}},
-    {{"title": "Data Collection", "content": "..."}},
-    {{"title": "Data Analysis", "content": "..."}},
-    {{"title": "Experimental Setup", "content": "..."}},
-    {{"title": "Ethical Considerations", "content": "..."}}
-  ]
-}}
-"""
+        sampling = data_collection.get("sampling", {})
+        prompt = _SYNTHESIS_TASK.format_map({
+            "topic": topic,
+            "paradigm": research_design.get("paradigm", "N/A"),
+            "strategy": research_design.get("strategy", "N/A"),
+            "time_horizon": research_design.get("time_horizon", "N/A"),
+            "sampling_method": sampling.get("method", "N/A"),
+            "sampling_size": sampling.get("size", "N/A"),
+            "sources": ", ".join(data_collection.get("primary_sources", [])),
+            "techniques": ", ".join(analysis_methods.get("techniques", [])),
+            "tools": ", ".join(analysis_methods.get("tools", [])),
+            "experimental_setup_subsection": _EXPERIMENTAL_SETUP_SUBSECTION if experimental_setup else "",
+        })
         
-        response = await self.generate_with_retry(
-            prompt=prompt,
-            max_tokens=6000,
-            temperature=0.7,
-        )
+        if stream is None:
+            response = await self.generate_with_cache(
+                prompt=prompt,
+                max_tokens=6000,
+                temperature=0.7,
+                response_schema=_METHODOLOGY_SCHEMA,
+                validate=_parse_methodology,
+            )
+        else:
+            # A caller watching the section being written gets it live,
+            # so the response isn't served from or stored in the cache
+            response = await self.generate_stream_with_retry(
+                prompt=prompt,
+                on_chunk=stream.feed,
+                max_tokens=6000,
+                temperature=0.7,
+                response_schema=_METHODOLOGY_SCHEMA,
+            )
         
         try:
-            import json
-            return json.loads(response)
-        except:
+            return _parse_methodology(response)
+        except ValueError as e:
+            logger.warning(f"Could not parse methodology response: {e}")
             # Fallback
             return {
                 "main_content": f"This section outlines the methodology for investigating {topic}.",
@@ -43,6 +43,7 @@ class Settings(BaseSettings):
     temperature: float = 0.7
     max_tokens: int = 4096
     max_retries: int = 3
+    llm_max_concurrency: int = 8
 
     # Academic Database APIs
     semantic_scholar_api_key: Optional[str] = None
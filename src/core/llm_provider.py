@@ -3,10 +3,13 @@ LLM Provider abstraction for multiple AI models.
 """
 
 import asyncio
+import json
+import re
+import weakref
 from abc import ABC, abstractmethod
 import os
-from functools import lru_cache
-from typing import Any, AsyncIterator, Dict, List, Optional
+from functools import cached_property, lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 try:
     from anthropic import Anthropic, AsyncAnthropic
@@ -40,9 +43,247 @@ except Exception:  # pragma: no cover - optional provider
     AsyncOpenAI = None
     OpenAI = None
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional faster JSON parser
+    orjson = None
+
 from src.core.config import get_settings
 
 
+# Body of a ```json ... ``` (or bare ```) fence in a model response
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Comma directly before a closing bracket, which JSON forbids
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+
+def parse_json_response(text: str) -> Any:
+    """
+    Parse the JSON value in an LLM response.
+
+    Models often wrap JSON in markdown fences or surround it with prose, so
+    this tries the whole response, then the first fenced block, then the
+    span from the first opening bracket to the last closing one. If none
+    parses, each is retried with trailing commas removed.
+
+    Raises:
+        ValueError: If none of those parse as JSON
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    candidates = [text.strip()]
+
+    fence = _JSON_FENCE_RE.search(text)
+    if fence:
+        candidates.append(fence.group(1))
+
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    end = max(text.rfind("}"), text.rfind("]"))
+    if starts and end > min(starts):
+        candidates.append(text[min(starts):end + 1])
+
+    for candidate in candidates:
+        try:
+            return loads(candidate)
+        except ValueError:
+            continue
+    for candidate in candidates:
+        try:
+            return loads(_TRAILING_COMMA_RE.sub(r"\1", candidate))
+        except ValueError:
+            continue
+    raise ValueError("No JSON value found in LLM response")
+
+
+class JSONTextStream:
+    """
+    Pass on the text of selected string fields from a streamed JSON response.
+
+    With structured output, providers stream the raw JSON of the reply
+    (``{"main_content": "Th``), not its text. Each fragment handed to
+    ``feed`` is parsed incrementally, and ``on_text`` receives the decoded
+    characters of string values stored under ``keys``, with a blank line
+    between values. Anything outside a JSON value, such as a markdown fence
+    or surrounding prose, is skipped.
+
+    ``restart`` and ``finish`` keep the caller's view in step with the
+    final result: once text has been passed on, ``on_restart`` is called
+    before a different text replaces it.
+    """
+
+    # Placed between the texts of consecutive values
+    SEPARATOR = "\n\n"
+
+    def __init__(
+        self,
+        on_text: Callable[[str], Any],
+        keys: "tuple[str, ...]",
+        on_restart: Optional[Callable[[], Any]] = None,
+    ):
+        self._on_text = on_text
+        self._on_restart = on_restart
+        self._keys = frozenset(keys)
+        self._emitted: List[str] = []
+        self._reset()
+
+    def _reset(self) -> None:
+        self._containers: List[str] = []  # "{" or "[" per open container
+        self._expect_key = False  # next string in the innermost object is a key
+        self._key = ""  # last key read, which the next value belongs to
+        self._string: Optional[List[str]] = None  # key being read, or None for a value
+        self._in_string = False
+        self._emitting = False
+        self._separate = False
+        self._escape = ""  # escape sequence read so far, from the backslash
+        self._high_surrogate = ""
+
+    @property
+    def text(self) -> str:
+        """Text passed on since the stream started or last restarted."""
+        return "".join(self._emitted)
+
+    def feed(self, chunk: str) -> None:
+        """Parse one streamed fragment, passing on any field text it completes."""
+        out: List[str] = []
+        for char in chunk:
+            if self._in_string:
+                self._string_char(char, out)
+            elif char == '"':
+                if self._containers:
+                    self._start_string(out)
+            elif char in "{[":
+                self._containers.append(char)
+                self._expect_key = char == "{"
+            elif char in "}]":
+                if self._containers:
+                    self._containers.pop()
+                self._expect_key = False
+            elif char == ":":
+                self._expect_key = False
+            elif char == ",":
+                self._expect_key = bool(self._containers) and self._containers[-1] == "{"
+        if out:
+            text = "".join(out)
+            self._emitted.append(text)
+            self._on_text(text)
+
+    def restart(self) -> None:
+        """Start over for a new attempt, signalling ``on_restart`` if text was passed on."""
+        if self._emitted and self._on_restart is not None:
+            self._on_restart()
+        self._emitted.clear()
+        self._reset()
+
+    def finish(self, text: str) -> None:
+        """Make sure the text passed on since the last restart is exactly ``text``."""
+        streamed = self.text
+        if streamed == text:
+            return
+        if not text.startswith(streamed):
+            self.restart()
+            streamed = ""
+        self._emitted.append(text[len(streamed):])
+        self._on_text(text[len(streamed):])
+
+    def _start_string(self, out: List[str]) -> None:
+        self._in_string = True
+        if self._containers[-1] == "{" and self._expect_key:
+            self._string = []
+            return
+        self._string = None
+        self._emitting = self._containers[-1] == "{" and self._key in self._keys
+        # A blank line goes before this value's text if anything came earlier
+        self._separate = self._emitting and bool(self._emitted or out)
+
+    def _string_char(self, char: str, out: List[str]) -> None:
+        if self._escape:
+            self._escape += char
+            if self._escape[1] == "u" and len(self._escape) < 6:
+                return
+            try:
+                decoded = json.loads(f'"{self._escape}"')
+            except ValueError:
+                decoded = ""  # not a valid escape; drop it rather than fail the stream
+            self._escape = ""
+            if "\ud800" <= decoded <= "\udbff":
+                self._high_surrogate = decoded
+                return
+            if self._high_surrogate:
+                decoded = (self._high_surrogate + decoded).encode("utf-16", "surrogatepass").decode("utf-16")
+                self._high_surrogate = ""
+            self._put(decoded, out)
+        elif char == "\\":
+            self._escape = char
+        elif char == '"':
+            self._in_string = False
+            if self._string is not None:
+                self._key = "".join(self._string)
+                self._string = None
+            self._emitting = False
+        else:
+            self._put(char, out)
+
+    def _put(self, text: str, out: List[str]) -> None:
+        if self._string is not None:
+            self._string.append(text)
+        elif self._emitting:
+            if self._separate:
+                out.append(self.SEPARATOR)
+                self._separate = False
+            out.append(text)
+
+
+def _schema_envelope(schema: Dict[str, Any]) -> "tuple[Dict[str, Any], Optional[str]]":
+    """
+    Wrap a JSON schema so its root is an object.
+
+    Tool inputs and structured outputs must be objects, so array (or scalar)
+    schemas are nested under a ``value`` property. Returns the object schema
+    and the key to unwrap, or None when the schema was already an object.
+    """
+    if schema.get("type") == "object":
+        return schema, None
+    return {"type": "object", "properties": {"value": schema}, "required": ["value"]}, "value"
+
+
+# One async SDK client per API key and event loop. Each wraps an HTTP
+# connection pool, so providers for different models or temperatures reuse
+# warm connections instead of opening their own. Pooled connections belong
+# to the loop that opened them, so each loop (a later asyncio.run, a test's
+# loop) gets its own clients.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_client(client_cls: Any, api_key: Optional[str]) -> Any:
+    """The running loop's ``client_cls`` client for ``api_key``, created on first use."""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get((client_cls, api_key))
+    if client is None:
+        client = clients[(client_cls, api_key)] = client_cls(api_key=api_key)
+    return client
+
+
+async def _close_loop_client(client_cls: Any, api_key: Optional[str]) -> None:
+    """Close and forget the running loop's client; the next call opens a new one."""
+    clients = _async_clients.get(asyncio.get_running_loop(), {})
+    client = clients.pop((client_cls, api_key), None)
+    if client is not None:
+        try:
+            await client.close()
+        except Exception:
+            pass
+
+
+def _anthropic_client(api_key: Optional[str]) -> "AsyncAnthropic":
+    return _loop_client(AsyncAnthropic, api_key)
+
+
+def _openai_client(api_key: Optional[str]) -> "AsyncOpenAI":
+    return _loop_client(AsyncOpenAI, api_key)
+
+
 class BaseLLMProvider(ABC):
     """Base class for LLM providers."""
 
@@ -94,8 +335,16 @@ class ClaudeProvider(BaseLLMProvider):
     ):
         """Initialize Claude provider."""
         super().__init__(model, temperature, max_tokens)
-        self.client = AsyncAnthropic(api_key=self.settings.anthropic_api_key)
-        self.sync_client = Anthropic(api_key=self.settings.anthropic_api_key)
+
+    @property
+    def client(self) -> "AsyncAnthropic":
+        """Shared async client for the running event loop."""
+        return _anthropic_client(self.settings.anthropic_api_key)
+
+    @cached_property
+    def sync_client(self) -> "Anthropic":
+        """Blocking client, created only if something asks for it."""
+        return Anthropic(api_key=self.settings.anthropic_api_key)
 
     async def generate(
         self,
@@ -103,9 +352,15 @@ class ClaudeProvider(BaseLLMProvider):
         system_prompt: Optional[str] = None,
         **kwargs: Any,
     ) -> str:
-        """Generate completion from Claude."""
+        """
+        Generate completion from Claude.
+
+        With a ``response_schema`` (JSON schema) the reply is forced through a
+        tool call and returned as JSON text matching the schema.
+        """
         try:
             messages = [{"role": "user", "content": prompt}]
+            tools, key = self._forced_tool(kwargs.get("response_schema"))
 
             response = await self.client.messages.create(
                 model=kwargs.get("model", self.model),
@@ -113,23 +368,51 @@ class ClaudeProvider(BaseLLMProvider):
                 temperature=kwargs.get("temperature", self.temperature),
                 system=system_prompt or "",
                 messages=messages,
+                **tools,
             )
 
+            for block in response.content:
+                if block.type == "tool_use":
+                    return json.dumps(block.input[key] if key else block.input)
+
             return response.content[0].text
 
         except Exception as e:
             logger.error(f"Claude generation error: {e}")
             raise
 
+    @staticmethod
+    def _forced_tool(schema: Optional[Dict[str, Any]]) -> "tuple[Dict[str, Any], Optional[str]]":
+        """Request kwargs forcing a reply shaped by ``schema``, plus the key to unwrap."""
+        if not schema:
+            return {}, None
+        envelope, key = _schema_envelope(schema)
+        return {
+            "tools": [{
+                "name": "respond",
+                "description": "Return the response in the required structure.",
+                "input_schema": envelope,
+            }],
+            "tool_choice": {"type": "tool", "name": "respond"},
+        }, key
+
     async def generate_stream(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
-        """Generate streaming completion from Claude."""
+        """
+        Generate streaming completion from Claude.
+
+        An object ``response_schema`` streams the forced tool call's JSON;
+        other schemas cannot be unwrapped mid-stream and are ignored.
+        """
         try:
             messages = [{"role": "user", "content": prompt}]
+            tools, key = self._forced_tool(kwargs.get("response_schema"))
+            if key:
+                tools = {}
 
             async with self.client.messages.stream(
                 model=kwargs.get("model", self.model),
@@ -137,9 +420,15 @@ class ClaudeProvider(BaseLLMProvider):
                 temperature=kwargs.get("temperature", self.temperature),
                 system=system_prompt or "",
                 messages=messages,
+                **tools,
             ) as stream:
-                async for text in stream.text_stream:
-                    yield text
+                if not tools:
+                    async for text in stream.text_stream:
+                        yield text
+                    return
+                async for event in stream:
+                    if event.type == "content_block_delta" and event.delta.type == "input_json_delta":
+                        yield event.delta.partial_json
 
         except Exception as e:
             logger.error(f"Claude streaming error: {e}")
@@ -168,12 +457,8 @@ class ClaudeProvider(BaseLLMProvider):
             raise
 
     async def aclose(self) -> None:
-        """Attempt to close any underlying async client resources."""
-        try:
-            if hasattr(self, "client") and hasattr(self.client, "aclose"):
-                await self.client.aclose()
-        except Exception:
-            pass
+        """Close the running loop's shared client."""
+        await _close_loop_client(AsyncAnthropic, self.settings.anthropic_api_key)
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -189,8 +474,16 @@ class OpenAIProvider(BaseLLMProvider):
         super().__init__(model, temperature, max_tokens)
         if not self.settings.openai_api_key:
             raise ValueError("OpenAI API key not configured")
-        self.client = AsyncOpenAI(api_key=self.settings.openai_api_key)
-        self.sync_client = OpenAI(api_key=self.settings.openai_api_key)
+
+    @property
+    def client(self) -> "AsyncOpenAI":
+        """Shared async client for the running event loop."""
+        return _openai_client(self.settings.openai_api_key)
+
+    @cached_property
+    def sync_client(self) -> "OpenAI":
+        """Blocking client, created only if something asks for it."""
+        return OpenAI(api_key=self.settings.openai_api_key)
 
     async def generate(
         self,
@@ -205,31 +498,57 @@ class OpenAIProvider(BaseLLMProvider):
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
+            response_format, key = self._response_format(kwargs.get("response_schema"))
+
             response = await self.client.chat.completions.create(
                 model=kwargs.get("model", self.model),
                 max_tokens=kwargs.get("max_tokens", self.max_tokens),
                 temperature=kwargs.get("temperature", self.temperature),
                 messages=messages,
+                **response_format,
             )
 
-            return response.choices[0].message.content or ""
+            content = response.choices[0].message.content or ""
+            if key:
+                return json.dumps(json.loads(content)[key])
+            return content
 
         except Exception as e:
             logger.error(f"OpenAI generation error: {e}")
             raise
 
+    @staticmethod
+    def _response_format(schema: Optional[Dict[str, Any]]) -> "tuple[Dict[str, Any], Optional[str]]":
+        """Structured-output kwargs for ``schema``, plus the key to unwrap."""
+        if not schema:
+            return {}, None
+        envelope, key = _schema_envelope(schema)
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": envelope},
+            },
+        }, key
+
     async def generate_stream(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
-        """Generate streaming completion from OpenAI."""
+        """
+        Generate streaming completion from OpenAI.
+
+        Only object ``response_schema`` values are applied, as in Claude.
+        """
         try:
             messages = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
+            response_format, key = self._response_format(kwargs.get("response_schema"))
+            if key:
+                response_format = {}
 
             stream = await self.client.chat.completions.create(
                 model=kwargs.get("model", self.model),
@@ -237,6 +556,7 @@ class OpenAIProvider(BaseLLMProvider):
                 temperature=kwargs.get("temperature", self.temperature),
                 messages=messages,
                 stream=True,
+                **response_format,
             )
 
             async for chunk in stream:
@@ -272,12 +592,8 @@ class OpenAIProvider(BaseLLMProvider):
             raise
 
     async def aclose(self) -> None:
-        """Attempt to close any underlying async client resources."""
-        try:
-            if hasattr(self, "client") and hasattr(self.client, "aclose"):
-                await self.client.aclose()
-        except Exception:
-            pass
+        """Close the running loop's shared client."""
+        await _close_loop_client(AsyncOpenAI, self.settings.openai_api_key)
 
 
 class MockProvider(BaseLLMProvider):
@@ -381,9 +697,35 @@ class MockProvider(BaseLLMProvider):
         return
 
 
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying, honouring ``Retry-After`` on 429s."""
+    if getattr(error, "status_code", None) == 429:
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        try:
+            return max(float(headers.get("retry-after")), 2**attempt)
+        except (TypeError, ValueError):
+            return 2 ** (attempt + 1)
+    return 2**attempt
+
+
 class LLMProvider:
     """Main LLM provider that routes to specific implementations."""
 
+    # Requests in flight per event loop, shared by every provider instance so
+    # agents fanning out together stay under the provider's rate limits.
+    _slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    def _llm_sem(cls) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = cls._slots.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(max(1, get_settings().llm_max_concurrency))
+            cls._slots[loop] = sem
+        return sem
+
     def __init__(
         self,
         provider: str = "anthropic",
@@ -463,16 +805,54 @@ class LLMProvider:
 
         for attempt in range(max_retries):
             try:
-                return await self.generate(prompt, system_prompt, **kwargs)
+                async with self._llm_sem():
+                    return await self.generate(prompt, system_prompt, **kwargs)
             except Exception as e:
                 last_error = e
                 logger.warning(f"LLM generation attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2**attempt)  # Exponential backoff
+                    await asyncio.sleep(_retry_delay(e, attempt))  # Exponential backoff
 
         logger.error(f"LLM generation failed after {max_retries} attempts")
         raise last_error
 
+    async def generate_stream_with_retry(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        max_retries: int = 3,
+        on_chunk: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Stream a completion, passing each chunk to ``on_chunk``, and return the full text.
+
+        Failures before the first chunk are retried like `generate_with_retry`.
+        Once chunks have been handed to ``on_chunk`` a retry would repeat
+        them, so later failures are raised.
+        """
+        last_error = None
+
+        for attempt in range(max_retries):
+            chunks: List[str] = []
+            try:
+                async with self._llm_sem():
+                    async for chunk in self.generate_stream(prompt, system_prompt, **kwargs):
+                        chunks.append(chunk)
+                        if on_chunk is not None:
+                            on_chunk(chunk)
+                return "".join(chunks)
+            except Exception as e:
+                if chunks:
+                    raise
+                last_error = e
+                logger.warning(f"LLM streaming attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(_retry_delay(e, attempt))  # Exponential backoff
+
+        logger.error(f"LLM streaming failed after {max_retries} attempts")
+        raise last_error
+
     async def aclose(self) -> None:
         """Close underlying provider resources if supported."""
         try:
@@ -100,22 +100,31 @@ class LoggerShim:
                 except Exception:
                     pass
 
+    @staticmethod
+    def _render(message: Any, args: tuple) -> str:
+        """Render a message the way loguru does: ``{}`` placeholders filled from args."""
+        if not args:
+            return str(message)
+        return str(message).format(*args)
+
     # Basic logging API expected by the codebase
-    def debug(self, *args: Any, **kwargs: Any) -> None:
-        self._logger.debug("".join(map(str, args)), **kwargs)
+    def debug(self, message: Any = "", *args: Any, **kwargs: Any) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._render(message, args), **kwargs)
 
-    def info(self, *args: Any, **kwargs: Any) -> None:
-        self._logger.info("".join(map(str, args)), **kwargs)
+    def info(self, message: Any = "", *args: Any, **kwargs: Any) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._render(message, args), **kwargs)
 
-    def warning(self, *args: Any, **kwargs: Any) -> None:
-        self._logger.warning("".join(map(str, args)), **kwargs)
+    def warning(self, message: Any = "", *args: Any, **kwargs: Any) -> None:
+        self._logger.warning(self._render(message, args), **kwargs)
 
-    def error(self, *args: Any, **kwargs: Any) -> None:
-        self._logger.error("".join(map(str, args)), **kwargs)
+    def error(self, message: Any = "", *args: Any, **kwargs: Any) -> None:
+        self._logger.error(self._render(message, args), **kwargs)
 
-    def exception(self, *args: Any, **kwargs: Any) -> None:
+    def exception(self, message: Any = "", *args: Any, **kwargs: Any) -> None:
         # exception should include stack info
-        self._logger.exception("".join(map(str, args)), **kwargs)
+        self._logger.exception(self._render(message, args), **kwargs)
 
 
 # Module-level logger instance used across the project when `loguru` is not available
@@ -3,7 +3,7 @@ arXiv MCP server implementation.
 """
 
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 from urllib.parse import quote
 
 from loguru import logger
@@ -27,7 +27,7 @@ class ArxivMCP(BaseMCPServer):
 
     async def search_papers(
         self,
-        query: str,
+        query: Union[str, List[str]],
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         use_cache: bool = True,
@@ -36,15 +36,19 @@ class ArxivMCP(BaseMCPServer):
         Search for papers on arXiv.
 
         Args:
-            query: Search query (can use arXiv search syntax)
+            query: Search query (can use arXiv search syntax), or a list of
+                queries OR-ed into a single request
             limit: Maximum number of results
-            filters: Filters like categories, sort_by, sort_order
+            filters: Filters like categories, year_from, year_to, sort_by, sort_order
             use_cache: Whether to use cached results
 
         Returns:
             MCPResponse: Search results with paper data
         """
         try:
+            queries = [query] if isinstance(query, str) else list(query)
+            query = " OR ".join(queries)
+
             # Check cache
             cache_key = self._generate_cache_key(query, filters)
             if use_cache:
@@ -53,7 +57,7 @@ class ArxivMCP(BaseMCPServer):
                     return cached
 
             # Build search query
-            search_query = self._build_search_query(query, filters)
+            search_query = self._build_search_query(queries, filters)
 
             # Prepare request parameters
             params = {
@@ -106,6 +110,30 @@ class ArxivMCP(BaseMCPServer):
                 source=self.server_name,
             )
 
+    async def search_papers_batch(
+        self,
+        queries: List[str],
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> MCPResponse:
+        """
+        Search for papers matching any of several queries in one request.
+
+        arXiv rate-limits clients to one request every few seconds, so the
+        queries are OR-ed together rather than sent separately.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+            filters: Filters like categories, sort_by, sort_order
+            use_cache: Whether to use cached results
+
+        Returns:
+            MCPResponse: Search results with paper data
+        """
+        return await self.search_papers(queries, limit * len(queries), filters, use_cache)
+
     async def get_paper_details(
         self,
         paper_id: str,
@@ -200,19 +228,22 @@ class ArxivMCP(BaseMCPServer):
         except Exception as e:
             raise MCPError(f"arXiv request failed: {str(e)}")
 
-    def _build_search_query(self, query: str, filters: Optional[Dict[str, Any]]) -> str:
+    def _build_search_query(self, queries: List[str], filters: Optional[Dict[str, Any]]) -> str:
         """
         Build arXiv search query with filters.
 
         Args:
-            query: Base search query
+            queries: Base search queries, any of which may match
             filters: Additional filters
 
         Returns:
             str: Formatted search query
         """
         # Start with base query
-        search_parts = [f"all:{query}"]
+        if len(queries) == 1:
+            search_parts = [f"all:{queries[0]}"]
+        else:
+            search_parts = ["(" + " OR ".join(f"(all:{query})" for query in queries) + ")"]
 
         if filters:
             # Add category filter
@@ -232,6 +263,12 @@ class ArxivMCP(BaseMCPServer):
             if "title" in filters:
                 search_parts.append(f"ti:{filters['title']}")
 
+            # Add submission date range so out-of-range papers aren't returned
+            if filters.get("year_from") or filters.get("year_to"):
+                year_from = filters.get("year_from") or 1991  # arXiv's first year
+                year_to = filters.get("year_to") or 9999
+                search_parts.append(f"submittedDate:[{year_from}01010000 TO {year_to}12312359]")
+
         return " AND ".join(search_parts)
 
     def _parse_arxiv_response(self, xml_text: str) -> List[Dict[str, Any]]:
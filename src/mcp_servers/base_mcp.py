@@ -293,6 +293,52 @@ class BaseMCPServer(ABC):
         """
         pass
 
+    async def search_papers_batch(
+        self,
+        queries: List[str],
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+    ) -> MCPResponse:
+        """
+        Search for papers matching any of several queries.
+
+        Runs one search per query concurrently and merges the results.
+        Servers whose API accepts boolean queries override this to make a
+        single request.
+
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+            filters: Additional filters (year, venue, etc.)
+            use_cache: Whether to use cached results
+
+        Returns:
+            MCPResponse: Combined search results
+        """
+        responses = await asyncio.gather(
+            *(self.search_papers(query, limit, filters, use_cache) for query in queries),
+            return_exceptions=True,
+        )
+
+        results = []
+        errors = []
+        for query, response in zip(queries, responses):
+            if isinstance(response, Exception):
+                errors.append({"query": query, "error": str(response)})
+            elif not response.success:
+                errors.append({"query": query, "error": response.error})
+            else:
+                results.extend(response.data)
+
+        return MCPResponse(
+            success=len(results) > 0 or not errors,
+            data=results,
+            metadata={"total": len(results), "errors": len(errors), "error_details": errors},
+            error="; ".join(str(error["error"]) for error in errors) or None,
+            source=self.server_name,
+        )
+
     @abstractmethod
     async def get_paper_details(
         self,
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+
+class FakeLLM:
+    """
+    Stands in for an LLM provider, answering every prompt with ``reply``.
+
+    ``reply`` may be a callable taking the prompt, which can raise to
+    simulate a provider error. Calls take ``delay`` seconds, so overlapping
+    calls can be counted. Streaming emits the reply in small fragments that
+    split JSON tokens and escapes, the way partial JSON arrives from a
+    provider's structured-output stream.
+    """
+
+    def __init__(self, reply="{}", delay=0.01, chunk_size=7):
+        self.reply = reply
+        self.delay = delay
+        self.chunk_size = chunk_size
+        self.prompts = []
+        self.schemas = []
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_with_retry(self, prompt, system_prompt=None, max_retries=3, **kwargs):
+        self.prompts.append(prompt)
+        self.schemas.append(kwargs.get("response_schema"))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.reply(prompt) if callable(self.reply) else self.reply
+        finally:
+            self.active -= 1
+
+    async def generate_stream_with_retry(self, prompt, system_prompt=None, max_retries=3, on_chunk=None, **kwargs):
+        reply = await self.generate_with_retry(prompt, system_prompt, max_retries, **kwargs)
+        if on_chunk is not None:
+            for start in range(0, len(reply), self.chunk_size):
+                on_chunk(reply[start:start + self.chunk_size])
+        return reply
+
+
+@pytest.fixture
+def fake_llm():
+    """The FakeLLM class, called with a reply to build a fake provider."""
+    return FakeLLM
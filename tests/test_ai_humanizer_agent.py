@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import pytest
+
+from src.agents.ai_humanizer_agent import AIHumanizerAgent, HumanizationIntensity
+from src.models.agent_messages import AgentRequest
+
+
+SAMPLE = (
+    "It is evident that this study utilizes a comprehensive framework (Smith, 2020). "
+    "Furthermore, it is important to note that the results clearly shows robust effects [1]. "
+    "This is good. That is fine. The methodology is crucial and the findings will be significant."
+)
+
+
+def _humanize(seed):
+    agent = AIHumanizerAgent(intensity=HumanizationIntensity.STRONG, seed=seed)
+    return agent._humanize_content_sync(SAMPLE, "Introduction")
+
+
+def test_seeded_agents_are_reproducible():
+    content, metrics = _humanize(seed=7)
+    again, again_metrics = _humanize(seed=7)
+
+    assert content == again
+    assert metrics == again_metrics
+
+
+def _execute(seed, sections):
+    agent = AIHumanizerAgent(intensity=HumanizationIntensity.STRONG, seed=seed)
+    request = AgentRequest(
+        task_id="humanize-test",
+        agent_name="ai_humanizer_agent",
+        action="process",
+        input_data={"sections": sections, "topic": "Edge AI"},
+    )
+    return asyncio.run(agent.execute(request)).output_data["sections"]
+
+
+def test_seeded_documents_are_reproducible():
+    sections = [{"title": f"Section {i}", "content": f"Part {i}. {SAMPLE * 300}"} for i in range(8)]
+
+    assert _execute(42, sections) == _execute(42, sections)
+
+
+def test_repeated_content_is_served_from_cache():
+    agent = AIHumanizerAgent(seed=3)
+
+    first = agent._humanize_content_sync(SAMPLE, "Introduction")
+    second = agent._humanize_content_sync(SAMPLE, "Discussion")
+
+    assert second is first
+    assert len(agent._cache) == 1
+
+
+def test_citations_survive_humanization():
+    content, _ = _humanize(seed=7)
+
+    assert "(Smith, 2020)" in content
+    assert "[1]" in content
+
+
+@pytest.mark.parametrize("title", ["References", "Appendix B", "Abstract"])
+def test_skipped_sections(title):
+    assert AIHumanizerAgent(seed=0)._should_skip_section(title)
+
+
+def test_patterns_stay_fast_on_pathological_input():
+    agent = AIHumanizerAgent(seed=0)
+
+    started = time.perf_counter()
+    agent._transform_content("It is " * 20000 + "[1 " * 20000 + "a" * 150 + ", and x" * 20000)
+
+    assert time.perf_counter() - started < 5
+
+
+def test_humanize_texts_matches_humanize_text():
+    from src.agents.ai_humanizer_agent import humanize_text, humanize_texts
+
+    single = asyncio.run(humanize_text(SAMPLE, seed=5))
+
+    assert asyncio.run(humanize_texts([SAMPLE], seed=5)) == [single]
+    assert asyncio.run(humanize_texts([SAMPLE, "Plain text."]))[1] == "Plain text."
+    assert asyncio.run(humanize_texts([])) == []
+
+
+def test_long_text_score_uses_a_stable_sample():
+    agent = AIHumanizerAgent(seed=0)
+    text = " ".join(f"word{i}" for i in range(20000))
+
+    sample = agent._sample_for_score(text)
+
+    assert sample == AIHumanizerAgent(seed=1)._sample_for_score(text)
+    assert len(sample) < len(text) / 2
+    assert set(sample.split()) <= set(text.split())
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+
+from src.agents.content_generation.introduction_agent import IntroductionAgent
+from src.core.state_manager import InMemoryStateManager
+from src.models.agent_messages import AgentRequest, TaskStatus
+
+
+def _agent(llm, **kwargs):
+    # A fresh state manager per test keeps cached introductions from leaking
+    return IntroductionAgent(llm_provider=llm, state_manager=InMemoryStateManager(), **kwargs)
+
+
+def _request(context=None, **input_data):
+    return AgentRequest(
+        task_id="intro-test",
+        agent_name="introduction_agent",
+        action="process",
+        input_data={"topic": "Edge AI", "key_points": ["latency"], **input_data},
+        context=context or {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_independent_sections_are_generated_concurrently(fake_llm):
+    llm = fake_llm("Generated text.")
+    agent = _agent(llm, multi_call_mode=True)
+
+    response = await agent.execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert len(llm.prompts) == 5  # four parts plus one synthesis repair
+    assert llm.max_active == 3
+
+
+COMBINED = json.dumps({
+    "problem_statement": "A problem.",
+    "objectives": ["To investigate latency"],
+    "research_questions": ["How fast is it?"],
+    "main_content": "Opening paragraph.",
+    "subsections": [{"title": "Background and Context", "content": "..."}],
+})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reply", [
+    COMBINED,
+    f"```json\n{COMBINED}\n```",
+    f"Here is the introduction:\n{COMBINED}\nLet me know if you need changes.",
+])
+async def test_combined_call_fills_every_part(reply, fake_llm):
+    llm = fake_llm(reply)
+    agent = _agent(llm)
+
+    response = await agent.execute(_request())
+
+    assert len(llm.prompts) == 1
+    assert response.output_data["problem_statement"] == "A problem."
+    assert response.output_data["research_questions"] == ["How fast is it?"]
+
+
+@pytest.mark.asyncio
+async def test_unusable_combined_response_falls_back_to_separate_calls(fake_llm):
+    llm = fake_llm("Generated text.")
+    agent = _agent(llm)
+
+    response = await agent.execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert len(llm.prompts) == 6
+
+
+@pytest.mark.asyncio
+async def test_separate_calls_share_one_prompt_prefix(fake_llm):
+    llm = fake_llm("Generated text.")
+    agent = _agent(llm, multi_call_mode=True)
+    gaps = [{"description": "No field data", "significance": "high"}]
+
+    await agent.execute(_request(dependency_analyze_literature={"research_gaps": gaps}))
+
+    preamble = llm.prompts[0][:llm.prompts[0].index("Task:")]
+    assert "No field data" in preamble
+    assert all(prompt.startswith(preamble) for prompt in llm.prompts)
+
+
+@pytest.mark.asyncio
+async def test_unparseable_synthesis_is_repaired_once(fake_llm):
+    repaired = json.dumps({"main_content": "Repaired opening.", "subsections": []})
+    llm = fake_llm(lambda prompt: repaired if "Re-emit" in prompt else "Prose only.")
+    agent = _agent(llm, multi_call_mode=True)
+
+    response = await agent.execute(_request())
+
+    assert response.output_data["content"] == "Repaired opening."
+    assert "Prose only." in llm.prompts[-1]
+
+
+@pytest.mark.asyncio
+async def test_introduction_text_is_streamed_to_on_token(fake_llm):
+    chunks = []
+    agent = _agent(fake_llm(COMBINED))
+
+    await agent.execute(_request(context={"on_token": chunks.append}))
+
+    assert "".join(chunks) == "Opening paragraph.\n\nBackground and Context\n\n..."
+
+
+@pytest.mark.asyncio
+async def test_discarded_combined_text_is_restarted(fake_llm):
+    def reply(prompt):
+        if "Write the introduction section" in prompt:
+            return json.dumps({"main_content": "Draft.", "subsections": []})  # no problem statement
+        if "Write a comprehensive introduction" in prompt:
+            return json.dumps({"main_content": "Final.", "subsections": []})
+        return "Generated text."
+
+    attempts = [[]]
+    agent = _agent(fake_llm(reply))
+
+    await agent.execute(_request(context={
+        "on_token": lambda text: attempts[-1].append(text),
+        "on_restart": lambda: attempts.append([]),
+    }))
+
+    assert ["".join(attempt) for attempt in attempts] == ["Draft.", "Final."]
+
+
+@pytest.mark.asyncio
+async def test_cached_introduction_text_is_sent_in_one_call(fake_llm):
+    agent = _agent(fake_llm(COMBINED))
+    await agent.execute(_request())
+    chunks = []
+
+    await agent.execute(_request(context={"on_token": chunks.append}))
+
+    assert chunks == ["Opening paragraph.\n\nBackground and Context\n\n..."]
+
+
+@pytest.mark.asyncio
+async def test_identical_request_is_served_from_cache(fake_llm):
+    llm = fake_llm(COMBINED)
+    agent = _agent(llm)
+
+    first = await agent.execute(_request())
+    second = await agent.execute(_request())
+
+    assert len(llm.prompts) == 1
+    assert second.output_data == first.output_data
+    assert second.metadata["cache_hit"]
+
+
+@pytest.mark.asyncio
+async def test_introduction_with_fallback_parts_is_not_cached(fake_llm):
+    llm = fake_llm("Generated text.")
+    agent = _agent(llm, multi_call_mode=True)
+
+    await agent.execute(_request())
+    second = await agent.execute(_request())
+
+    assert len(llm.prompts) == 10
+    assert not second.metadata.get("cache_hit")
+    assert second.output_data["content"].startswith("This research proposal addresses Edge AI")
+
+
+@pytest.mark.asyncio
+async def test_invalid_input_fails_without_llm_calls(fake_llm):
+    llm = fake_llm("Generated text.")
+
+    response = await _agent(llm).execute(_request(topic=""))
+
+    assert response.status == TaskStatus.FAILED
+    assert llm.prompts == []
@@ -0,0 +1,190 @@
+import asyncio
+import json
+
+import pytest
+
+from src.agents.content_generation.literature_review_agent import LiteratureReviewAgent
+from src.core.state_manager import InMemoryStateManager
+from src.mcp_servers.base_mcp import MCPResponse
+from src.models.agent_messages import AgentRequest, TaskStatus
+from src.models.proposal_schema import LiteraturePaper
+
+
+class FakeSource:
+    """Stands in for an MCP server, returning the same papers for every query."""
+
+    def __init__(self, papers, delay=0):
+        self.papers = papers
+        self.delay = delay
+        self.queries = []
+
+    async def search_papers(self, query, limit=100, filters=None, use_cache=True):
+        self.queries.append(query)
+        await asyncio.sleep(self.delay)
+        return MCPResponse(success=True, data=self.papers, source="fake")
+
+    async def search_papers_batch(self, queries, limit=100, filters=None, use_cache=True):
+        return await self.search_papers(" OR ".join(queries), limit, filters, use_cache)
+
+    async def disconnect(self):
+        pass
+
+
+def _paper(paper_id, title, abstract="", year=2024, citation_count=0):
+    return LiteraturePaper(
+        paper_id=paper_id,
+        title=title,
+        authors=["A. Author"],
+        year=year,
+        abstract=abstract,
+        citation_count=citation_count,
+        source="test",
+    )
+
+
+def _agent(*sources, llm):
+    agent = LiteratureReviewAgent(llm_provider=llm, state_manager=InMemoryStateManager())
+    sources = sources or (FakeSource([]),)
+    for name, source in zip(
+        ("semantic_scholar", "arxiv", "frontiers", "papers_with_code"),
+        sources + sources[-1:] * 4,
+    ):
+        setattr(agent, name, source)
+    return agent
+
+
+def _record(title, doi=None):
+    return {"paper_id": title, "title": title, "authors": [], "year": 2024, "doi": doi, "source": "fake"}
+
+
+@pytest.mark.asyncio
+async def test_ranking_prefers_relevant_papers(fake_llm):
+    papers = [
+        _paper("old", "Edge AI survey", year=2000),
+        _paper("off-topic", "Protein folding", citation_count=50),
+        _paper("match", "Edge AI latency", "Federated learning on edge devices cuts latency"),
+    ]
+
+    ranked = await _agent(llm=fake_llm())._rank_papers(papers, "Edge AI latency", ["federated learning"])
+
+    assert [paper.paper_id for paper in ranked] == ["match", "old", "off-topic"]
+
+
+@pytest.mark.asyncio
+async def test_search_drops_near_duplicate_titles_and_dois(fake_llm):
+    agent = _agent(FakeSource([
+        _record("Edge AI: A Survey", doi="10.1/ABC"),
+        _record("edge-ai  a survey"),
+        _record("Other title", doi="10.1/abc"),
+        _record("Fresh result"),
+    ]), llm=fake_llm())
+
+    papers = await agent._search_papers("Edge AI", [], {})
+
+    assert [paper.title for paper in papers] == ["Edge AI: A Survey", "Fresh result"]
+
+
+@pytest.mark.asyncio
+async def test_search_stops_once_enough_candidates_arrive(fake_llm):
+    fast = FakeSource([_record(f"Paper {i}") for i in range(3)])
+    agent = _agent(fast, FakeSource([_record("Late")], delay=30), llm=fake_llm())
+    agent.max_papers = 1
+
+    papers = await asyncio.wait_for(agent._search_papers("Edge AI", [], {}), timeout=5)
+
+    assert len(papers) == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_analysis_is_served_from_cache(fake_llm):
+    llm = fake_llm('{"themes": ["Edge inference"]}')
+    agent = _agent(llm=llm)
+    papers = [_paper("p1", "Edge AI latency", "Abstract.")]
+
+    first = await agent._analyze_papers(papers, "Edge AI", ["latency"])
+    second = await agent._analyze_papers(papers, "Edge AI", ["latency"])
+
+    assert first == second == {"themes": ["Edge inference"]}
+    assert len(llm.prompts) == 1
+
+
+COMBINED = json.dumps({
+    "analysis": {"themes": ["Edge inference"], "gaps": ["Few field studies"]},
+    "gaps": [{"title": "Field data", "description": "Few field studies", "significance": "high"}],
+    "review": {"main_content": "Research on edge AI has grown.", "subsections": []},
+})
+
+
+def _request():
+    return AgentRequest(
+        task_id="lit-test",
+        agent_name="literature_review_agent",
+        action="process",
+        input_data={"topic": "Edge AI", "key_points": ["latency"]},
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("reply, calls", [(COMBINED, 1), ("Not JSON.", 4)])
+async def test_review_uses_one_combined_call_when_possible(reply, calls, fake_llm):
+    llm = fake_llm(reply)
+    agent = _agent(FakeSource([_record(f"Edge AI latency {i}") for i in range(6)]), llm=llm)
+
+    response = await agent.execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert len(llm.prompts) == calls
+    if calls == 1:
+        assert response.output_data["content"] == "Research on edge AI has grown."
+        assert response.output_data["research_gaps"][0]["description"] == "Few field studies"
+
+
+@pytest.mark.asyncio
+async def test_too_few_papers_skip_the_llm(fake_llm):
+    llm = fake_llm(COMBINED)
+    agent = _agent(FakeSource([_record("Edge AI latency")]), llm=llm)
+
+    response = await agent.execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert response.output_data["metadata"]["analysis_skipped"]
+    assert response.output_data["research_gaps"] == []
+    assert llm.prompts == []
+
+
+@pytest.mark.asyncio
+async def test_no_papers_fails_without_llm_calls(fake_llm):
+    llm = fake_llm(COMBINED)
+
+    response = await _agent(llm=llm).execute(_request())
+
+    assert response.status == TaskStatus.FAILED
+    assert response.error == "No papers retrieved"
+    assert llm.prompts == []
+
+
+@pytest.mark.asyncio
+async def test_failed_combined_call_falls_back_to_separate_calls(fake_llm):
+    def reply(prompt):
+        if "in one response" in prompt:
+            raise RuntimeError("max_tokens: 10000 > 8192")
+        return "{}"
+
+    llm = fake_llm(reply)
+    agent = _agent(FakeSource([_record(f"Edge AI latency {i}") for i in range(6)]), llm=llm)
+
+    response = await agent.execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert len(llm.prompts) == 4
+
+
+@pytest.mark.asyncio
+async def test_malformed_responses_are_not_cached(fake_llm):
+    llm = fake_llm('{"analysis": {"themes": ["Edge inference"]}, "review": {"main_con')
+    agent = _agent(FakeSource([_record(f"Edge AI latency {i}") for i in range(6)]), llm=llm)
+
+    await agent.execute(_request())
+    await agent.execute(_request())
+
+    assert len(llm.prompts) == 8  # the combined call and three separate calls, both times
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from src.core import llm_provider
+from src.core.config import get_settings
+from src.core.llm_provider import JSONTextStream, LLMProvider, _retry_delay, parse_json_response
+
+
+class _FakeClient:
+    def __init__(self, api_key):
+        self.api_key = api_key
+
+
+class _SlowProvider:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return prompt
+
+
+def test_concurrent_calls_are_capped(monkeypatch):
+    monkeypatch.setattr(get_settings(), "llm_max_concurrency", 2)
+    provider = LLMProvider(provider="anthropic")
+    provider.provider = slow = _SlowProvider()
+
+    async def fan_out():
+        return await asyncio.gather(*(provider.generate_with_retry(str(i)) for i in range(6)))
+
+    assert asyncio.run(fan_out()) == [str(i) for i in range(6)]
+    assert slow.max_active == 2
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+    def __init__(self, headers):
+        self.response = type("Response", (), {"headers": headers})()
+
+
+def test_rate_limits_honour_retry_after():
+    assert _retry_delay(_RateLimited({"retry-after": "7"}), 0) == 7
+    assert _retry_delay(_RateLimited({}), 1) == 4
+    assert _retry_delay(ValueError(), 1) == 2
+
+
+def test_claude_schema_replies_come_from_a_forced_tool_call(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.core.llm_provider import ClaudeProvider
+
+    monkeypatch.setattr(get_settings(), "anthropic_api_key", "test-key")
+    sent = {}
+
+    async def create(**kwargs):
+        sent.update(kwargs)
+        block = SimpleNamespace(type="tool_use", input={"value": ["To test"]})
+        return SimpleNamespace(content=[block])
+
+    client = SimpleNamespace(messages=SimpleNamespace(create=create))
+    monkeypatch.setattr(llm_provider, "_anthropic_client", lambda api_key: client)
+    provider = ClaudeProvider()
+    schema = {"type": "array", "items": {"type": "string"}}
+
+    assert asyncio.run(provider.generate("prompt", response_schema=schema)) == '["To test"]'
+    assert sent["tool_choice"] == {"type": "tool", "name": "respond"}
+    assert sent["tools"][0]["input_schema"]["properties"]["value"] == schema
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1, 2]}',
+    'Here you go:\n```json\n{"a": [1, 2]}\n```',
+    '{"a": [1, 2,],}',
+])
+def test_parse_json_response_tolerates_common_model_output(text):
+    assert parse_json_response(text) == {"a": [1, 2]}
+
+
+def test_parse_json_response_rejects_prose():
+    with pytest.raises(ValueError):
+        parse_json_response("No JSON here.")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_json_text_stream_emits_only_selected_string_values(chunk_size):
+    document = (
+        '{"main_content": "Say \\"hi\\"\\n\\u00e9 {x}", "count": 2,'
+        ' "subsections": [{"title": "\\ud83d\\ude00", "note": "skip", "content": "a\\\\b"}]}'
+    )
+    chunks = []
+    stream = JSONTextStream(chunks.append, ("main_content", "title", "content"))
+
+    for start in range(0, len(document), chunk_size):
+        stream.feed(document[start:start + chunk_size])
+
+    assert "".join(chunks) == 'Say "hi"\n\u00e9 {x}\n\n\U0001F600\n\na\\b' == stream.text
+
+
+def test_json_text_stream_finish_restarts_on_different_text():
+    chunks, restarts = [], []
+    stream = JSONTextStream(chunks.append, ("content",), lambda: restarts.append(len(chunks)))
+    stream.feed('{"content": "Draft')
+
+    stream.finish("Final")
+
+    assert restarts == [1]
+    assert chunks[1:] == ["Final"] and stream.text == "Final"
+
+
+def test_async_clients_are_shared_per_event_loop():
+    async def clients():
+        return llm_provider._loop_client(_FakeClient, "key"), llm_provider._loop_client(_FakeClient, "key")
+
+    first, again = asyncio.run(clients())
+    later, _ = asyncio.run(clients())
+
+    assert first is again
+    assert later is not first
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from src.agents.content_generation.research_methodology_agent import ResearchMethodologyAgent
+from src.core.state_manager import InMemoryStateManager
+from src.models.agent_messages import AgentRequest, TaskStatus
+
+
+def _agent(llm):
+    return ResearchMethodologyAgent(llm_provider=llm, state_manager=InMemoryStateManager())
+
+
+def _request(topic="Edge AI", context=None):
+    return AgentRequest(
+        task_id="method-test",
+        agent_name="research_methodology_agent",
+        action="process",
+        input_data={
+            "topic": topic,
+            "dependency_generate_introduction": {
+                "objectives": ["To measure latency"],
+                "research_questions": ["How fast is it?"],
+            },
+        },
+        context=context or {},
+    )
+
+
+@pytest.mark.asyncio
+async def test_design_parts_are_generated_concurrently(fake_llm):
+    llm = fake_llm("Not JSON.")
+
+    response = await _agent(llm).execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert len(llm.prompts) == 6
+    assert llm.max_active == 4  # the experimental setup waits for the research design
+    assert all(llm.schemas)
+
+
+@pytest.mark.asyncio
+async def test_failed_design_part_falls_back_to_its_default(fake_llm):
+    def reply(prompt):
+        if "data collection methods" in prompt:
+            raise RuntimeError("provider down")
+        return "Not JSON."
+
+    response = await _agent(fake_llm(reply)).execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert response.output_data["procedures"]["data_collection"]["sampling"]["method"] == "Random sampling"
+
+
+@pytest.mark.asyncio
+async def test_fenced_json_responses_are_parsed(fake_llm):
+    design = '```json\n{"paradigm": "Pragmatist", "strategy": "Case study"}\n```'
+    llm = fake_llm(lambda prompt: design if "research approach" in prompt else "Not JSON.")
+
+    response = await _agent(llm).execute(_request())
+
+    assert response.output_data["design"]["paradigm"] == "Pragmatist"
+
+
+@pytest.mark.asyncio
+async def test_repeated_request_is_served_from_cache(fake_llm):
+    def reply(prompt):
+        if "ethical considerations for research" in prompt:
+            return '["Informed consent"]'
+        return '{"main_content": "Overview.", "subsections": []}'
+
+    llm = fake_llm(reply)
+    agent = _agent(llm)
+
+    await agent.execute(_request())
+    await agent.execute(_request())
+
+    assert len(llm.prompts) == 6
+
+
+@pytest.mark.asyncio
+async def test_unusable_responses_are_not_cached(fake_llm):
+    llm = fake_llm("Not JSON.")
+    agent = _agent(llm)
+
+    await agent.execute(_request())
+    await agent.execute(_request())
+
+    assert len(llm.prompts) == 12
+
+
+@pytest.mark.asyncio
+async def test_methodology_text_is_streamed_to_on_token(fake_llm):
+    methodology = '{"main_content": "Overview.", "subsections": [{"title": "Research Design", "content": "..."}]}'
+    llm = fake_llm(lambda prompt: methodology if "methodology section" in prompt else "Not JSON.")
+    chunks = []
+
+    response = await _agent(llm).execute(_request(context={"on_token": chunks.append}))
+
+    assert "".join(chunks) == "Overview.\n\nResearch Design\n\n..."
+    assert response.output_data["content"] == "Overview."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("methodology", [
+    '["Overview."]',
+    '{"subsections": []}',
+    '{"main_content": "Overview.", "subsections": "None"}',
+])
+async def test_wrong_shaped_methodology_falls_back_to_the_default(methodology, fake_llm):
+    llm = fake_llm(lambda prompt: methodology if "methodology section" in prompt else "Not JSON.")
+
+    response = await _agent(llm).execute(_request())
+
+    assert response.status == TaskStatus.COMPLETED
+    assert response.output_data["content"] == "This section outlines the methodology for investigating Edge AI."
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy, has_setup", [("Survey", False), ("Quasi-experimental", True)])
+async def test_experimental_setup_only_for_experimental_designs(strategy, has_setup, fake_llm):
+    design = f'{{"paradigm": "Positivist", "strategy": "{strategy}"}}'
+    setup = '{"conditions": ["Control"]}'
+
+    def reply(prompt):
+        if "research approach" in prompt:
+            return design
+        return setup if "experimental setup" in prompt else "Not JSON."
+
+    llm = fake_llm(reply)
+
+    response = await _agent(llm).execute(_request())
+
+    assert bool(response.output_data["procedures"]["experimental_setup"]) is has_setup
+    assert any("experimental setup" in prompt for prompt in llm.prompts) is has_setup
+    assert ("Experimental Setup" in llm.prompts[-1]) is has_setup
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_llm_calls(fake_llm):
+    llm = fake_llm("Not JSON.")
+
+    first, second = await asyncio.gather(_agent(llm).execute(_request()), _agent(llm).execute(_request()))
+
+    assert first.output_data == second.output_data
+    assert len(llm.prompts) == 6
+
+
+@pytest.mark.asyncio
+async def test_request_after_cancelling_the_only_waiter_starts_a_new_call(fake_llm):
+    llm = fake_llm('{"paradigm": "Pragmatist"}')
+    agent = _agent(llm)
+
+    first = asyncio.ensure_future(agent.generate_with_cache("Design it."))
+    await asyncio.sleep(0.001)  # the first caller is now waiting on its LLM call
+    first.cancel()
+    await asyncio.sleep(0)  # the first caller gives up; its LLM call is being cancelled
+    response = await agent.generate_with_cache("Design it.")
+
+    assert response == '{"paradigm": "Pragmatist"}'
+    assert len(llm.prompts) == 2